@@ -20,11 +20,17 @@ Centroid calculation functions for astronomical images.
 Author: Yogesh Wadadekar
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Tuple
 import numpy as np
 from numpy.typing import NDArray
 from scipy import ndimage
 
+# Images at least this large are max-filtered in parallel row strips.
+_PARALLEL_FILTER_PIXELS = 4096 * 4096
+
 
 def calculate_centroid(
     data: NDArray[np.floating],
@@ -56,23 +62,33 @@ def calculate_centroid(
         if mask is not None:
             mask = mask[region]
 
-    work_data = data.copy()
-
-    if mask is not None:
-        work_data = np.where(mask, work_data, np.nan)
-
-    if threshold is not None:
-        work_data = np.where(work_data >= threshold, work_data, 0)
-
-    work_data = np.nan_to_num(work_data, nan=0.0)
+    if mask is None and threshold is None:
+        work_data = np.nan_to_num(data, nan=0.0)
+    else:
+        # Fold NaN rejection, mask and threshold into a single boolean array,
+        # updated in place, so only one output array is produced. NaN never
+        # compares >= threshold, so the NaN test is only needed without one.
+        if threshold is not None:
+            keep = data >= threshold
+        else:
+            keep = np.isnan(data)
+            np.logical_not(keep, out=keep)
+        if mask is not None:
+            keep &= mask
+        work_data = np.where(keep, data, 0)
 
-    total = np.sum(work_data)
+    # Only the scalar total is accumulated in float64; the marginals below
+    # stay in the input precision, so float32 images move half the bytes.
+    total = np.sum(work_data, dtype=np.float64)
     if total == 0:
         return (float(data.shape[1] / 2), float(data.shape[0] / 2))
 
-    y_indices, x_indices = np.indices(work_data.shape)
-    x_centroid = np.sum(x_indices * work_data) / total
-    y_centroid = np.sum(y_indices * work_data) / total
+    # First moments are separable: collapse to row/column marginals and
+    # weight those instead of materialising full-size index grids.
+    x_idx = np.arange(work_data.shape[1], dtype=work_data.dtype)
+    y_idx = np.arange(work_data.shape[0], dtype=work_data.dtype)
+    x_centroid = np.dot(work_data.sum(axis=0), x_idx) / total
+    y_centroid = np.dot(work_data.sum(axis=1), y_idx) / total
 
     if region is not None:
         x_centroid += region[1].start if region[1].start else 0
@@ -118,6 +134,7 @@ def calculate_centroid_iterative(
         x_cen, y_cen = initial_guess
 
     half_box = box_size // 2
+    prev_bounds = None
 
     for _ in range(max_iterations):
         x_min = max(0, int(x_cen - half_box))
@@ -125,8 +142,15 @@ def calculate_centroid_iterative(
         y_min = max(0, int(y_cen - half_box))
         y_max = min(data.shape[0], int(y_cen + half_box + 1))
 
+        # The same box gives the same background, threshold and centroid as
+        # the previous pass, so the position cannot move any further.
+        bounds = (x_min, x_max, y_min, y_max)
+        if bounds == prev_bounds:
+            return (x_cen, y_cen)
+        prev_bounds = bounds
+
         region = (slice(y_min, y_max), slice(x_min, x_max))
-        subdata = data[region].copy()
+        subdata = data[region]
 
         background = np.nanmedian(subdata)
         rms = np.nanstd(subdata)
@@ -183,38 +207,39 @@ def calculate_gaussian_centroid(
     y_marginal = np.sum(subdata, axis=1)
     x_marginal = np.sum(subdata, axis=0)
 
-    x_local = _gaussian_1d_centroid(x_marginal)
-    y_local = _gaussian_1d_centroid(y_marginal)
+    x_local, sigma_x = _moments_1d(x_marginal)
+    y_local, sigma_y = _moments_1d(y_marginal)
 
     x_cen = x_min + x_local
     y_cen = y_min + y_local
 
-    sigma_x = _estimate_sigma(x_marginal)
-    sigma_y = _estimate_sigma(y_marginal)
-
     return (x_cen, y_cen, sigma_x, sigma_y)
 
 
-def _gaussian_1d_centroid(profile: NDArray[np.floating]) -> float:
-    """Estimate centroid of a 1D profile using moments."""
-    profile = profile - np.min(profile)
-    total = np.sum(profile)
-    if total == 0:
-        return len(profile) / 2
-    indices = np.arange(len(profile))
-    return float(np.sum(indices * profile) / total)
+@lru_cache(maxsize=64)
+def _get_indices(n: int) -> NDArray[np.int_]:
+    """Return a cached, read-only ``np.arange(n)`` for small profile lengths."""
+    indices = np.arange(n)
+    indices.setflags(write=False)
+    return indices
 
 
-def _estimate_sigma(profile: NDArray[np.floating]) -> float:
-    """Estimate Gaussian sigma from a 1D profile using second moment."""
+def _moments_1d(profile: NDArray[np.floating]) -> Tuple[float, float]:
+    """
+    Estimate the centroid and Gaussian sigma of a 1D profile from its moments.
+
+    The background-subtracted profile is traversed once for the first and
+    second moments. A profile with no signal gives its midpoint and a sigma
+    of 1.0.
+    """
     profile = profile - np.min(profile)
     total = np.sum(profile)
     if total == 0:
-        return 1.0
-    indices = np.arange(len(profile))
-    mean = np.sum(indices * profile) / total
-    variance = np.sum((indices - mean) ** 2 * profile) / total
-    return float(np.sqrt(max(variance, 0)))
+        return (len(profile) / 2, 1.0)
+    indices = _get_indices(len(profile))
+    mean = np.dot(indices, profile) / total
+    variance = np.dot(indices * indices, profile) / total - mean * mean
+    return (float(mean), float(np.sqrt(max(variance, 0))))
 
 
 def peak_local_max(
@@ -247,14 +272,78 @@ def peak_local_max(
     if threshold is None:
         threshold = float(np.median(work_data) + 3 * np.std(work_data))
 
-    max_filtered = ndimage.maximum_filter(work_data, size=min_distance)
+    max_filtered = _maximum_filter(work_data, min_distance)
     local_max = (work_data == max_filtered) & (work_data >= threshold)
 
-    y_coords, x_coords = np.where(local_max)
-    peak_values = work_data[local_max]
+    flat_indices = np.flatnonzero(local_max)
+    peak_values = work_data.ravel()[flat_indices]
 
-    sorted_indices = np.argsort(peak_values)[::-1]
-    y_coords = y_coords[sorted_indices][:num_peaks]
-    x_coords = x_coords[sorted_indices][:num_peaks]
+    # Only the brightest num_peaks need ordering; partition them out first.
+    k = min(num_peaks, peak_values.size)
+    if 0 < k < peak_values.size:
+        top = np.argpartition(peak_values, -k)[-k:]
+    else:
+        top = np.arange(k)
+    sorted_indices = top[np.argsort(peak_values[top])[::-1]]
+    y_coords, x_coords = np.unravel_index(
+        flat_indices[sorted_indices], work_data.shape
+    )
 
     return np.column_stack([y_coords, x_coords])
+
+
+def _maximum_filter(
+    data: NDArray[np.floating],
+    size: int,
+    n_strips: Optional[int] = None,
+) -> NDArray[np.floating]:
+    """
+    Square maximum filter equivalent to ``ndimage.maximum_filter(data, size)``.
+
+    The filter is separable, so it runs as two 1D passes that are O(N)
+    regardless of window size. Large images are split into row strips,
+    each extended by the window half-width, and filtered on a thread pool;
+    scipy releases the GIL while filtering.
+
+    Parameters
+    ----------
+    data : NDArray
+        Input 2D image data.
+    size : int
+        Filter window size.
+    n_strips : int, optional
+        Number of row strips. If None, uses one strip per CPU for images of
+        at least ``_PARALLEL_FILTER_PIXELS`` pixels and a single strip
+        otherwise.
+
+    Returns
+    -------
+    NDArray
+        Maximum-filtered image.
+    """
+
+    def filter_rows(rows: NDArray[np.floating]) -> NDArray[np.floating]:
+        rows = ndimage.maximum_filter1d(rows, size=size, axis=0)
+        return ndimage.maximum_filter1d(rows, size=size, axis=1)
+
+    if n_strips is None:
+        large = data.size >= _PARALLEL_FILTER_PIXELS
+        n_strips = (os.cpu_count() or 1) if large else 1
+    n_strips = max(1, min(n_strips, data.shape[0]))
+    if n_strips == 1:
+        return filter_rows(data)
+
+    # Rows reached by the window above and below each output row.
+    above, below = size // 2, (size - 1) // 2
+    bounds = np.linspace(0, data.shape[0], n_strips + 1).astype(int)
+    result = np.empty_like(data)
+
+    def filter_strip(start: int, stop: int) -> None:
+        lo = max(0, start - above)
+        hi = min(data.shape[0], stop + below)
+        result[start:stop] = filter_rows(data[lo:hi])[start - lo : stop - lo]
+
+    with ThreadPoolExecutor(max_workers=n_strips) as executor:
+        list(executor.map(filter_strip, bounds[:-1], bounds[1:]))
+
+    return result
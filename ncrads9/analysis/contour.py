@@ -20,10 +20,13 @@ Contour generation for astronomical images using scipy.
 Author: Yogesh Wadadekar
 """
 
-from typing import List, Optional, Tuple, Union
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import numpy as np
 from numpy.typing import NDArray
-from scipy import ndimage
+
+from .smooth import gaussian_smooth
 
 
 class ContourGenerator:
@@ -45,6 +48,12 @@ class ContourGenerator:
         List of contour levels.
     contours : list
         List of contour paths for each level.
+
+    Notes
+    -----
+    Non-contiguous input (e.g. a strided slice) is copied once into a
+    contiguous array so that the repeated whole-image passes made by the
+    level and contour methods run over contiguous memory.
     """
 
     def __init__(
@@ -52,14 +61,72 @@ class ContourGenerator:
         data: NDArray[np.floating],
         smooth: Optional[float] = None,
     ) -> None:
+        # Unsmoothed input is copied: the statistic and mask caches are
+        # keyed on the identity of self.data, so the caller must not be
+        # able to change it in place.
         if smooth is not None and smooth > 0:
-            self.data = ndimage.gaussian_filter(data, sigma=smooth)
+            self.data = gaussian_smooth(
+                np.ascontiguousarray(data), sigma=smooth, mode="reflect"
+            )
         else:
-            self.data = data.copy()
+            self.data = np.array(data, order="C")
 
         self.levels: List[float] = []
         self.contours: List[List[NDArray[np.floating]]] = []
 
+        self._stats_source: Optional[NDArray[np.floating]] = None
+        self._stats_cache: Dict[str, float] = {}
+        self._binary_cache: Optional[
+            Tuple[NDArray[np.floating], float, NDArray[np.bool_]]
+        ] = None
+
+    def _data_stat(
+        self,
+        name: str,
+        func: Callable[[NDArray[np.floating]], np.floating],
+    ) -> float:
+        """
+        Return a NaN-aware statistic of ``self.data``, memoized per array.
+
+        The cache is tied to the array object held in ``self.data`` and is
+        discarded whenever that attribute is replaced.
+        """
+        if self._stats_source is not self.data:
+            self._stats_source = self.data
+            self._stats_cache = {}
+        if name not in self._stats_cache:
+            self._stats_cache[name] = float(func(self.data))
+        return self._stats_cache[name]
+
+    def _binary_mask(self, level: float) -> NDArray[np.bool_]:
+        """
+        Return ``self.data >= level``, reusing the mask from the previous call.
+
+        Area and perimeter queries at the same level share one comparison.
+        """
+        cached = self._binary_cache
+        if cached is not None and cached[0] is self.data and cached[1] == level:
+            return cached[2]
+        binary = self.data >= level
+        self._binary_cache = (self.data, level, binary)
+        return binary
+
+    @staticmethod
+    def _outer_edge(binary: NDArray[np.bool_]) -> NDArray[np.bool_]:
+        """
+        Return pixels outside ``binary`` that have a 4-connected neighbour inside.
+
+        Equivalent to ``binary_dilation(binary) ^ binary`` but built from
+        shifted views rather than a structuring-element pass.
+        """
+        edge = np.zeros_like(binary)
+        edge[:-1, :] |= binary[1:, :]
+        edge[1:, :] |= binary[:-1, :]
+        edge[:, :-1] |= binary[:, 1:]
+        edge[:, 1:] |= binary[:, :-1]
+        edge &= ~binary
+        return edge
+
     def generate_levels(
         self,
         n_levels: int = 10,
@@ -86,12 +153,10 @@ class ContourGenerator:
         list
             List of contour level values.
         """
-        valid_data = self.data[~np.isnan(self.data)]
-
         if vmin is None:
-            vmin = float(np.min(valid_data))
+            vmin = self._data_stat("min", np.nanmin)
         if vmax is None:
-            vmax = float(np.max(valid_data))
+            vmax = self._data_stat("max", np.nanmax)
 
         if log_scale and vmin > 0:
             self.levels = list(np.logspace(np.log10(vmin), np.log10(vmax), n_levels))
@@ -123,12 +188,10 @@ class ContourGenerator:
         list
             List of contour level values.
         """
-        valid_data = self.data[~np.isnan(self.data)]
-
         if base_level is None:
-            base_level = float(np.median(valid_data))
+            base_level = self._data_stat("median", np.nanmedian)
         if rms is None:
-            rms = float(np.std(valid_data))
+            rms = self._data_stat("std", np.nanstd)
 
         self.levels = [base_level + s * rms for s in sigmas]
         return self.levels
@@ -158,10 +221,21 @@ class ContourGenerator:
         if not self.levels:
             self.generate_levels()
 
-        self.contours = []
-        for level in self.levels:
-            contour_paths = measure.find_contours(self.data, level)
-            self.contours.append(contour_paths)
+        # Levels are independent and only read self.data, so they are traced
+        # concurrently; map() keeps the results in level order.
+        max_workers = min(len(self.levels), os.cpu_count() or 1)
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                self.contours = list(
+                    executor.map(
+                        lambda level: measure.find_contours(self.data, level),
+                        self.levels,
+                    )
+                )
+        else:
+            self.contours = [
+                measure.find_contours(self.data, level) for level in self.levels
+            ]
 
         return self.contours
 
@@ -170,9 +244,11 @@ class ContourGenerator:
         levels: Optional[List[float]] = None,
     ) -> List[List[Tuple[NDArray[np.floating], NDArray[np.floating]]]]:
         """
-        Find contour paths using scipy's binary dilation method.
+        Find contour edge pixels using array operations only.
 
-        This is a simpler fallback when skimage is not available.
+        This is a simpler fallback when skimage is not available. For each
+        level it returns the pixels outside the level's region that have a
+        4-connected neighbour inside it.
 
         Parameters
         ----------
@@ -190,12 +266,34 @@ class ContourGenerator:
         if not self.levels:
             self.generate_levels()
 
+        levels = np.asarray(self.levels, dtype=float)
+        order = np.argsort(levels, kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+
+        # Number of levels each pixel reaches: a pixel lies inside the
+        # region of the i-th sorted level exactly when digit > i.
+        digit = np.searchsorted(levels[order], self.data, side="right")
+        digit = digit.astype(np.min_scalar_type(levels.size))
+        digit[np.isnan(self.data)] = 0
+
+        # Highest level reached by any 4-connected neighbour.
+        neighbour = np.zeros_like(digit)
+        np.maximum(neighbour[:-1, :], digit[1:, :], out=neighbour[:-1, :])
+        np.maximum(neighbour[1:, :], digit[:-1, :], out=neighbour[1:, :])
+        np.maximum(neighbour[:, :-1], digit[:, 1:], out=neighbour[:, :-1])
+        np.maximum(neighbour[:, 1:], digit[:, :-1], out=neighbour[:, 1:])
+
+        # A pixel is on the outer edge of level i when digit <= i < neighbour,
+        # so every level's edge pixels are drawn from one candidate set.
+        candidates = np.flatnonzero(neighbour > digit)
+        cand_digit = digit.ravel()[candidates]
+        cand_neighbour = neighbour.ravel()[candidates]
+
         contours = []
-        for level in self.levels:
-            binary = self.data >= level
-            dilated = ndimage.binary_dilation(binary)
-            edge = dilated ^ binary
-            y_coords, x_coords = np.where(edge)
+        for i in rank:
+            on_edge = candidates[(cand_digit <= i) & (cand_neighbour > i)]
+            y_coords, x_coords = np.unravel_index(on_edge, self.data.shape)
             contours.append([(x_coords, y_coords)])
 
         return contours
@@ -238,8 +336,7 @@ class ContourGenerator:
         float
             Area in square pixels.
         """
-        binary = self.data >= level
-        return float(np.sum(binary))
+        return float(np.count_nonzero(self._binary_mask(level)))
 
     def contour_perimeter(
         self,
@@ -258,7 +355,5 @@ class ContourGenerator:
         float
             Perimeter in pixels.
         """
-        binary = self.data >= level
-        dilated = ndimage.binary_dilation(binary)
-        edge = dilated ^ binary
-        return float(np.sum(edge))
+        edge = self._outer_edge(self._binary_mask(level))
+        return float(np.count_nonzero(edge))
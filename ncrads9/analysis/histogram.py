@@ -20,6 +20,7 @@ Histogram calculation and display for astronomical images.
 Author: Yogesh Wadadekar
 """
 
+import copy
 from typing import Optional, Tuple, Union
 import numpy as np
 from numpy.typing import NDArray
@@ -50,6 +51,11 @@ class Histogram:
         Histogram bin edges.
     bin_centers : NDArray
         Histogram bin centers.
+
+    Notes
+    -----
+    Non-contiguous input (e.g. a strided slice) is copied once into a
+    contiguous array, which is then shared by binning and ``rebin``.
     """
 
     def __init__(
@@ -60,7 +66,7 @@ class Histogram:
         mask: Optional[NDArray[np.bool_]] = None,
         ignore_nan: bool = True,
     ) -> None:
-        self._data = data
+        self._data = np.ascontiguousarray(data)
         self._bins = bins
         self._range = range
         self._mask = mask
@@ -74,18 +80,90 @@ class Histogram:
 
     def _compute(self) -> None:
         """Compute the histogram."""
-        pixels = self._data.flatten()
+        # ravel() is a view for contiguous data. NaNs never fall inside a
+        # finite bin range, so np.histogram drops them without a filtered copy.
+        pixels = self._data.ravel()
 
         if self._mask is not None:
-            pixels = pixels[self._mask.flatten()]
+            pixels = pixels[self._mask.ravel()]
+
+        # Kept so that rebin() can skip selecting pixels from the image again.
+        self._pixels = pixels
+        self._bin()
+
+    def _bin(self) -> None:
+        """Bin the selected pixels with the current bins and range."""
+        self._cumsum: Optional[NDArray[np.int_]] = None
+        pixels = self._pixels
+        hist_range = self._range
+        if self._compute_integer(pixels, hist_range):
+            return
 
-        if self._ignore_nan:
-            pixels = pixels[~np.isnan(pixels)]
+        if self._ignore_nan and hist_range is None and np.ndim(self._bins) == 0:
+            hist_range = self._finite_range(pixels)
+            if hist_range is None:
+                pixels = pixels[:0]
 
         self.counts, self.bin_edges = np.histogram(
-            pixels, bins=self._bins, range=self._range
+            pixels, bins=self._bins, range=hist_range
+        )
+        self.bin_centers = (self.bin_edges[:-1] + self.bin_edges[1:]) / 2
+
+    def _compute_integer(
+        self,
+        pixels: NDArray[np.integer],
+        hist_range: Optional[Tuple[float, float]],
+    ) -> bool:
+        """
+        Histogram integer pixels by counting each distinct value once.
+
+        np.bincount tallies the pixels in a single pass and only the distinct
+        values are then binned by np.histogram, which gives identical edges
+        and counts. Returns False when the data is not a suitable integer
+        array and the general path should be used.
+
+        Parameters
+        ----------
+        pixels : NDArray
+            Flattened pixel values.
+        hist_range : tuple of float, optional
+            Explicit histogram range.
+
+        Returns
+        -------
+        bool
+            True if counts and bin edges were computed.
+        """
+        if (
+            pixels.size == 0
+            or not np.issubdtype(pixels.dtype, np.integer)
+            or pixels.dtype.itemsize > 4
+        ):
+            return False
+
+        lo, hi = int(pixels.min()), int(pixels.max())
+        if hi - lo + 1 > pixels.size:
+            return False
+
+        value_counts = np.bincount(np.subtract(pixels, lo, dtype=np.intp))
+        values = np.arange(lo, hi + 1, dtype=pixels.dtype)
+        counts, self.bin_edges = np.histogram(
+            values, bins=self._bins, range=hist_range, weights=value_counts
         )
+        self.counts = counts.astype(np.intp)
         self.bin_centers = (self.bin_edges[:-1] + self.bin_edges[1:]) / 2
+        return True
+
+    @staticmethod
+    def _finite_range(pixels: NDArray[np.floating]) -> Optional[Tuple[float, float]]:
+        """Return the (min, max) of the non-NaN pixels, or None if there are none."""
+        if pixels.size == 0:
+            return None
+        vmin = np.fmin.reduce(pixels)
+        if np.isnan(vmin):
+            return None
+        # Keep the pixel dtype so the bin edges match an autodetected range.
+        return (vmin, np.fmax.reduce(pixels))
 
     def get_percentile(self, percentile: float) -> float:
         """
@@ -101,9 +179,12 @@ class Histogram:
         float
             Value at the specified percentile.
         """
-        cumsum = np.cumsum(self.counts)
-        cumsum_norm = cumsum / cumsum[-1] * 100
-        idx = np.searchsorted(cumsum_norm, percentile)
+        # The prefix sum is shared by repeated percentile queries, and the
+        # percentile is scaled to a count instead of normalising the sum.
+        if self._cumsum is None:
+            self._cumsum = np.cumsum(self.counts)
+        target = percentile * 0.01 * self._cumsum[-1]
+        idx = int(np.searchsorted(self._cumsum, target))
         return float(self.bin_centers[min(idx, len(self.bin_centers) - 1)])
 
     def get_mode(self) -> float:
@@ -138,13 +219,11 @@ class Histogram:
         Histogram
             New Histogram object with updated binning.
         """
-        return Histogram(
-            self._data,
-            bins=bins,
-            range=range if range is not None else self._range,
-            mask=self._mask,
-            ignore_nan=self._ignore_nan,
-        )
+        new = copy.copy(self)
+        new._bins = bins
+        new._range = range if range is not None else self._range
+        new._bin()
+        return new
 
     def to_log(self) -> Tuple[NDArray[np.floating], NDArray[np.floating]]:
         """
@@ -155,7 +234,7 @@ class Histogram:
         tuple
             (bin_centers, log_counts) where log_counts is log10(counts + 1).
         """
-        log_counts = np.log10(self.counts.astype(float) + 1)
+        log_counts = np.log10(self.counts + 1.0)
         return self.bin_centers, log_counts
 
     def cumulative(self) -> Tuple[NDArray[np.floating], NDArray[np.floating]]:
@@ -167,8 +246,8 @@ class Histogram:
         tuple
             (bin_centers, cumulative_counts).
         """
-        cumsum = np.cumsum(self.counts)
-        return self.bin_centers, cumsum.astype(float)
+        cumsum = np.cumsum(self.counts, dtype=np.float64)
+        return self.bin_centers, cumsum
 
     def normalized(self) -> Tuple[NDArray[np.floating], NDArray[np.floating]]:
         """
@@ -181,7 +260,7 @@ class Histogram:
         """
         total = np.sum(self.counts)
         if total > 0:
-            norm_counts = self.counts.astype(float) / total
+            norm_counts = self.counts / total
         else:
             norm_counts = self.counts.astype(float)
         return self.bin_centers, norm_counts
@@ -87,6 +87,7 @@ class PixelTable:
         x_center: int,
         y_center: int,
         size: int = 5,
+        copy: bool = True,
     ) -> NDArray[np.floating]:
         """
         Get pixel values in a square region.
@@ -99,6 +100,9 @@ class PixelTable:
             Y coordinate of center.
         size : int, default 5
             Size of the region (must be odd).
+        copy : bool, default True
+            If True, return a copy. Otherwise a view of the image is
+            returned, and writing to it modifies the image.
 
         Returns
         -------
@@ -111,13 +115,15 @@ class PixelTable:
         x_min = max(0, x_center - half)
         x_max = min(self.shape[1], x_center + half + 1)
 
-        return self.data[y_min:y_max, x_min:x_max].copy()
+        region = self.data[y_min:y_max, x_min:x_max]
+        return region.copy() if copy else region
 
     def get_row(
         self,
         y: int,
         x_start: Optional[int] = None,
         x_end: Optional[int] = None,
+        copy: bool = True,
     ) -> NDArray[np.floating]:
         """
         Get pixel values along a row.
@@ -130,6 +136,9 @@ class PixelTable:
             Starting column.
         x_end : int, optional
             Ending column.
+        copy : bool, default True
+            If True, return a copy. Otherwise a view of the image is
+            returned, and writing to it modifies the image.
 
         Returns
         -------
@@ -140,13 +149,15 @@ class PixelTable:
             x_start = 0
         if x_end is None:
             x_end = self.shape[1]
-        return self.data[y, x_start:x_end].copy()
+        row = self.data[y, x_start:x_end]
+        return row.copy() if copy else row
 
     def get_column(
         self,
         x: int,
         y_start: Optional[int] = None,
         y_end: Optional[int] = None,
+        copy: bool = True,
     ) -> NDArray[np.floating]:
         """
         Get pixel values along a column.
@@ -159,6 +170,9 @@ class PixelTable:
             Starting row.
         y_end : int, optional
             Ending row.
+        copy : bool, default True
+            If True, return a copy. Otherwise a view of the image is
+            returned, and writing to it modifies the image.
 
         Returns
         -------
@@ -169,7 +183,8 @@ class PixelTable:
             y_start = 0
         if y_end is None:
             y_end = self.shape[0]
-        return self.data[y_start:y_end, x].copy()
+        column = self.data[y_start:y_end, x]
+        return column.copy() if copy else column
 
     def format_table(
         self,
@@ -197,7 +212,7 @@ class PixelTable:
         str
             Formatted text table.
         """
-        region = self.get_region(x_center, y_center, size)
+        region = self.get_region(x_center, y_center, size, copy=False)
         half = size // 2
 
         y_min = max(0, y_center - half)
@@ -210,23 +225,26 @@ class PixelTable:
         lines.append(header)
         lines.append("-" * len(header))
 
-        for j in range(region.shape[0]):
-            y_coord = y_min + j
-            row_values = " ".join(
-                f"{val:>{precision + 6}.{precision}g}" for val in region[j]
-            )
-            lines.append(f"{y_coord:4d} {row_values}")
+        # One format template per row, applied to plain Python floats from
+        # tolist(), instead of a format call per numpy scalar.
+        row_format = "{:4d} " + " ".join(
+            [f"{{:>{precision + 6}.{precision}g}}"] * region.shape[1]
+        )
+        lines.extend(
+            row_format.format(y_min + j, *row)
+            for j, row in enumerate(region.tolist())
+        )
 
         return "\n".join(lines)
 
-    def to_dict(
+    def to_records(
         self,
         x_center: int,
         y_center: int,
         size: int = 5,
-    ) -> List[Dict[str, Any]]:
+    ) -> NDArray[np.void]:
         """
-        Convert pixel region to list of dictionaries.
+        Convert pixel region to a structured array.
 
         Parameters
         ----------
@@ -239,24 +257,59 @@ class PixelTable:
 
         Returns
         -------
-        list of dict
-            List of dicts with 'x', 'y', 'value' keys.
+        NDArray
+            Structured array with 'x', 'y' (int32) and 'value' (float64)
+            fields, one row per pixel in row-major order.
         """
-        region = self.get_region(x_center, y_center, size)
+        region = self.get_region(x_center, y_center, size, copy=False)
         half = size // 2
 
         y_min = max(0, y_center - half)
         x_min = max(0, x_center - half)
+        ys, xs = np.mgrid[
+            y_min:y_min + region.shape[0], x_min:x_min + region.shape[1]
+        ]
+
+        records = np.empty(
+            region.size, dtype=[("x", "i4"), ("y", "i4"), ("value", "f8")]
+        )
+        records["x"] = xs.ravel()
+        records["y"] = ys.ravel()
+        records["value"] = region.ravel()
+        return records
+
+    def to_dict(
+        self,
+        x_center: int,
+        y_center: int,
+        size: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert pixel region to list of dictionaries.
+
+        Parameters
+        ----------
+        x_center : int
+            X coordinate of center.
+        y_center : int
+            Y coordinate of center.
+        size : int, default 5
+            Size of the region.
 
-        result = []
-        for j in range(region.shape[0]):
-            for i in range(region.shape[1]):
-                result.append({
-                    "x": x_min + i,
-                    "y": y_min + j,
-                    "value": float(region[j, i]),
-                })
-        return result
+        Returns
+        -------
+        list of dict
+            List of dicts with 'x', 'y', 'value' keys.
+
+        See Also
+        --------
+        to_records : Same data as a structured array, without a Python
+            object per pixel.
+        """
+        return [
+            {"x": x, "y": y, "value": value}
+            for x, y, value in self.to_records(x_center, y_center, size).tolist()
+        ]
 
     def find_extrema(
         self,
@@ -281,14 +334,22 @@ class PixelTable:
         dict
             Dictionary with min/max values and coordinates.
         """
-        region = self.get_region(x_center, y_center, size)
+        region = self.get_region(x_center, y_center, size, copy=False)
         half = size // 2
 
         y_min = max(0, y_center - half)
         x_min = max(0, x_center - half)
 
-        min_idx = np.unravel_index(np.nanargmin(region), region.shape)
-        max_idx = np.unravel_index(np.nanargmax(region), region.shape)
+        # argmin/argmax return the first NaN when one is present, so the
+        # NaN-aware variants (which copy the region) are only needed then.
+        min_flat = region.argmin()
+        if np.isnan(region.flat[min_flat]):
+            min_flat = np.nanargmin(region)
+            max_flat = np.nanargmax(region)
+        else:
+            max_flat = region.argmax()
+        min_idx = np.unravel_index(min_flat, region.shape)
+        max_idx = np.unravel_index(max_flat, region.shape)
 
         return {
             "min_value": float(region[min_idx]),
@@ -334,6 +395,7 @@ class PixelTable:
         x2: int,
         y2: int,
         num_points: Optional[int] = None,
+        order: int = 1,
     ) -> Tuple[NDArray[np.floating], NDArray[np.floating]]:
         """
         Sample pixel values along a line.
@@ -346,6 +408,8 @@ class PixelTable:
             End point coordinates.
         num_points : int, optional
             Number of sample points. If None, uses line length.
+        order : int, default 1
+            Spline interpolation order. Samples outside the image are NaN.
 
         Returns
         -------
@@ -361,9 +425,73 @@ class PixelTable:
 
         distances = np.sqrt((x_coords - x1) ** 2 + (y_coords - y1) ** 2)
 
-        from scipy import ndimage
-        values = ndimage.map_coordinates(
-            self.data, [y_coords, x_coords], order=1, mode="constant", cval=np.nan
-        )
+        # Samples land exactly on pixels when the line starts on one and
+        # advances by whole pixels per step (e.g. row or column cuts).
+        grid_values = [x1, y1]
+        if num_points > 1:
+            grid_values += [
+                (x2 - x1) / (num_points - 1), (y2 - y1) / (num_points - 1)
+            ]
+        on_grid = all(float(v).is_integer() for v in grid_values)
+
+        if order == 1 and np.issubdtype(self.data.dtype, np.floating):
+            if on_grid:
+                # The bilinear weights all vanish, leaving a strided gather.
+                values = _pixel_gather(
+                    self.data, x_coords.astype(np.intp), y_coords.astype(np.intp)
+                )
+            else:
+                values = _bilinear_sample(self.data, x_coords, y_coords)
+        else:
+            from scipy import ndimage
+            values = ndimage.map_coordinates(
+                self.data, [y_coords, x_coords], order=order,
+                mode="constant", cval=np.nan,
+            )
 
         return distances, values
+
+
+def _pixel_gather(
+    data: NDArray[np.floating],
+    x: NDArray[np.intp],
+    y: NDArray[np.intp],
+) -> NDArray[np.floating]:
+    """Return ``data[y, x]`` for integer coordinates, with NaN outside the image."""
+    ny, nx = data.shape
+    inside = (x >= 0) & (x < nx) & (y >= 0) & (y < ny)
+    values = np.full(x.shape, np.nan, dtype=data.dtype)
+    values[inside] = data[y[inside], x[inside]]
+    return values
+
+
+def _bilinear_sample(
+    data: NDArray[np.floating],
+    x: NDArray[np.floating],
+    y: NDArray[np.floating],
+) -> NDArray[np.floating]:
+    """
+    Bilinearly interpolate ``data`` at (x, y), with NaN outside the image.
+
+    Equivalent to ``ndimage.map_coordinates(..., order=1, mode="constant",
+    cval=nan)`` but done with four gathers, without spline setup.
+    """
+    ny, nx = data.shape
+    inside = (x >= 0) & (x <= nx - 1) & (y >= 0) & (y <= ny - 1)
+    x = np.where(inside, x, 0.0)
+    y = np.where(inside, y, 0.0)
+
+    # Clamp the lower corner so samples on the last row/column still have
+    # an in-bounds upper neighbour (with zero weight).
+    x0 = np.minimum(x.astype(np.intp), max(nx - 2, 0))
+    y0 = np.minimum(y.astype(np.intp), max(ny - 2, 0))
+    x1 = np.minimum(x0 + 1, nx - 1)
+    y1 = np.minimum(y0 + 1, ny - 1)
+    fx = x - x0
+    fy = y - y0
+
+    top = data[y0, x0] * (1 - fx) + data[y0, x1] * fx
+    bottom = data[y1, x0] * (1 - fx) + data[y1, x1] * fx
+    values = (top * (1 - fy) + bottom * fy).astype(data.dtype, copy=False)
+    values[~inside] = np.nan
+    return values
@@ -20,10 +20,33 @@ Radial profile extraction for astronomical images.
 Author: Yogesh Wadadekar
 """
 
-from typing import Optional, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 import numpy as np
 from numpy.typing import NDArray
 
+# Number of binnings whose label images are kept per profile.
+_LABEL_CACHE_SIZE = 4
+
+# Profiles with at least this many pixels compute bin medians in parallel.
+_PARALLEL_MEDIAN_PIXELS = 1024 * 1024
+
+
+@lru_cache(maxsize=8)
+def _pixel_grid(ny: int, nx: int) -> Tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """
+    Return read-only ``np.ogrid`` row and column indices for an image shape.
+
+    Shared across profiles so that moving the center does not reallocate
+    the index arrays.
+    """
+    y, x = np.ogrid[:ny, :nx]
+    y.setflags(write=False)
+    x.setflags(write=False)
+    return y, x
+
 
 class RadialProfile:
     """
@@ -69,15 +92,63 @@ class RadialProfile:
         self.profile_std: NDArray[np.floating]
         self.npixels: NDArray[np.int_]
 
-        self._distance_map: NDArray[np.floating]
+        self._distance_sq_map: NDArray[np.floating]
+        self._label_cache: Dict[Tuple[int, float], NDArray[np.unsignedinteger]] = {}
         self._compute_distance_map()
 
     def _compute_distance_map(self) -> None:
-        """Compute the distance of each pixel from the center."""
-        y, x = np.ogrid[: self._data.shape[0], : self._data.shape[1]]
-        self._distance_map = np.sqrt(
-            (x - self._center[0]) ** 2 + (y - self._center[1]) ** 2
-        )
+        """
+        Compute the squared distance of each pixel from the center.
+
+        Annulus tests compare against squared radii, so the square root is
+        only taken where an actual distance is needed. Cached bin labels
+        depend on the center and are discarded.
+        """
+        self._label_cache.clear()
+        y, x = _pixel_grid(*self._data.shape)
+        self._distance_sq_map = (x - self._center[0]) ** 2 + (
+            y - self._center[1]
+        ) ** 2
+
+    @property
+    def distance_map(self) -> NDArray[np.floating]:
+        """Return the distance of each pixel from the center."""
+        return np.sqrt(self._distance_sq_map)
+
+    def _bin_labels(self, n_bins: int, bin_width: float) -> NDArray[np.unsignedinteger]:
+        """
+        Label each pixel with its radial bin number plus one.
+
+        Pixels beyond the outermost bin, masked out, or NaN get label 0. The
+        labels use the narrowest unsigned type that holds ``n_bins``, and
+        are cached per binning so that repeated extractions (e.g. with a
+        different method) skip the distance and mask work.
+        """
+        key = (n_bins, bin_width)
+        labels = self._label_cache.get(key)
+        if labels is not None:
+            return labels
+        if len(self._label_cache) >= _LABEL_CACHE_SIZE:
+            self._label_cache.clear()
+
+        labels = np.sqrt(self._distance_sq_map)
+        labels /= bin_width
+        labels += 1
+        np.minimum(labels, n_bins, out=labels)
+        labels = labels.astype(np.min_scalar_type(n_bins + 1))
+
+        # Fold every exclusion into one boolean image and zero the excluded
+        # labels with a single multiply, rather than one scatter per test.
+        keep = np.isnan(self._data)
+        np.logical_not(keep, out=keep)
+        keep &= self._distance_sq_map < (n_bins * bin_width) ** 2
+        if self._mask is not None:
+            keep &= self._mask
+        labels *= keep
+
+        labels.setflags(write=False)
+        self._label_cache[key] = labels
+        return labels
 
     def extract(
         self,
@@ -111,37 +182,61 @@ class RadialProfile:
         self.profile_std = np.zeros(n_bins)
         self.npixels = np.zeros(n_bins, dtype=int)
 
-        data_flat = self._data.flatten()
-        dist_flat = self._distance_map.flatten()
-
-        if self._mask is not None:
-            mask_flat = self._mask.flatten()
-            data_flat = data_flat[mask_flat]
-            dist_flat = dist_flat[mask_flat]
-
-        valid = ~np.isnan(data_flat)
-        data_flat = data_flat[valid]
-        dist_flat = dist_flat[valid]
-
-        for i in range(n_bins):
-            r_inner = i * bin_width
-            r_outer = (i + 1) * bin_width
-            in_bin = (dist_flat >= r_inner) & (dist_flat < r_outer)
-
-            if np.any(in_bin):
-                bin_data = data_flat[in_bin]
-                self.npixels[i] = len(bin_data)
-
-                if method == "mean":
-                    self.profile[i] = np.mean(bin_data)
-                elif method == "median":
-                    self.profile[i] = np.median(bin_data)
-                elif method == "sum":
-                    self.profile[i] = np.sum(bin_data)
-                else:
-                    raise ValueError(f"Unknown method: {method}")
-
-                self.profile_std[i] = np.std(bin_data)
+        if method not in ("mean", "median", "sum"):
+            raise ValueError(f"Unknown method: {method}")
+
+        # Reduce all bins together with bincount over a label image rather
+        # than rescanning the image per bin. Excluded pixels carry label 0,
+        # whose (possibly NaN) totals are discarded.
+        labels = self._bin_labels(n_bins, bin_width).ravel()
+        # bincount and fancy indexing work on intp; convert once, not per call.
+        bin_idx = labels.astype(np.intp)
+        data_flat = self._data.ravel()
+
+        self.npixels = np.bincount(bin_idx, minlength=n_bins + 1)[1:]
+        sums = np.bincount(bin_idx, weights=data_flat, minlength=n_bins + 1)[1:]
+        filled = self.npixels > 0
+
+        means = np.zeros(n_bins + 1)
+        np.divide(sums, self.npixels, out=means[1:], where=filled)
+        # Two-pass variance: deviations from each bin's own mean avoid the
+        # cancellation of the sum-of-squares form.
+        sq_dev = np.bincount(
+            bin_idx, weights=(data_flat - means[bin_idx]) ** 2, minlength=n_bins + 1
+        )[1:]
+        np.divide(sq_dev, self.npixels, out=self.profile_std, where=filled)
+        np.sqrt(self.profile_std, out=self.profile_std)
+
+        if method == "mean":
+            self.profile = means[1:]
+        elif method == "sum":
+            self.profile = sums
+        else:
+            # Group pixels by label with a single sort so each bin is a
+            # contiguous slice. Labels are stored in the narrowest unsigned
+            # type, for which a stable sort is a radix sort.
+            order = np.argsort(labels, kind="stable")
+            n_excluded = labels.size - self.npixels.sum()
+            sorted_data = data_flat[order[n_excluded:]]
+            starts = np.concatenate(([0], np.cumsum(self.npixels)))
+            bins = np.flatnonzero(filled)
+
+            # Bins are independent and partitioning releases the GIL, so
+            # large profiles split the bins into contiguous chunks across
+            # threads; each chunk writes only its own profile entries.
+            workers = os.cpu_count() or 1
+            if sorted_data.size < _PARALLEL_MEDIAN_PIXELS or workers == 1:
+                _bin_medians(sorted_data, starts, bins, self.profile)
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(
+                        executor.map(
+                            lambda chunk: _bin_medians(
+                                sorted_data, starts, chunk, self.profile
+                            ),
+                            np.array_split(bins, workers * 4),
+                        )
+                    )
 
         return self.radii, self.profile
 
@@ -168,30 +263,36 @@ class RadialProfile:
         tuple
             (angles, profile) arrays where angles are in degrees.
         """
-        y, x = np.ogrid[: self._data.shape[0], : self._data.shape[1]]
-        angles = np.arctan2(y - self._center[1], x - self._center[0])
-        angles = np.degrees(angles)
+        r_inner = max(radius - width / 2, 0.0)
+        r_outer = max(radius + width / 2, 0.0)
+        in_annulus = (self._distance_sq_map >= r_inner * r_inner) & (
+            self._distance_sq_map < r_outer * r_outer
+        )
+        if self._mask is not None:
+            in_annulus &= self._mask
+
+        # Only pixels inside the annulus need an angle and a sector; they are
+        # then averaged per sector in a single bincount pass.
+        y_idx, x_idx = np.nonzero(in_annulus)
+        values = self._data[y_idx, x_idx]
+        valid = ~np.isnan(values)
+        y_idx, x_idx, values = y_idx[valid], x_idx[valid], values[valid]
 
-        in_annulus = (self._distance_map >= radius - width / 2) & (
-            self._distance_map < radius + width / 2
+        angles = np.degrees(
+            np.arctan2(y_idx - self._center[1], x_idx - self._center[0])
         )
 
         sector_angles = np.linspace(-180, 180, n_sectors + 1)
         sector_centers = (sector_angles[:-1] + sector_angles[1:]) / 2
-        profile = np.zeros(n_sectors)
-
-        for i in range(n_sectors):
-            in_sector = (angles >= sector_angles[i]) & (angles < sector_angles[i + 1])
-            combined_mask = in_annulus & in_sector
 
-            if self._mask is not None:
-                combined_mask = combined_mask & self._mask
+        sector = np.searchsorted(sector_angles, angles, side="right") - 1
+        in_sector = sector < n_sectors
+        sector, values = sector[in_sector], values[in_sector]
 
-            if np.any(combined_mask):
-                sector_data = self._data[combined_mask]
-                valid = ~np.isnan(sector_data)
-                if np.any(valid):
-                    profile[i] = np.mean(sector_data[valid])
+        counts = np.bincount(sector, minlength=n_sectors)
+        sums = np.bincount(sector, weights=values, minlength=n_sectors)
+        profile = np.zeros(n_sectors)
+        np.divide(sums, counts, out=profile, where=counts > 0)
 
         return sector_centers, profile
 
@@ -205,3 +306,23 @@ class RadialProfile:
         """Set the center and recompute distance map."""
         self._center = value
         self._compute_distance_map()
+
+
+def _bin_medians(
+    sorted_data: NDArray[np.floating],
+    starts: NDArray[np.intp],
+    bins: NDArray[np.intp],
+    out: NDArray[np.floating],
+) -> None:
+    """
+    Store the median of each bin's slice of ``sorted_data`` in ``out``.
+
+    Bin ``i`` occupies ``sorted_data[starts[i]:starts[i + 1]]``, and every
+    listed bin must be non-empty. The slices are partitioned in place,
+    which avoids the copy that ``np.median`` makes of each one.
+    """
+    for i in bins:
+        values = sorted_data[starts[i] : starts[i + 1]]
+        lo, hi = (values.size - 1) // 2, values.size // 2
+        values.partition((lo, hi))
+        out[i] = (float(values[lo]) + float(values[hi])) / 2
@@ -23,14 +23,15 @@ Author: Yogesh Wadadekar
 """
 
 from dataclasses import dataclass
-from typing import List, Sequence
+from typing import List, Optional, Sequence
 import logging
+import threading
 import tempfile
 import webbrowser
 from pathlib import Path
 
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
 
 from ncrads9 import __version__
 from ncrads9.communication.xpa import XPAServer
@@ -49,6 +50,45 @@ class CLIItem:
     args: List[str]
 
 
+class _XPAStartupNotifier(QObject):
+    """Carries the XPA startup result back to the GUI thread."""
+
+    finished = pyqtSignal(bool)
+
+
+class _StartXPAServer(QRunnable):
+    """
+    Start an XPA server on a pool thread.
+
+    Binding the socket and registering with xpans can block for several
+    seconds when no name server is running, so this keeps it off the GUI
+    thread. The result is emitted through ``notifier.finished``; a
+    startup that raises is logged and reported as False.
+    """
+
+    def __init__(self, server: XPAServer) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.server = server
+        self.notifier = _XPAStartupNotifier()
+        self.done = threading.Event()
+
+    def run(self) -> None:
+        try:
+            started = self.server.start()
+        except Exception:
+            logging.getLogger(__name__).exception("XPA server startup raised")
+            started = False
+        finally:
+            self.done.set()
+        self.notifier.finished.emit(started)
+
+    def stop_server(self) -> None:
+        """Stop the server once startup has finished."""
+        self.done.wait()
+        self.server.stop()
+
+
 def _cli_help_requested(argv: Sequence[str]) -> bool:
     """Return True when CLI help was requested."""
     help_flags = {"-h", "--help", "-help"}
@@ -175,6 +215,10 @@ def parse_cli_sequence(args: Sequence[str]) -> List[CLIItem]:
     i = 0
     while i < len(args):
         token = str(args[i])
+        if token == "--":
+            # End of options: everything that follows is a file path.
+            items.extend(CLIItem(kind="file", name=str(arg), args=[]) for arg in args[i + 1 :])
+            break
         if _is_option_token(token):
             option = token.lstrip("-").lower()
             option_args: List[str] = []
@@ -246,11 +290,17 @@ def apply_startup_cli(main_window: MainWindow, argv: Sequence[str]) -> None:
     available_colormaps = set(main_window.get_available_colormaps())
     rgb_channel_paths: dict[str, str] = {}
     rgb_requested = False
+    # Consecutive file arguments (e.g. a shell glob) are opened together so
+    # the window redraws once per run instead of once per file.
+    pending_files: List[str] = []
 
     for item in items:
         if item.kind == "file":
-            main_window.open_file(filepath=item.name)
+            pending_files.append(item.name)
             continue
+        if pending_files:
+            main_window.open_files(pending_files)
+            pending_files = []
 
         option = item.name
         args = item.args
@@ -317,6 +367,9 @@ def apply_startup_cli(main_window: MainWindow, argv: Sequence[str]) -> None:
             continue
         logger.warning("Unsupported startup option: -%s", option)
 
+    if pending_files:
+        main_window.open_files(pending_files)
+
     if rgb_requested and rgb_channel_paths:
         _load_rgb_channels_from_cli(main_window, rgb_channel_paths)
     elif rgb_requested:
@@ -359,22 +412,33 @@ def run_application(argv: List[str]) -> int:
     main_window = MainWindow(config)
     main_window.show()
 
-    xpa_enabled = bool(config.get("communication.xpa.enabled", True))
-    xpa_server = None
-    if xpa_enabled:
+    # Resolve the XPA section once rather than walking the dotted path per key.
+    xpa_config = config.get_section("communication.xpa")
+    xpa_startup: Optional[_StartXPAServer] = None
+    if bool(xpa_config.get("enabled", True)):
         xpa_server = XPAServer(
-            name=str(config.get("communication.xpa.name", "ncrads9")),
-            host=str(config.get("communication.xpa.host", "localhost")),
-            port=int(config.get("communication.xpa.port", 0)),
+            name=str(xpa_config.get("name", "ncrads9")),
+            host=str(xpa_config.get("host", "localhost")),
+            port=int(xpa_config.get("port", 0)),
             viewer=main_window,
         )
-        if not xpa_server.start():
-            logger.warning("Failed to start XPA server on %s", xpa_server.address)
 
-    # Apply startup files/options
-    apply_startup_cli(main_window, argv)
+        def _report_xpa_startup(started: bool) -> None:
+            if not started:
+                logger.warning("Failed to start XPA server on %s", xpa_server.address)
+
+        # Nothing on the GUI thread waits for XPA to be listening, so start it
+        # in the background and let the first paint go ahead.
+        xpa_startup = _StartXPAServer(xpa_server)
+        xpa_startup.notifier.finished.connect(_report_xpa_startup)
+        QThreadPool.globalInstance().start(xpa_startup)
+
+    # Apply startup files/options. QApplication has already consumed its own
+    # flags (e.g. -style, -platform), so read the remaining arguments from it
+    # rather than from argv, which may still contain them.
+    apply_startup_cli(main_window, app.arguments())
 
-    if xpa_server is not None:
-        app.aboutToQuit.connect(xpa_server.stop)
+    if xpa_startup is not None:
+        app.aboutToQuit.connect(xpa_startup.stop_server)
 
     return app.exec()
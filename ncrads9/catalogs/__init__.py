@@ -31,6 +31,7 @@ from .twomass import TwoMASSCatalog
 from .catalog_display import CatalogDisplay
 from .catalog_table import CatalogTable
 from .cone_search import ConeSearch
+from .async_query import query_region_async, resolve_name_async, run_async
 
 __all__ = [
     "CatalogBase",
@@ -43,4 +44,7 @@ __all__ = [
     "CatalogDisplay",
     "CatalogTable",
     "ConeSearch",
+    "query_region_async",
+    "resolve_name_async",
+    "run_async",
 ]
@@ -0,0 +1,184 @@
+# This file is part of ncrads9.
+#
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+On-disk cache of catalog query results.
+
+Results are stored as FITS binary tables, which keep column units and
+masks and read back much faster than service replies are parsed. Each
+file is named by a hash of the query's inputs (catalog, position, radius
+and options), not of the request bytes, so it is found again however the
+request is sent.
+
+Author: Yogesh Wadadekar
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from astropy.coordinates import SkyCoord
+from astropy.table import Table
+import astropy.units as u
+
+logger = logging.getLogger(__name__)
+
+# Directory under which each catalog keeps its cached results.
+CACHE_ROOT = Path.home() / ".ncrads9" / "cache"
+
+# Seconds for which a cached result is reused, unless overridden by the
+# NCRADS9_CACHE_TTL environment variable.
+DEFAULT_TTL = 30 * 24 * 3600.0
+
+
+def cache_ttl() -> float:
+    """Return the cache lifetime in seconds."""
+    value = os.environ.get("NCRADS9_CACHE_TTL")
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            logger.warning("Ignoring invalid NCRADS9_CACHE_TTL=%r", value)
+    return DEFAULT_TTL
+
+
+def cache_key(**fields: Any) -> str:
+    """Return a stable hex digest of the given query inputs."""
+    text = json.dumps(fields, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_table(path: Path, ttl: float) -> Optional[Table]:
+    """
+    Return the table cached at ``path`` if it is younger than ``ttl``.
+
+    Missing, expired and unreadable files all give None.
+    """
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            table = Table.read(path, format="fits")
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Ignoring unreadable catalog cache %s", path)
+        return None
+
+    from .catalog_base import drop_empty_masks
+
+    return drop_empty_masks(table)
+
+
+def store_table(path: Path, table: Table) -> None:
+    """
+    Write ``table`` to ``path``.
+
+    The file is written under a temporary name and renamed, so concurrent
+    queries and other sessions never read a partial file. Failures are
+    logged; they only cost the cache entry.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(suffix=".fits.tmp", dir=path.parent)
+        os.close(fd)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                table.write(tmp_name, format="fits", overwrite=True)
+            os.replace(tmp_name, path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+    except Exception:
+        logger.warning("Could not write catalog cache %s", path, exc_info=True)
+
+
+def fetch_cached(path: Path, fetch: Callable[[], Optional[Table]]) -> Optional[Table]:
+    """
+    Return the table cached at ``path``, or call ``fetch`` and cache its result.
+
+    Entries older than `cache_ttl` are fetched again. Empty and missing
+    results are not stored.
+    """
+    table = load_table(path, cache_ttl())
+    if table is None:
+        table = fetch()
+        if table is not None and len(table) > 0:
+            store_table(path, table)
+    return table
+
+
+def clear_directory(directory: Path) -> None:
+    """Remove the cached tables in ``directory``."""
+    if not directory.is_dir():
+        return
+    for path in directory.glob("*.fits"):
+        try:
+            path.unlink()
+        except OSError:
+            logger.warning("Could not remove catalog cache %s", path)
+
+
+def cached_region_query(
+    query: Callable[..., Optional[Table]],
+) -> Callable[..., Optional[Table]]:
+    """
+    Serve a catalog's ``query_region(coord, radius, **kwargs)`` from disk.
+
+    The cache key combines the catalog name, the position (rounded to
+    ~4 mas), the radius, the keyword arguments and whatever the catalog's
+    ``_disk_cache_fields`` adds (e.g. columns or data release). Results
+    are kept under ``CACHE_ROOT/<catalog>``. Queries with array
+    coordinates or extra positional arguments, catalogs whose
+    ``disk_cache`` is off, and queries for which ``_disk_cache_fields``
+    returns None, go straight to the service.
+    """
+
+    @functools.wraps(query)
+    def wrapper(
+        self: Any, coord: SkyCoord, radius: u.Quantity, *args: Any, **kwargs: Any
+    ) -> Optional[Table]:
+        fields = self._disk_cache_fields(kwargs) if self.disk_cache else None
+        if fields is None or args or not coord.isscalar:
+            return query(self, coord, radius, *args, **kwargs)
+
+        icrs = coord.icrs
+        key = cache_key(
+            catalog=self.name,
+            ra=round(float(icrs.ra.deg), 6),
+            dec=round(float(icrs.dec.deg), 6),
+            radius=round(float(radius.to_value(u.arcsec)), 4),
+            kwargs=sorted((name, str(value)) for name, value in kwargs.items()),
+            **fields,
+        )
+        table = fetch_cached(
+            self.disk_cache_dir / f"{key}.fits",
+            lambda: query(self, coord, radius, **kwargs),
+        )
+        self._last_result = table
+        return table
+
+    return wrapper
@@ -0,0 +1,233 @@
+# This file is part of ncrads9.
+#
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Object name resolution with a persistent cache.
+
+Author: Yogesh Wadadekar
+"""
+
+import functools
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from astropy.coordinates import SkyCoord
+import astropy.units as u
+import numpy as np
+
+from . import _cache
+
+logger = logging.getLogger(__name__)
+
+
+def cache_path() -> Path:
+    """Return the file holding resolved positions, shared by all sessions."""
+    return _cache.CACHE_ROOT / "names.json"
+
+
+# Normalized name -> [ra, dec] in ICRS degrees; loaded on first use.
+_positions: Optional[Dict[str, List[float]]] = None
+_cache_lock = threading.Lock()
+
+
+def _normalize(name: str) -> str:
+    """Return the cache key for an object name."""
+    return " ".join(name.split()).lower()
+
+
+def _load_cache() -> Dict[str, List[float]]:
+    """Return the in-memory cache, reading it from disk the first time."""
+    global _positions
+    if _positions is None:
+        path = cache_path()
+        try:
+            with open(path, encoding="utf-8") as handle:
+                _positions = {
+                    str(key): [float(value[0]), float(value[1])]
+                    for key, value in json.load(handle).items()
+                }
+        except FileNotFoundError:
+            _positions = {}
+        except Exception:
+            logger.warning("Ignoring unreadable name cache %s", path)
+            _positions = {}
+    return _positions
+
+
+def _save_cache(cache: Dict[str, List[float]]) -> None:
+    """Write the cache to disk, replacing the file atomically."""
+    path = cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(cache, handle)
+            os.replace(tmp_name, path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+    except OSError:
+        logger.warning("Could not write name cache %s", path, exc_info=True)
+
+
+def resolve_name(name: str) -> SkyCoord:
+    """
+    Resolve an object name to ICRS coordinates.
+
+    Names are looked up with ``SkyCoord.from_name`` (a Sesame request)
+    only the first time they are seen; the position is then kept in
+    `cache_path` and reused across sessions. Names differing only in
+    case or whitespace share an entry.
+
+    Parameters
+    ----------
+    name : str
+        Object name, e.g. ``"M31"``.
+
+    Returns
+    -------
+    SkyCoord
+        Position of the object.
+
+    Raises
+    ------
+    astropy.coordinates.name_resolve.NameResolveError
+        If the name cannot be resolved.
+    """
+    key = _normalize(name)
+    with _cache_lock:
+        position = _load_cache().get(key)
+    if position is not None:
+        return SkyCoord(ra=position[0] * u.deg, dec=position[1] * u.deg, frame="icrs")
+
+    coord = SkyCoord.from_name(name).icrs
+    with _cache_lock:
+        cache = _load_cache()
+        cache[key] = [float(coord.ra.deg), float(coord.dec.deg)]
+        _save_cache(cache)
+    return coord
+
+
+@functools.lru_cache(maxsize=1)
+def _simbad() -> Any:
+    """Return the SIMBAD client used for bulk resolution."""
+    from astroquery.simbad import SimbadClass
+
+    from .catalog_base import http_session
+
+    client = SimbadClass()
+    client._session = http_session()
+    return client
+
+
+def _query_simbad(names: Sequence[str]) -> Dict[str, List[float]]:
+    """
+    Look up many names in SIMBAD with a single request.
+
+    Returns a mapping from each name SIMBAD knows to its ICRS
+    ``[ra, dec]`` in degrees; unknown names are left out.
+    """
+    table = _simbad().query_objects(list(names))
+    if table is None or len(table) == 0:
+        return {}
+    ra = np.ma.filled(np.ma.asarray(table["ra"], dtype=float), np.nan)
+    dec = np.ma.filled(np.ma.asarray(table["dec"], dtype=float), np.nan)
+    found = np.isfinite(ra) & np.isfinite(dec)
+    return {
+        str(name): [float(r), float(d)]
+        for name, r, d in zip(
+            table["user_specified_id"][found], ra[found], dec[found]
+        )
+    }
+
+
+def resolve_names(names: Sequence[str]) -> SkyCoord:
+    """
+    Resolve many object names to ICRS coordinates.
+
+    Cached names are answered from `cache_path`. The rest are sent to
+    SIMBAD in one request rather than one Sesame request per name;
+    names SIMBAD does not know, or all of them if SIMBAD cannot be
+    reached, fall back to `resolve_name`.
+
+    Parameters
+    ----------
+    names : sequence of str
+        Object names.
+
+    Returns
+    -------
+    SkyCoord
+        Array of positions, in the order of ``names``.
+
+    Raises
+    ------
+    astropy.coordinates.name_resolve.NameResolveError
+        If any name cannot be resolved.
+    """
+    keys = [_normalize(name) for name in names]
+    with _cache_lock:
+        cache = _load_cache()
+        positions = {key: cache[key] for key in keys if key in cache}
+
+    # Unresolved names, one per cache key.
+    pending: Dict[str, str] = {}
+    for key, name in zip(keys, names):
+        if key not in positions:
+            pending.setdefault(key, name)
+    missing = list(pending.values())
+    if len(missing) > 1:
+        try:
+            found = _query_simbad(missing)
+        except Exception:
+            logger.warning("Bulk SIMBAD name lookup failed", exc_info=True)
+            found = {}
+        if found:
+            found = {_normalize(name): position for name, position in found.items()}
+            positions.update(found)
+            with _cache_lock:
+                cache = _load_cache()
+                cache.update(found)
+                _save_cache(cache)
+
+    for key, name in zip(keys, names):
+        if key not in positions:
+            coord = resolve_name(name)
+            positions[key] = [float(coord.ra.deg), float(coord.dec.deg)]
+
+    radec = np.array([positions[key] for key in keys], dtype=float).reshape(-1, 2)
+    return SkyCoord(ra=radec[:, 0] * u.deg, dec=radec[:, 1] * u.deg, frame="icrs")
+
+
+def clear_name_cache() -> None:
+    """Forget all resolved names, in memory and on disk."""
+    global _positions
+    with _cache_lock:
+        _positions = {}
+        path = cache_path()
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.warning("Could not remove name cache %s", path)
@@ -0,0 +1,200 @@
+# This file is part of ncrads9.
+#
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Run catalog queries and name resolution off the GUI thread.
+
+Author: Yogesh Wadadekar
+"""
+
+import logging
+from typing import Any, Callable, Optional, Set
+
+from astropy.coordinates import SkyCoord
+from astropy.table import Table
+import astropy.units as u
+
+from ._names import resolve_name
+from .catalog_base import CatalogBase
+
+try:
+    from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+    HAS_QT = True
+except ImportError:
+    HAS_QT = False
+    QObject = object  # type: ignore
+    QRunnable = object  # type: ignore
+    pyqtSignal = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+class _QueryNotifier(QObject):
+    """Carries a query's result or exception back to the GUI thread."""
+
+    if HAS_QT:
+        finished = pyqtSignal(object)
+        failed = pyqtSignal(object)
+
+
+class _QueryRunnable(QRunnable):
+    """
+    Call a function on a pool thread and report through ``notifier``.
+
+    The return value is emitted with ``notifier.finished``, or the raised
+    exception with ``notifier.failed``. Signals connected from the GUI
+    thread are delivered there through queued connections.
+    """
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.notifier = _QueryNotifier()
+
+    def run(self) -> None:
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as exc:
+            logger.debug("Background query failed", exc_info=True)
+            self.notifier.failed.emit(exc)
+            return
+        self.notifier.finished.emit(result)
+
+
+# Submitted runnables, kept alive until their result has been delivered.
+_PENDING: Set[_QueryRunnable] = set()
+
+
+def run_async(
+    func: Callable[..., Any],
+    *args: Any,
+    on_finished: Callable[[Any], None],
+    on_failed: Optional[Callable[[Exception], None]] = None,
+    **kwargs: Any,
+) -> "_QueryRunnable":
+    """
+    Call ``func(*args, **kwargs)`` on the global thread pool.
+
+    Must be called from the GUI thread; the callbacks run there once the
+    call returns or raises.
+
+    Parameters
+    ----------
+    func : callable
+        Blocking function to run, e.g. a catalog query.
+    *args : Any
+        Positional arguments for ``func``.
+    on_finished : callable
+        Receives the return value of ``func``.
+    on_failed : callable, optional
+        Receives the exception raised by ``func``. If omitted, failures
+        are logged.
+    **kwargs : Any
+        Keyword arguments for ``func``.
+
+    Returns
+    -------
+    _QueryRunnable
+        The submitted task.
+    """
+    if not HAS_QT:
+        raise ImportError("PyQt6 is required for background queries")
+
+    task = _QueryRunnable(func, *args, **kwargs)
+    task.notifier.finished.connect(on_finished)
+    if on_failed is not None:
+        task.notifier.failed.connect(on_failed)
+    else:
+        task.notifier.failed.connect(
+            lambda exc: logger.warning("Background query failed: %s", exc)
+        )
+    task.notifier.finished.connect(lambda _result: _PENDING.discard(task))
+    task.notifier.failed.connect(lambda _exc: _PENDING.discard(task))
+    _PENDING.add(task)
+    QThreadPool.globalInstance().start(task)
+    return task
+
+
+def query_region_async(
+    catalog: CatalogBase,
+    coord: SkyCoord,
+    radius: u.Quantity,
+    slot: Callable[[Optional[Table]], None],
+    **kwargs: Any,
+) -> "_QueryRunnable":
+    """
+    Run ``catalog.query_region`` in the background and pass its table to ``slot``.
+
+    Parameters
+    ----------
+    catalog : CatalogBase
+        Catalog to query.
+    coord : SkyCoord
+        Center coordinate for the query.
+    radius : Quantity
+        Search radius with angular units.
+    slot : callable
+        Receives the result table, or None if the query failed.
+    **kwargs : Any
+        Additional query parameters.
+
+    Returns
+    -------
+    _QueryRunnable
+        The submitted task.
+    """
+    return run_async(
+        catalog.query_region,
+        coord,
+        radius,
+        on_finished=slot,
+        on_failed=lambda exc: slot(None),
+        **kwargs,
+    )
+
+
+def resolve_name_async(
+    name: str,
+    on_finished: Callable[[SkyCoord], None],
+    on_failed: Optional[Callable[[Exception], None]] = None,
+) -> "_QueryRunnable":
+    """
+    Resolve an object name in the background.
+
+    Names resolved before are answered from the persistent name cache.
+
+    Parameters
+    ----------
+    name : str
+        Object name to resolve.
+    on_finished : callable
+        Receives the resolved coordinate.
+    on_failed : callable, optional
+        Receives the exception if the name could not be resolved.
+
+    Returns
+    -------
+    _QueryRunnable
+        The submitted task.
+    """
+    return run_async(
+        resolve_name, name, on_finished=on_finished, on_failed=on_failed
+    )
@@ -21,17 +21,53 @@ Abstract base class for catalog queries.
 Author: Yogesh Wadadekar
 """
 
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, List, Any
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Optional, Tuple, Any
 
-from astropy.coordinates import SkyCoord
-from astropy.table import Table
+import numpy as np
+import requests
+from numpy.typing import NDArray
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from astropy.coordinates import Angle, SkyCoord
+from astropy.table import Column, MaskedColumn, Table, vstack
 import astropy.units as u
 
+from . import _cache
+from ._parallel import fanout
+
+# Lower-case column names recognised as right ascension and declination.
+_RA_ALIASES = frozenset({"ra", "_ra", "raj2000", "ra_icrs", "ra_j2000"})
+_DEC_ALIASES = frozenset({"dec", "_dec", "dej2000", "de", "dec_icrs", "dec_j2000"})
+
+# Connections kept per host by sessions from http_session().
+HTTP_POOL_SIZE = 16
+
+# Resolved (ra, dec) column names per live table, keyed by id(table) and
+# checked against the table's current column names.
+_COLUMN_CACHE: Dict[
+    int, Tuple["weakref.ref[Table]", Tuple[str, ...], Tuple[Optional[str], Optional[str]]]
+] = {}
+
 
 class CatalogBase(ABC):
     """Abstract base class for astronomical catalog queries."""
 
+    # Number of distinct query results kept by _cached_query.
+    QUERY_CACHE_SIZE: int = 256
+
+    # Largest number of this catalog's queries in flight at once, across
+    # all batches, so that parallel queries do not flood the service.
+    MAX_CONCURRENT_QUERIES: int = 8
+
+    # Whether query_region results are kept on disk between sessions, for
+    # catalogs whose query_region uses _cache.cached_region_query.
+    disk_cache: bool = True
+
     def __init__(self, name: str, description: str = "") -> None:
         """
         Initialize catalog base.
@@ -46,6 +82,12 @@ class CatalogBase(ABC):
         self.name: str = name
         self.description: str = description
         self._last_result: Optional[Table] = None
+        # (table, coordinates) for the most recent result whose coordinates
+        # were extracted; checked by identity against _last_result.
+        self._last_coords_cache: Optional[Tuple[Table, Optional[SkyCoord]]] = None
+        self._query_cache: "OrderedDict[Hashable, Table]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._rate_limit = threading.BoundedSemaphore(self.MAX_CONCURRENT_QUERIES)
 
     @abstractmethod
     def query_region(
@@ -96,7 +138,69 @@ class CatalogBase(ABC):
         """
         pass
 
-    def get_coordinates(self, table: Table) -> Optional[List[SkyCoord]]:
+    def query_region_batch(
+        self,
+        coords: SkyCoord,
+        radius: u.Quantity,
+        max_workers: int = 8,
+        **kwargs: Any,
+    ) -> Optional[Table]:
+        """
+        Query a region around each of several positions concurrently.
+
+        Parameters
+        ----------
+        coords : SkyCoord
+            Center coordinates, one query each.
+        radius : Quantity
+            Search radius for every query.
+        max_workers : int, optional
+            Largest number of queries run at once. Default is 8; the
+            catalog's ``MAX_CONCURRENT_QUERIES`` also applies.
+        **kwargs : Any
+            Additional query parameters passed to ``query_region``.
+
+        Returns
+        -------
+        Table or None
+            The non-empty results stacked in input order, or None if no
+            query returned any rows.
+        """
+        positions = [coords] if coords.isscalar else [coords[i] for i in range(len(coords))]
+
+        def _query(coord: SkyCoord) -> Optional[Table]:
+            with self._rate_limit:
+                return self.query_region(coord, radius, **kwargs)
+
+        tables = [
+            table
+            for table in fanout(_query, positions, max_workers)
+            if table is not None and len(table) > 0
+        ]
+        if not tables:
+            result = None
+        elif len(tables) == 1:
+            result = tables[0]
+        else:
+            result = vstack(tables, metadata_conflicts="silent")
+        self._last_result = result
+        return result
+
+    @property
+    def disk_cache_dir(self) -> Path:
+        """Return the directory holding this catalog's cached results."""
+        return _cache.CACHE_ROOT / self.name.lower()
+
+    def _disk_cache_fields(self, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return settings beyond the query arguments that shape results.
+
+        They become part of the disk cache key. Returning None skips the
+        disk cache for this query.
+        """
+        return {}
+
+    def get_coordinates(self, table: Table) -> Optional[SkyCoord]:
         """
         Extract coordinates from result table.
 
@@ -107,42 +211,263 @@ class CatalogBase(ABC):
 
         Returns
         -------
-        list of SkyCoord or None
-            List of coordinates or None if extraction fails.
+        SkyCoord or None
+            Array-valued coordinates of the rows with valid positions, or
+            None if extraction fails.
         """
-        ra_col: Optional[str] = None
-        dec_col: Optional[str] = None
-
-        for col in table.colnames:
-            col_lower = col.lower()
-            if col_lower in ("ra", "_ra", "raj2000", "ra_icrs"):
-                ra_col = col
-            elif col_lower in ("dec", "_dec", "dej2000", "de", "dec_icrs"):
-                dec_col = col
+        if table is not None and table is self._last_result:
+            return self.last_coords
 
+        ra_col, dec_col = resolve_radec_columns(table)
         if ra_col is None or dec_col is None:
             return None
 
-        coords: List[SkyCoord] = []
-        for row in table:
-            try:
-                coord = SkyCoord(
-                    ra=row[ra_col],
-                    dec=row[dec_col],
-                    unit=(u.deg, u.deg),
-                    frame="icrs",
-                )
-                coords.append(coord)
-            except Exception:
-                continue
-
-        return coords if coords else None
+        return coords_from_columns(table[ra_col], table[dec_col])
 
     @property
     def last_result(self) -> Optional[Table]:
         """Return the last query result."""
         return self._last_result
 
+    @property
+    def last_coords(self) -> Optional[SkyCoord]:
+        """
+        Return the coordinates of the last query result.
+
+        They are extracted on first access and reused until the result
+        changes, so every consumer of one query shares a single SkyCoord.
+        """
+        table = self._last_result
+        if table is None:
+            return None
+        cached = self._last_coords_cache
+        if cached is None or cached[0] is not table:
+            ra_col, dec_col = resolve_radec_columns(table)
+            coords = None
+            if ra_col is not None and dec_col is not None:
+                coords = coords_from_columns(table[ra_col], table[dec_col])
+            cached = self._last_coords_cache = (table, coords)
+        return cached[1]
+
+    def _cached_query(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Optional[Table]],
+    ) -> Optional[Table]:
+        """
+        Return the result for ``key``, calling ``fetch`` only on a cache miss.
+
+        Results are kept in a least-recently-used cache of
+        ``QUERY_CACHE_SIZE`` entries, so repeating a query skips the
+        network round trip. Callers always receive a copy, leaving the
+        cached table untouched by later edits. Failed queries (``None``)
+        are not cached. Safe to call from several threads.
+
+        Parameters
+        ----------
+        key : hashable
+            Identifies the query, e.g. service URL, position and options.
+        fetch : callable
+            Performs the query and returns its table or None.
+
+        Returns
+        -------
+        Table or None
+            Copy of the (possibly cached) result.
+        """
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable query options: nothing sensible to key on.
+            return fetch()
+
+        with self._query_cache_lock:
+            table = self._query_cache.get(key)
+            if table is not None:
+                self._query_cache.move_to_end(key)
+        if table is None:
+            table = fetch()
+            if table is None:
+                return None
+            with self._query_cache_lock:
+                self._query_cache[key] = table
+                while len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        return table.copy()
+
     def clear_cache(self) -> None:
         """Clear cached results."""
         self._last_result = None
+        self._last_coords_cache = None
+        with self._query_cache_lock:
+            self._query_cache.clear()
+
+    def clear_disk_cache(self) -> None:
+        """Delete the results this catalog keeps on disk between sessions."""
+        _cache.clear_directory(self.disk_cache_dir)
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections held by this catalog."""
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
+
+def http_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """
+    Return a requests session for catalog services.
+
+    The session keeps up to ``pool_size`` keep-alive connections per host,
+    so repeated queries skip the TCP and TLS handshakes, and retries
+    rate-limited or transient server errors with backoff.
+
+    Parameters
+    ----------
+    pool_size : int, optional
+        Connections kept per host.
+
+    Returns
+    -------
+    requests.Session
+        Configured session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def drop_empty_masks(table: Table) -> Table:
+    """
+    Replace masked columns that have no masked entries by plain columns.
+
+    VOTable parsing makes every column masked, and row selection, sorting
+    and arithmetic on masked columns pay for the mask on every operation
+    even when nothing is masked. The table is modified in place.
+
+    Parameters
+    ----------
+    table : Table
+        Catalog table.
+
+    Returns
+    -------
+    Table
+        The same table, for chaining.
+    """
+    for name in table.colnames:
+        column = table[name]
+        if isinstance(column, MaskedColumn) and not column.mask.any():
+            table.replace_column(name, column.filled())
+    return table
+
+
+def resolve_radec_columns(table: Table) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find the RA and Dec columns of a catalog table.
+
+    When several columns match an alias, the last one wins. The result is
+    cached per table until its column names change.
+
+    Parameters
+    ----------
+    table : Table
+        Catalog table.
+
+    Returns
+    -------
+    tuple
+        (ra_col, dec_col), either of which is None if not found.
+    """
+    colnames = tuple(table.colnames)
+    cached = _COLUMN_CACHE.get(id(table))
+    if cached is not None and cached[0]() is table and cached[1] == colnames:
+        return cached[2]
+
+    ra_col: Optional[str] = None
+    dec_col: Optional[str] = None
+    for col in colnames:
+        col_lower = col.lower()
+        if col_lower in _RA_ALIASES:
+            ra_col = col
+        elif col_lower in _DEC_ALIASES:
+            dec_col = col
+
+    key = id(table)
+    if cached is None or cached[0]() is not table:
+        weakref.finalize(table, _COLUMN_CACHE.pop, key, None)
+    _COLUMN_CACHE[key] = (weakref.ref(table), colnames, (ra_col, dec_col))
+    return ra_col, dec_col
+
+
+def column_degrees(column: Column) -> NDArray[np.float64]:
+    """
+    Return a coordinate column as float degrees.
+
+    Masked entries, and strings that cannot be parsed as an angle in
+    degrees, become NaN.
+
+    Parameters
+    ----------
+    column : Column
+        Right ascension or declination column, numeric or text.
+
+    Returns
+    -------
+    NDArray
+        One value per row, in degrees.
+    """
+    try:
+        return np.ma.filled(np.ma.asarray(column, dtype=float), np.nan)
+    except (TypeError, ValueError):
+        pass
+
+    # Mixed columns: plain numbers go through float(), which is two orders
+    # of magnitude cheaper than Angle, leaving Angle for sexagesimal text.
+    degrees = np.full(len(column), np.nan)
+    for i, value in enumerate(column.tolist()):
+        try:
+            degrees[i] = float(value)
+            continue
+        except (TypeError, ValueError):
+            pass
+        try:
+            degrees[i] = Angle(value, unit=u.deg).deg
+        except Exception:
+            continue
+    return degrees
+
+
+def coords_from_columns(ra: Column, dec: Column) -> Optional[SkyCoord]:
+    """
+    Build one array-valued ICRS SkyCoord from RA and Dec columns in degrees.
+
+    Rows with missing, non-finite or out-of-range positions are dropped.
+
+    Parameters
+    ----------
+    ra, dec : Column
+        Right ascension and declination columns, in degrees.
+
+    Returns
+    -------
+    SkyCoord or None
+        Coordinates of the valid rows, or None if there are none.
+    """
+    ra_deg = column_degrees(ra)
+    dec_deg = column_degrees(dec)
+    valid = np.isfinite(ra_deg) & (np.abs(dec_deg) <= 90)
+    if not valid.all():
+        if not valid.any():
+            return None
+        ra_deg, dec_deg = ra_deg[valid], dec_deg[valid]
+    return SkyCoord(ra=ra_deg, dec=dec_deg, unit=(u.deg, u.deg), frame="icrs")
@@ -21,13 +21,19 @@ Catalog overlay display for DS9 visualization.
 Author: Yogesh Wadadekar
 """
 
-from typing import Optional, List, Dict, Any, Tuple
+import logging
+import os
+import string
+import tempfile
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
 from astropy.coordinates import SkyCoord
 from astropy.table import Table
-import astropy.units as u
+
+from .catalog_base import CatalogBase, coords_from_columns, resolve_radec_columns
 
 
 class MarkerShape(Enum):
@@ -42,9 +48,14 @@ class MarkerShape(Enum):
     POINT = "point"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MarkerStyle:
-    """Style configuration for catalog markers."""
+    """
+    Style configuration for catalog markers.
+
+    Styles are immutable and hashable so that they can key the per-overlay
+    render cache; use ``dataclasses.replace`` to derive a modified style.
+    """
 
     shape: MarkerShape = MarkerShape.CIRCLE
     color: str = "green"
@@ -55,20 +66,53 @@ class MarkerStyle:
     label_column: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CatalogOverlay:
     """Container for catalog overlay data."""
 
     name: str
     table: Table
-    coords: List[SkyCoord]
+    coords: SkyCoord
     style: MarkerStyle = field(default_factory=MarkerStyle)
     visible: bool = True
+    _rendered: Optional[str] = field(default=None, repr=False, compare=False)
+    _render_key: Optional[Tuple[Any, ...]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def invalidate(self) -> None:
+        """Discard the cached region text."""
+        self._rendered = None
+        self._render_key = None
+
+
+# Shape template fields that vary per marker; the others depend only on
+# the style.
+_POINT_FIELDS = ("ra", "dec", "ra_lo", "ra_hi", "dec_lo", "dec_hi")
 
 
 class CatalogDisplay:
     """Class for rendering catalog overlays on DS9."""
 
+    _HEADER = (
+        "# Region file format: DS9 version 4.1\n"
+        "global color=green dashlist=8 3 width=1\n"
+        "fk5"
+    )
+
+    # DS9 region templates keyed by MarkerShape member, so dispatch is a
+    # single identity hash. Diamonds are drawn as polygons offset by the
+    # marker size in degrees.
+    _SHAPE_TEMPLATES: Dict[MarkerShape, str] = {
+        MarkerShape.CIRCLE: 'circle({ra},{dec},{size}")',
+        MarkerShape.BOX: 'box({ra},{dec},{size}",{size}",0)',
+        MarkerShape.DIAMOND: "polygon({ra},{dec_lo},{ra_hi},{dec},{ra},{dec_hi},{ra_lo},{dec})",
+        MarkerShape.CROSS: 'cross({ra},{dec},{size}")',
+        MarkerShape.X: 'x({ra},{dec},{size}")',
+        MarkerShape.ELLIPSE: 'ellipse({ra},{dec},{size}",{half_size}",0)',
+        MarkerShape.POINT: "point({ra},{dec})",
+    }
+
     def __init__(self, ds9_instance: Any = None) -> None:
         """
         Initialize catalog display.
@@ -79,6 +123,7 @@ class CatalogDisplay:
             DS9 connection instance.
         """
         self.ds9: Any = ds9_instance
+        self._logger: logging.Logger = logging.getLogger(__name__)
         self._overlays: Dict[str, CatalogOverlay] = {}
         self._default_style: MarkerStyle = MarkerStyle()
 
@@ -86,8 +131,9 @@ class CatalogDisplay:
         self,
         name: str,
         table: Table,
-        coords: Optional[List[SkyCoord]] = None,
+        coords: Optional[Union[SkyCoord, List[SkyCoord]]] = None,
         style: Optional[MarkerStyle] = None,
+        source: Optional[CatalogBase] = None,
     ) -> bool:
         """
         Add a catalog overlay.
@@ -98,10 +144,13 @@ class CatalogDisplay:
             Unique name for the overlay.
         table : Table
             Catalog result table.
-        coords : list of SkyCoord, optional
+        coords : SkyCoord or list of SkyCoord, optional
             Pre-extracted coordinates. If None, will attempt extraction.
         style : MarkerStyle, optional
             Marker style configuration.
+        source : CatalogBase, optional
+            Catalog that produced ``table``. If ``table`` is its last
+            result, the coordinates it already extracted are reused.
 
         Returns
         -------
@@ -109,10 +158,19 @@ class CatalogDisplay:
             True if overlay was added successfully.
         """
         if coords is None:
-            coords = self._extract_coordinates(table)
+            if source is not None and source.last_result is table:
+                coords = source.last_coords
+            else:
+                coords = self._extract_coordinates(table)
             if coords is None:
-                print(f"Could not extract coordinates from table for {name}")
+                self._logger.warning(
+                    "Could not extract coordinates from table for %s", name
+                )
                 return False
+        elif not isinstance(coords, SkyCoord):
+            coords = SkyCoord(coords)
+        if coords.isscalar:
+            coords = coords.reshape((1,))
 
         overlay = CatalogOverlay(
             name=name,
@@ -147,16 +205,19 @@ class CatalogDisplay:
         """Set overlay visibility to True."""
         if name in self._overlays:
             self._overlays[name].visible = True
+            self._overlays[name].invalidate()
 
     def hide_overlay(self, name: str) -> None:
         """Set overlay visibility to False."""
         if name in self._overlays:
             self._overlays[name].visible = False
+            self._overlays[name].invalidate()
 
     def set_style(self, name: str, style: MarkerStyle) -> None:
         """Set marker style for an overlay."""
         if name in self._overlays:
             self._overlays[name].style = style
+            self._overlays[name].invalidate()
 
     def render(self, overlay_name: Optional[str] = None) -> str:
         """
@@ -172,115 +233,128 @@ class CatalogDisplay:
         str
             DS9 region format string.
         """
-        regions: List[str] = []
-        regions.append("# Region file format: DS9 version 4.1")
-        regions.append("global color=green dashlist=8 3 width=1")
-        regions.append("fk5")
-
-        overlays = (
-            [self._overlays[overlay_name]]
-            if overlay_name and overlay_name in self._overlays
-            else self._overlays.values()
-        )
+        overlays = self._overlays_to_render(overlay_name)
+        if not overlays:
+            return self._HEADER
+        return "\n".join(self.render_iter(overlay_name))
 
-        for overlay in overlays:
-            if not overlay.visible:
-                continue
+    def render_iter(self, overlay_name: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield the DS9 region output in blocks.
 
-            style = overlay.style
-            for i, coord in enumerate(overlay.coords):
-                region = self._format_region(coord, style, overlay, i)
-                regions.append(region)
+        The header comes first, followed by one block of region lines per
+        rendered overlay. Blocks carry no trailing newline; joining them
+        with newlines gives the output of ``render``.
 
-        return "\n".join(regions)
+        Parameters
+        ----------
+        overlay_name : str, optional
+            Specific overlay to render. If None, renders all visible.
 
-    def _format_region(
-        self,
-        coord: SkyCoord,
-        style: MarkerStyle,
-        overlay: CatalogOverlay,
-        index: int,
-    ) -> str:
-        """Format a single region entry."""
-        ra = coord.ra.deg
-        dec = coord.dec.deg
-        shape = style.shape.value
-        color = style.color
-        size = style.size
-
-        if shape == "circle":
-            region = f"circle({ra},{dec},{size}\")"
-        elif shape == "box":
-            region = f"box({ra},{dec},{size}\",{size}\",0)"
-        elif shape == "diamond":
-            region = f"polygon({ra},{dec-size/3600},{ra+size/3600},{dec},{ra},{dec+size/3600},{ra-size/3600},{dec})"
-        elif shape == "cross":
-            region = f"cross({ra},{dec},{size}\")"
-        elif shape == "x":
-            region = f"x({ra},{dec},{size}\")"
-        elif shape == "ellipse":
-            region = f"ellipse({ra},{dec},{size}\",{size/2}\",0)"
-        elif shape == "point":
-            region = f"point({ra},{dec})"
-        else:
-            region = f"circle({ra},{dec},{size}\")"
-
-        props = f" # color={color} width={style.width}"
+        Yields
+        ------
+        str
+            Header or overlay region block.
+        """
+        yield self._HEADER
+        for overlay in self._overlays_to_render(overlay_name):
+            text = self._overlay_text(overlay)
+            if text:
+                yield text
+
+    def _overlays_to_render(self, overlay_name: Optional[str]) -> List[CatalogOverlay]:
+        """Return the overlays selected by ``overlay_name`` that are visible."""
+        if overlay_name and overlay_name in self._overlays:
+            overlay = self._overlays[overlay_name]
+            return [overlay] if overlay.visible else []
+        # Visibility is read at render time, since ``CatalogOverlay.visible``
+        # may also be set directly on an overlay from ``get_overlay``.
+        return [overlay for overlay in self._overlays.values() if overlay.visible]
+
+    def _overlay_text(self, overlay: CatalogOverlay) -> str:
+        """
+        Return an overlay's region lines as one string, cached per overlay.
 
+        The cache is keyed on the table and coordinate objects, the row
+        count and the style, so replacing any of them re-renders. In-place
+        edits of table values are not detected; call
+        ``CatalogOverlay.invalidate`` after making them.
+        """
+        key = (id(overlay.table), len(overlay.table), id(overlay.coords), overlay.style)
+        if overlay._rendered is None or overlay._render_key != key:
+            overlay._rendered = "\n".join(self._render_overlay(overlay))
+            overlay._render_key = key
+        return overlay._rendered
+
+    def _render_overlay(self, overlay: CatalogOverlay) -> List[str]:
+        """
+        Format every marker of an overlay as a DS9 region line.
+
+        The line is specialized once per style by ``_region_line``, so each
+        marker costs a single %-format of its own coordinate values.
+        """
+        style = overlay.style
+        line, fields = _region_line(style)
+
+        # Pull coordinates out as float arrays once; per-element SkyCoord
+        # access goes through the Quantity and frame machinery every time.
+        ra = overlay.coords.ra.deg
+        dec = overlay.coords.dec.deg
+        arrays = {"ra": ra, "dec": dec}
+        if not arrays.keys() >= set(fields):
+            offset = style.size / 3600
+            arrays.update(
+                ra_lo=ra - offset,
+                ra_hi=ra + offset,
+                dec_lo=dec - offset,
+                dec_hi=dec + offset,
+            )
+        # Fields used more than once (a diamond repeats ra and dec) share
+        # one list of Python floats.
+        values = {name: arrays[name].tolist() for name in set(fields)}
+        regions = [line % args for args in zip(*(values[name] for name in fields))]
+
+        labels: List[str] = []
         if style.show_label and style.label_column:
             try:
-                label = str(overlay.table[index][style.label_column])
-                props += f' text="{label}"'
-            except (IndexError, KeyError):
+                labels = [
+                    f' text="{value}"' for value in overlay.table[style.label_column]
+                ]
+            except KeyError:
                 pass
 
-        return region + props
+        if not labels:
+            return regions
+        # Labels pair with markers by position; markers beyond the end of
+        # the table get none.
+        labels.extend([""] * (len(regions) - len(labels)))
+        return [region + label for region, label in zip(regions, labels)]
 
-    def _extract_coordinates(self, table: Table) -> Optional[List[SkyCoord]]:
+    def _extract_coordinates(self, table: Table) -> Optional[SkyCoord]:
         """Extract coordinates from table."""
-        ra_col: Optional[str] = None
-        dec_col: Optional[str] = None
-
-        for col in table.colnames:
-            col_lower = col.lower()
-            if col_lower in ("ra", "_ra", "raj2000", "ra_icrs", "ra_j2000"):
-                ra_col = col
-            elif col_lower in (
-                "dec",
-                "_dec",
-                "dej2000",
-                "de",
-                "dec_icrs",
-                "dec_j2000",
-            ):
-                dec_col = col
-
+        ra_col, dec_col = resolve_radec_columns(table)
         if ra_col is None or dec_col is None:
             return None
 
-        coords: List[SkyCoord] = []
-        for row in table:
-            try:
-                coord = SkyCoord(
-                    ra=float(row[ra_col]),
-                    dec=float(row[dec_col]),
-                    unit=(u.deg, u.deg),
-                    frame="icrs",
-                )
-                coords.append(coord)
-            except Exception:
-                continue
+        return coords_from_columns(table[ra_col], table[dec_col])
 
-        return coords if coords else None
-
-    def send_to_ds9(self, overlay_name: Optional[str] = None) -> bool:
+    def send_to_ds9(
+        self, overlay_name: Optional[str] = None, via_file: bool = False
+    ) -> bool:
         """
         Send regions to DS9.
 
+        Each overlay is sent as its own ``regions`` request, so the whole
+        region text is never built as a single string.
+
         Parameters
         ----------
         overlay_name : str, optional
             Specific overlay to send. If None, sends all visible.
+        via_file : bool, optional
+            If True, write the regions to a temporary file and have DS9
+            load it. This needs DS9 to see this machine's filesystem, so
+            it does not work with remote XPA targets. Default is False.
 
         Returns
         -------
@@ -288,17 +362,45 @@ class CatalogDisplay:
             True if regions were sent successfully.
         """
         if self.ds9 is None:
-            print("No DS9 connection available")
+            self._logger.warning("No DS9 connection available")
             return False
 
         try:
-            regions = self.render(overlay_name)
-            self.ds9.set("regions", regions)
+            if via_file:
+                self._send_region_file(overlay_name)
+                return True
+
+            blocks = self.render_iter(overlay_name)
+            header = next(blocks)
+            sent = False
+            for block in blocks:
+                self.ds9.set("regions", f"{header}\n{block}")
+                sent = True
+            if not sent:
+                self.ds9.set("regions", header)
             return True
-        except Exception as e:
-            print(f"Error sending regions to DS9: {e}")
+        except Exception:
+            self._logger.exception("Error sending regions to DS9")
             return False
 
+    def _send_region_file(self, overlay_name: Optional[str]) -> None:
+        """
+        Write the regions to a temporary file and have DS9 load it.
+
+        Only usable when DS9 runs on a machine sharing this filesystem.
+        """
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".reg", delete=False, encoding="utf-8"
+        ) as handle:
+            for block in self.render_iter(overlay_name):
+                handle.write(block)
+                handle.write("\n")
+            path = handle.name
+        try:
+            self.ds9.set(f"regions load {path}")
+        finally:
+            os.unlink(path)
+
     def clear_ds9_regions(self) -> bool:
         """Clear all regions from DS9."""
         if self.ds9 is None:
@@ -307,8 +409,8 @@ class CatalogDisplay:
         try:
             self.ds9.set("regions delete all")
             return True
-        except Exception as e:
-            print(f"Error clearing DS9 regions: {e}")
+        except Exception:
+            self._logger.exception("Error clearing DS9 regions")
             return False
 
     def get_overlay_names(self) -> List[str]:
@@ -326,3 +428,29 @@ class CatalogDisplay:
     def clear_all(self) -> None:
         """Remove all overlays."""
         self._overlays.clear()
+
+
+@lru_cache(maxsize=32)
+def _region_line(style: MarkerStyle) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Specialize the DS9 region line for a marker style.
+
+    Returns a printf-style line with the shape, size terms and properties
+    baked in, and the per-marker fields that fill its ``%r`` slots, in
+    order. ``%r`` of a float is its shortest round-trip form, the same text
+    as ``str``.
+    """
+    templates = CatalogDisplay._SHAPE_TEMPLATES
+    template = templates.get(style.shape, templates[MarkerShape.CIRCLE])
+    fields = tuple(
+        name
+        for _, name, _, _ in string.Formatter().parse(template)
+        if name in _POINT_FIELDS
+    )
+    line = template.format(
+        size=style.size,
+        half_size=style.size / 2,
+        **dict.fromkeys(_POINT_FIELDS, "%r"),
+    )
+    props = f" # color={style.color} width={style.width}"
+    return line + props.replace("%", "%%"), fields
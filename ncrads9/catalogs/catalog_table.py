@@ -24,18 +24,20 @@ Author: Yogesh Wadadekar
 from typing import Optional, List, Any, Callable, Dict
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import NDArray
 from astropy.table import Table
 from astropy.coordinates import SkyCoord
 import astropy.units as u
 
+from .catalog_base import column_degrees, resolve_radec_columns
+
 try:
     from PyQt6.QtWidgets import (
-        QTableWidget,
-        QTableWidgetItem,
+        QTableView,
         QHeaderView,
         QAbstractItemView,
         QMenu,
-        QAction,
         QWidget,
         QVBoxLayout,
         QHBoxLayout,
@@ -43,16 +45,35 @@ try:
         QLabel,
         QLineEdit,
         QComboBox,
+        QStyledItemDelegate,
+        QStyleOptionViewItem,
     )
-    from PyQt6.QtCore import Qt, pyqtSignal
+    from PyQt6.QtGui import QAction
+    from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, pyqtSignal
 
     HAS_QT = True
 except ImportError:
     HAS_QT = False
     QWidget = object  # type: ignore
+    QAbstractTableModel = object  # type: ignore
+    QStyledItemDelegate = object  # type: ignore
     pyqtSignal = None  # type: ignore
 
 
+# Delay after the last keystroke before the filter is re-applied, in ms.
+_FILTER_DELAY_MS = 150
+
+# Upper limit on the initial width of a column, in pixels.
+_MAX_COLUMN_WIDTH = 300
+
+# Number of leading rows formatted to choose initial column widths.
+_WIDTH_SAMPLE_ROWS = 200
+
+# Model role returning a cell's (text, alignment) in one call; see
+# CatalogItemDelegate.
+MULTIPLE_ROLES_ROLE = int(Qt.ItemDataRole.UserRole) + 1 if HAS_QT else 0
+
+
 @dataclass
 class ColumnConfig:
     """Configuration for a table column."""
@@ -64,8 +85,298 @@ class ColumnConfig:
     format_func: Optional[Callable[[Any], str]] = None
 
 
+class CatalogTableModel(QAbstractTableModel if HAS_QT else object):
+    """
+    Table model exposing an astropy Table to Qt views.
+
+    The table is held by reference and each column is formatted to an
+    array of display strings the first time a view asks for one of its
+    cells, so only columns that are actually shown are ever formatted.
+    Sorting and filtering are applied through an array of
+    table row indices, one per displayed row, rather than by reordering
+    or hiding view rows.
+    """
+
+    def __init__(
+        self,
+        table: Optional[Table] = None,
+        parent: Optional[Any] = None,
+    ) -> None:
+        """
+        Initialize the model.
+
+        Parameters
+        ----------
+        table : Table, optional
+            Astropy table to expose.
+        parent : QObject, optional
+            Parent object.
+        """
+        if not HAS_QT:
+            raise ImportError("PyQt6 is required for CatalogTableModel")
+
+        super().__init__(parent)
+
+        self._table: Optional[Table] = None
+        self._colnames: List[str] = []
+        self._column_configs: Dict[str, ColumnConfig] = {}
+        self._sort_cache: Dict[str, NDArray[np.intp]] = {}
+        self._formatted: Dict[str, NDArray[np.str_]] = {}
+        self._lowered: Dict[str, NDArray[np.str_]] = {}
+        self._alignments: Dict[str, Qt.AlignmentFlag] = {}
+        self._order: NDArray[np.intp] = np.arange(0)
+        self._keep: Optional[NDArray[np.bool_]] = None
+        self._rows: NDArray[np.intp] = np.arange(0)
+
+        if table is not None:
+            self.set_table(table)
+
+    @property
+    def table(self) -> Optional[Table]:
+        """Return the underlying astropy Table."""
+        return self._table
+
+    def set_table(self, table: Optional[Table]) -> None:
+        """Replace the table, clearing any sort order and filter."""
+        self.beginResetModel()
+        self._table = table
+        self._colnames = list(table.colnames) if table is not None else []
+        self._sort_cache = {}
+        self._formatted = {}
+        self._lowered = {}
+        self._alignments = {}
+        self._order = np.arange(len(table) if table is not None else 0)
+        self._keep = None
+        self._rows = self._order
+        self.endResetModel()
+
+    def set_column_config(self, column: str, config: ColumnConfig) -> None:
+        """Set configuration for a column and refresh its cells."""
+        self._column_configs[column] = config
+        self._formatted.pop(column, None)
+        self._lowered.pop(column, None)
+        if column in self._colnames and len(self._rows):
+            col_idx = self._colnames.index(column)
+            self.dataChanged.emit(
+                self.index(0, col_idx), self.index(len(self._rows) - 1, col_idx)
+            )
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of displayed rows."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of columns."""
+        return 0 if parent.isValid() else len(self._colnames)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """
+        Return the formatted cell text or its alignment.
+
+        ``MULTIPLE_ROLES_ROLE`` returns both as a ``(text, alignment)``
+        tuple, so a delegate can fill in a cell with a single call.
+        """
+        if not index.isValid():
+            return None
+        column = self._colnames[index.column()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(self.column_text(column)[self._rows[index.row()]])
+        if role == MULTIPLE_ROLES_ROLE:
+            return (
+                str(self.column_text(column)[self._rows[index.row()]]),
+                self.column_alignment(column),
+            )
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self.column_alignment(column)
+        return None
+
+    def column_alignment(self, column: str) -> Qt.AlignmentFlag:
+        """Return the cell alignment of a column: right for numbers."""
+        alignment = self._alignments.get(column)
+        if alignment is None:
+            if self._table[column].dtype.kind in "iuf":
+                alignment = Qt.AlignmentFlag.AlignRight
+            else:
+                alignment = Qt.AlignmentFlag.AlignLeft
+            alignment |= Qt.AlignmentFlag.AlignVCenter
+            self._alignments[column] = alignment
+        return alignment
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Return column names and 1-based table row numbers as headers."""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self._colnames):
+                return self._colnames[section]
+            return None
+        if 0 <= section < len(self._rows):
+            return str(int(self._rows[section]) + 1)
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Cells are selectable but not editable."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def format_value(self, column: str, value: Any) -> str:
+        """Format a cell value for display."""
+        config = self._column_configs.get(column)
+        if config is not None and config.format_func:
+            return config.format_func(value)
+
+        if value is None:
+            return ""
+        if isinstance(value, float):
+            return f"{value:.6g}"
+        return str(value)
+
+    def column_text(self, column: str) -> NDArray[np.str_]:
+        """
+        Return the display strings of a column, formatting it on first use.
+
+        The result is cached until the table or the column's configuration
+        changes.
+        """
+        text = self._formatted.get(column)
+        if text is None:
+            text = self._format_column(column)
+            self._formatted[column] = text
+        return text
+
+    def _format_column(self, column: str) -> NDArray[np.str_]:
+        """
+        Format a whole column at once, matching ``format_value`` per cell.
+
+        Common dtypes are converted in bulk (a list comprehension over
+        ``tolist()`` floats is faster than ``np.char.mod``); anything else,
+        and columns with a custom ``format_func``, fall back to formatting
+        each value.
+        """
+        col = self._table[column]
+        config = self._column_configs.get(column)
+        data = np.ma.getdata(col)
+        if (config is not None and config.format_func) or data.ndim != 1:
+            return np.array([self.format_value(column, value) for value in col], dtype=str)
+
+        if data.dtype == np.float64:
+            text = np.array([f"{value:.6g}" for value in data.tolist()], dtype=str)
+        elif data.dtype.kind in "biuU":
+            text = data.astype(str)
+        else:
+            return np.array([self.format_value(column, value) for value in col], dtype=str)
+
+        mask = np.ma.getmask(col)
+        if mask is not np.ma.nomask and mask.any():
+            text = np.where(mask, "--", text)
+        return text
+
+    def sort(
+        self,
+        column: int,
+        order: Qt.SortOrder = Qt.SortOrder.AscendingOrder,
+    ) -> None:
+        """
+        Sort displayed rows by a column.
+
+        The ascending permutation of each column is computed once with
+        ``np.argsort`` and cached, so re-sorting costs an array reversal
+        at most.
+        """
+        if self._table is None or not 0 <= column < len(self._colnames):
+            return
+        self.layoutAboutToBeChanged.emit()
+        ascending = self._column_order(self._colnames[column])
+        if order == Qt.SortOrder.DescendingOrder:
+            ascending = ascending[::-1]
+        self._order = ascending
+        self._update_rows()
+        self.layoutChanged.emit()
+
+    def _column_order(self, column: str) -> NDArray[np.intp]:
+        """Return the cached ascending argsort of a column."""
+        order = self._sort_cache.get(column)
+        if order is None:
+            try:
+                order = np.argsort(self._table[column], kind="stable")
+            except TypeError:
+                # Mixed object columns: sort by their display text.
+                order = np.argsort(self.column_text(column), kind="stable")
+            self._sort_cache[column] = order
+        return order
+
+    def set_filter(self, column: Optional[str], text: str) -> None:
+        """
+        Show only rows whose formatted value in ``column`` contains ``text``.
+
+        The match is case-insensitive. An empty ``text`` or a missing
+        column removes the filter.
+        """
+        self.beginResetModel()
+        if self._table is None or not text or column not in self._colnames:
+            self._keep = None
+        else:
+            # The lower-cased strings are kept per column, so each keystroke
+            # costs one vectorized substring search.
+            lowered = self._lowered.get(column)
+            if lowered is None:
+                lowered = np.char.lower(self.column_text(column))
+                self._lowered[column] = lowered
+            self._keep = np.char.find(lowered, text.lower()) >= 0
+        self._update_rows()
+        self.endResetModel()
+
+    def _update_rows(self) -> None:
+        """Recompute displayed table rows from the sort order and filter."""
+        if self._keep is None:
+            self._rows = self._order
+        else:
+            self._rows = self._order[self._keep[self._order]]
+
+    def source_row(self, row: int) -> int:
+        """Return the table row index shown at a displayed row."""
+        return int(self._rows[row])
+
+    @property
+    def total_rows(self) -> int:
+        """Return the number of rows in the table, ignoring the filter."""
+        return len(self._table) if self._table is not None else 0
+
+
+class CatalogItemDelegate(QStyledItemDelegate):
+    """
+    Item delegate that reads each cell from the model in one call.
+
+    The stock delegate asks the model for every item role in turn, each a
+    round trip into Python, whenever a cell is painted or measured. Cells
+    of a ``CatalogTableModel`` only carry text and alignment, which this
+    delegate fetches together through ``MULTIPLE_ROLES_ROLE``.
+    """
+
+    def initStyleOption(self, option: "QStyleOptionViewItem", index: QModelIndex) -> None:
+        """Fill in the style option for a cell."""
+        values = index.data(MULTIPLE_ROLES_ROLE)
+        if values is None:
+            super().initStyleOption(option, index)
+            return
+        option.text, option.displayAlignment = values
+        option.index = index
+        option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+
+
 class CatalogTable(QWidget if HAS_QT else object):
-    """Widget for displaying catalog query results in a table."""
+    """
+    Widget for displaying catalog query results in a table.
+
+    Row numbers carried by the signals and accessors are indices into the
+    underlying table, independent of the current sort order and filter.
+    """
 
     if HAS_QT:
         row_selected = pyqtSignal(int)
@@ -93,10 +404,12 @@ class CatalogTable(QWidget if HAS_QT else object):
         super().__init__(parent)
 
         self._table: Optional[Table] = None
-        self._column_configs: Dict[str, ColumnConfig] = {}
+        self._ra_col: Optional[str] = None
+        self._dec_col: Optional[str] = None
+        # Coordinates of every table row, and which of them are usable.
+        self._coords: Optional[SkyCoord] = None
+        self._coords_valid: Optional[NDArray[np.bool_]] = None
         self._selected_row: int = -1
-        self._sort_column: int = -1
-        self._sort_order: Qt.SortOrder = Qt.AscendingOrder
 
         self._setup_ui()
 
@@ -119,9 +432,17 @@ class CatalogTable(QWidget if HAS_QT else object):
 
         self._filter_input = QLineEdit()
         self._filter_input.setPlaceholderText("Enter filter value...")
-        self._filter_input.textChanged.connect(self._apply_filter)
+        self._filter_input.textChanged.connect(self._schedule_filter)
         toolbar.addWidget(self._filter_input)
 
+        # Typing restarts this timer, so a burst of keystrokes filters once.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(_FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(
+            lambda: self._apply_filter(self._filter_input.text())
+        )
+
         self._clear_filter_btn = QPushButton("Clear")
         self._clear_filter_btn.clicked.connect(self._clear_filter)
         toolbar.addWidget(self._clear_filter_btn)
@@ -133,29 +454,49 @@ class CatalogTable(QWidget if HAS_QT else object):
 
         layout.addLayout(toolbar)
 
-        # Table widget
-        self._table_widget = QTableWidget()
-        self._table_widget.setAlternatingRowColors(True)
-        self._table_widget.setSelectionBehavior(
-            QAbstractItemView.SelectRows
+        # Table view; the view only requests data for visible cells.
+        self._model = CatalogTableModel(parent=self)
+        self._table_view = QTableView()
+        self._table_view.setModel(self._model)
+        self._table_view.setItemDelegate(CatalogItemDelegate(self._table_view))
+        self._table_view.setAlternatingRowColors(True)
+        self._table_view.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self._table_view.setSelectionMode(
+            QAbstractItemView.SelectionMode.SingleSelection
         )
-        self._table_widget.setSelectionMode(
-            QAbstractItemView.SingleSelection
+        self._table_view.setSortingEnabled(True)
+        self._table_view.setContextMenuPolicy(
+            Qt.ContextMenuPolicy.CustomContextMenu
         )
-        self._table_widget.setSortingEnabled(True)
-        self._table_widget.setContextMenuPolicy(Qt.CustomContextMenu)
 
-        self._table_widget.itemSelectionChanged.connect(
+        self._table_view.selectionModel().selectionChanged.connect(
             self._on_selection_changed
         )
-        self._table_widget.itemDoubleClicked.connect(
-            self._on_double_click
-        )
-        self._table_widget.customContextMenuRequested.connect(
+        self._table_view.doubleClicked.connect(self._on_double_click)
+        self._table_view.customContextMenuRequested.connect(
             self._show_context_menu
         )
 
-        layout.addWidget(self._table_widget)
+        layout.addWidget(self._table_view)
+
+        # Built once and re-shown on each right-click.
+        self._context_menu = QMenu(self)
+
+        self._copy_cell_action = QAction("Copy Cell", self)
+        self._copy_cell_action.triggered.connect(self._copy_cell)
+        self._context_menu.addAction(self._copy_cell_action)
+
+        self._copy_row_action = QAction("Copy Row", self)
+        self._copy_row_action.triggered.connect(self._copy_row)
+        self._context_menu.addAction(self._copy_row_action)
+
+        self._context_menu.addSeparator()
+
+        self._goto_action = QAction("Go to Position", self)
+        self._goto_action.triggered.connect(self._goto_position)
+        self._context_menu.addAction(self._goto_action)
 
     def set_table(self, table: Table) -> None:
         """
@@ -167,57 +508,77 @@ class CatalogTable(QWidget if HAS_QT else object):
             Astropy table to display.
         """
         self._table = table
-        self._populate_table()
+        # Resolved once per table rather than on every selection.
+        self._ra_col, self._dec_col = resolve_radec_columns(table)
+        self._build_coordinates()
+        self._selected_row = -1
+        self._filter_timer.stop()
+        self._filter_input.blockSignals(True)
+        self._filter_input.clear()
+        self._filter_input.blockSignals(False)
+        self._model.set_table(table)
+        self._table_view.horizontalHeader().setSortIndicator(
+            -1, Qt.SortOrder.AscendingOrder
+        )
+        self._fit_column_widths()
         self._update_filter_columns()
         self._update_row_count()
 
-    def _populate_table(self) -> None:
-        """Populate the table widget with data."""
+    def _fit_column_widths(self) -> None:
+        """
+        Size each column to its longest formatted value or its name.
+
+        Only the first ``_WIDTH_SAMPLE_ROWS`` rows are formatted for this,
+        so columns the user never scrolls to are still formatted lazily by
+        the model. Widths come from the string lengths of those values and
+        the font's average character width, instead of
+        ``ResizeToContents``, which measures every cell with font metrics.
+        Columns stay user-resizable afterwards.
+        """
+        header = self._table_view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         if self._table is None:
             return
-
-        self._table_widget.clear()
-        self._table_widget.setSortingEnabled(False)
-
-        # Set up columns
-        columns = self._table.colnames
-        self._table_widget.setColumnCount(len(columns))
-        self._table_widget.setHorizontalHeaderLabels(columns)
-
-        # Set up rows
-        self._table_widget.setRowCount(len(self._table))
-
-        for row_idx, row in enumerate(self._table):
-            for col_idx, col_name in enumerate(columns):
-                value = row[col_name]
-                display_value = self._format_value(col_name, value)
-                item = QTableWidgetItem(display_value)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self._table_widget.setItem(row_idx, col_idx, item)
-
-        self._table_widget.setSortingEnabled(True)
-        self._table_widget.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeToContents
-        )
+        char_width = self._table_view.fontMetrics().averageCharWidth()
+        header_metrics = header.fontMetrics()
+        sample = self._table[:_WIDTH_SAMPLE_ROWS]
+        for col_idx, name in enumerate(self._table.colnames):
+            max_len = max(
+                (len(self._model.format_value(name, value)) for value in sample[name]),
+                default=0,
+            )
+            width = max(
+                char_width * (max_len + 2),
+                header_metrics.horizontalAdvance(name) + 2 * char_width,
+            )
+            self._table_view.setColumnWidth(col_idx, min(width, _MAX_COLUMN_WIDTH))
 
     def _format_value(self, column: str, value: Any) -> str:
         """Format a cell value for display."""
-        if column in self._column_configs:
-            config = self._column_configs[column]
-            if config.format_func:
-                return config.format_func(value)
-
-        if value is None:
-            return ""
-        if isinstance(value, float):
-            return f"{value:.6g}"
-        return str(value)
+        return self._model.format_value(column, value)
 
     def _update_filter_columns(self) -> None:
-        """Update the filter column dropdown."""
-        self._filter_column.clear()
-        if self._table is not None:
-            self._filter_column.addItems(self._table.colnames)
+        """
+        Update the filter column dropdown.
+
+        Signals are blocked while the items are replaced and the selection
+        is reset, so listeners see one change of selection, to the first
+        column, rather than one per removed or added column.
+        """
+        self._filter_column.blockSignals(True)
+        try:
+            self._filter_column.clear()
+            if self._table is not None:
+                self._filter_column.addItems(list(self._table.colnames))
+            self._filter_column.setCurrentIndex(-1)
+        finally:
+            self._filter_column.blockSignals(False)
+        if self._filter_column.count():
+            self._filter_column.setCurrentIndex(0)
+
+    def _schedule_filter(self, text: str) -> None:
+        """Re-apply the filter once typing pauses."""
+        self._filter_timer.start()
 
     def _apply_filter(self, text: str) -> None:
         """Apply filter to table rows."""
@@ -225,47 +586,36 @@ class CatalogTable(QWidget if HAS_QT else object):
             self._show_all_rows()
             return
 
-        column = self._filter_column.currentText()
-        col_idx = self._filter_column.currentIndex()
-
-        for row in range(self._table_widget.rowCount()):
-            item = self._table_widget.item(row, col_idx)
-            if item is None:
-                continue
-            match = text.lower() in item.text().lower()
-            self._table_widget.setRowHidden(row, not match)
-
+        self._model.set_filter(self._filter_column.currentText(), text)
         self._update_row_count()
 
     def _clear_filter(self) -> None:
         """Clear the filter."""
+        self._filter_timer.stop()
+        self._filter_input.blockSignals(True)
         self._filter_input.clear()
+        self._filter_input.blockSignals(False)
         self._show_all_rows()
 
     def _show_all_rows(self) -> None:
         """Show all rows."""
-        for row in range(self._table_widget.rowCount()):
-            self._table_widget.setRowHidden(row, False)
+        self._model.set_filter(None, "")
         self._update_row_count()
 
     def _update_row_count(self) -> None:
         """Update the row count label."""
-        total = self._table_widget.rowCount()
-        visible = sum(
-            1
-            for row in range(total)
-            if not self._table_widget.isRowHidden(row)
-        )
+        total = self._model.total_rows
+        visible = self._model.rowCount()
         if visible == total:
             self._row_count_label.setText(f"{total} rows")
         else:
             self._row_count_label.setText(f"{visible}/{total} rows")
 
-    def _on_selection_changed(self) -> None:
+    def _on_selection_changed(self, *args: Any) -> None:
         """Handle row selection change."""
-        selected = self._table_widget.selectedItems()
+        selected = self._table_view.selectionModel().selectedRows()
         if selected:
-            row = selected[0].row()
+            row = self._model.source_row(selected[0].row())
             self._selected_row = row
             self.row_selected.emit(row)
 
@@ -273,48 +623,32 @@ class CatalogTable(QWidget if HAS_QT else object):
             if coord is not None:
                 self.coord_selected.emit(coord)
 
-    def _on_double_click(self, item: QTableWidgetItem) -> None:
+    def _on_double_click(self, index: QModelIndex) -> None:
         """Handle row double-click."""
-        self.row_double_clicked.emit(item.row())
+        self.row_double_clicked.emit(self._model.source_row(index.row()))
 
     def _show_context_menu(self, pos: Any) -> None:
         """Show context menu."""
-        menu = QMenu(self)
-
-        copy_action = QAction("Copy Cell", self)
-        copy_action.triggered.connect(self._copy_cell)
-        menu.addAction(copy_action)
-
-        copy_row_action = QAction("Copy Row", self)
-        copy_row_action.triggered.connect(self._copy_row)
-        menu.addAction(copy_row_action)
-
-        menu.addSeparator()
-
-        goto_action = QAction("Go to Position", self)
-        goto_action.triggered.connect(self._goto_position)
-        menu.addAction(goto_action)
-
-        menu.exec_(self._table_widget.mapToGlobal(pos))
+        self._context_menu.exec(self._table_view.viewport().mapToGlobal(pos))
 
     def _copy_cell(self) -> None:
         """Copy selected cell to clipboard."""
-        selected = self._table_widget.selectedItems()
-        if selected:
+        index = self._table_view.currentIndex()
+        if index.isValid():
             from PyQt6.QtWidgets import QApplication
 
-            QApplication.clipboard().setText(selected[0].text())
+            QApplication.clipboard().setText(str(index.data()))
 
     def _copy_row(self) -> None:
         """Copy selected row to clipboard."""
-        if self._selected_row < 0:
+        if self._table is None or self._selected_row < 0:
             return
 
-        values = []
-        for col in range(self._table_widget.columnCount()):
-            item = self._table_widget.item(self._selected_row, col)
-            if item:
-                values.append(item.text())
+        # Column-wise access to the model's formatted strings; no Row objects.
+        values = [
+            str(self._model.column_text(col)[self._selected_row])
+            for col in self._table.colnames
+        ]
 
         from PyQt6.QtWidgets import QApplication
 
@@ -327,30 +661,37 @@ class CatalogTable(QWidget if HAS_QT else object):
             if coord is not None:
                 self.coord_selected.emit(coord)
 
-    def _get_row_coordinate(self, row: int) -> Optional[SkyCoord]:
-        """Get coordinate for a table row."""
-        if self._table is None:
-            return None
-
-        ra_col: Optional[str] = None
-        dec_col: Optional[str] = None
-
-        for col in self._table.colnames:
-            col_lower = col.lower()
-            if col_lower in ("ra", "_ra", "raj2000", "ra_icrs"):
-                ra_col = col
-            elif col_lower in ("dec", "_dec", "dej2000", "de", "dec_icrs"):
-                dec_col = col
-
-        if ra_col is None or dec_col is None:
-            return None
+    def _build_coordinates(self) -> None:
+        """
+        Build one array-valued SkyCoord covering every table row.
 
+        Selecting a row then indexes into it instead of constructing a
+        new SkyCoord. Rows without a valid position hold a placeholder
+        and are flagged in ``_coords_valid``.
+        """
+        self._coords = self._coords_valid = None
+        if self._table is None or self._ra_col is None or self._dec_col is None:
+            return
         try:
-            ra = float(self._table[row][ra_col])
-            dec = float(self._table[row][dec_col])
-            return SkyCoord(ra=ra, dec=dec, unit=(u.deg, u.deg), frame="icrs")
+            ra = column_degrees(self._table[self._ra_col])
+            dec = column_degrees(self._table[self._dec_col])
+            valid = np.isfinite(ra) & np.isfinite(dec) & (np.abs(dec) <= 90.0)
+            self._coords = SkyCoord(
+                ra=np.where(valid, ra, 0.0) * u.deg,
+                dec=np.where(valid, dec, 0.0) * u.deg,
+                frame="icrs",
+            )
+            self._coords_valid = valid
         except Exception:
+            self._coords = self._coords_valid = None
+
+    def _get_row_coordinate(self, row: int) -> Optional[SkyCoord]:
+        """Get coordinate for a table row."""
+        if self._coords is None or not 0 <= row < len(self._coords_valid):
             return None
+        if not self._coords_valid[row]:
+            return None
+        return self._coords[row]
 
     def get_selected_row(self) -> int:
         """Return the currently selected row index."""
@@ -362,23 +703,33 @@ class CatalogTable(QWidget if HAS_QT else object):
             return None
 
         return {
-            col: self._table[self._selected_row][col]
+            col: self._table[col][self._selected_row]
             for col in self._table.colnames
         }
 
     def set_column_config(self, column: str, config: ColumnConfig) -> None:
         """Set configuration for a column."""
-        self._column_configs[column] = config
+        self._model.set_column_config(column, config)
 
     def get_table(self) -> Optional[Table]:
         """Return the underlying astropy Table."""
         return self._table
 
     def clear(self) -> None:
-        """Clear the table display."""
+        """
+        Clear the table display.
+
+        The model is reset in one step; no per-cell work is done. Any
+        pending filter is dropped along with its text.
+        """
         self._table = None
-        self._table_widget.clear()
-        self._table_widget.setRowCount(0)
-        self._table_widget.setColumnCount(0)
+        self._ra_col = self._dec_col = None
+        self._coords = self._coords_valid = None
+        self._selected_row = -1
+        self._filter_timer.stop()
+        self._filter_input.blockSignals(True)
+        self._filter_input.clear()
+        self._filter_input.blockSignals(False)
+        self._model.set_table(None)
         self._filter_column.clear()
         self._row_count_label.setText("0 rows")
@@ -21,7 +21,10 @@ Virtual Observatory cone search implementation.
 Author: Yogesh Wadadekar
 """
 
-from typing import Optional, List, Any
+import logging
+import time
+from pathlib import Path
+from typing import IO, Optional, List, Any, Union
 from urllib.parse import urlencode
 import requests
 
@@ -30,7 +33,25 @@ from astropy.table import Table
 from astropy.io.votable import parse_single_table
 import astropy.units as u
 
-from .catalog_base import CatalogBase
+from . import _cache
+from ._names import resolve_name
+from ._parallel import fanout
+from .catalog_base import CatalogBase, drop_empty_masks, http_session
+
+
+# Upper bound on concurrent requests made by search_multiple; also the size
+# of the session's per-host connection pool.
+_MAX_PARALLEL_QUERIES = 16
+
+# Query parameter through which each known service accepts a list of
+# output columns.
+_COLUMN_PARAMS = {
+    "vizier": "-out",
+    "heasarc": "fields",
+}
+
+# Default location of the on-disk result cache.
+DEFAULT_CACHE_DIR = _cache.CACHE_ROOT / "cone"
 
 
 class ConeSearch(CatalogBase):
@@ -44,11 +65,16 @@ class ConeSearch(CatalogBase):
         "ned": "https://ned.ipac.caltech.edu/cgi-bin/NEDobjsearch",
     }
 
+    # Seconds for which a validate_service answer is reused.
+    VALIDATE_CACHE_TTL: float = 60.0
+
     def __init__(
         self,
         url: Optional[str] = None,
         service_name: Optional[str] = None,
         timeout: int = 60,
+        cache_dir: Optional[Union[str, Path]] = DEFAULT_CACHE_DIR,
+        prefer_csv: bool = False,
     ) -> None:
         """
         Initialize cone search.
@@ -61,6 +87,15 @@ class ConeSearch(CatalogBase):
             Name of a known service (vizier, heasarc, mast, ned).
         timeout : int, optional
             Request timeout in seconds. Default is 60.
+        cache_dir : str or Path, optional
+            Directory in which parsed results are kept between sessions.
+            None disables the disk cache.
+        prefer_csv : bool, optional
+            Ask the service for CSV (``FORMAT=csv``) instead of VOTable.
+            CSV parses about ten times faster but carries no units or
+            descriptions. Services that reject the parameter are queried
+            again without it, and VOTable replies are still accepted.
+            Default is False.
         """
         super().__init__(
             name="ConeSearch",
@@ -75,13 +110,23 @@ class ConeSearch(CatalogBase):
             self.url = self.KNOWN_SERVICES["vizier"]
 
         self.timeout: int = timeout
-        self._session: requests.Session = requests.Session()
+        self.prefer_csv: bool = prefer_csv
+        self._cache_dir: Optional[Path] = (
+            Path(cache_dir) if cache_dir is not None else None
+        )
+        self.disk_cache = self._cache_dir is not None
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        # URL -> (time.monotonic() of the check, service responded).
+        self._validate_cache: dict = {}
+        # Keep enough pooled connections for concurrent searches.
+        self._session: requests.Session = http_session(_MAX_PARALLEL_QUERIES)
 
     def query_region(
         self,
         coord: SkyCoord,
         radius: u.Quantity,
         catalog: Optional[str] = None,
+        columns: Optional[List[str]] = None,
         **kwargs: Any,
     ) -> Optional[Table]:
         """
@@ -95,6 +140,10 @@ class ConeSearch(CatalogBase):
             Search radius with angular units.
         catalog : str, optional
             Catalog identifier (service-specific).
+        columns : list of str, optional
+            Output columns to request, for services that support choosing
+            them (VizieR ``-out``, HEASARC ``fields``). Fewer columns mean
+            a smaller reply and a faster parse. Ignored for other services.
         **kwargs : Any
             Additional query parameters.
 
@@ -103,6 +152,23 @@ class ConeSearch(CatalogBase):
         Table or None
             Result table or None if no results.
         """
+        table = self._search(coord, radius, catalog, columns, **kwargs)
+        self._last_result = table
+        return table
+
+    def _search(
+        self,
+        coord: SkyCoord,
+        radius: u.Quantity,
+        catalog: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> Optional[Table]:
+        """
+        Run one cone search without touching ``_last_result``.
+
+        Safe to call from several threads at once.
+        """
         try:
             ra = coord.ra.deg
             dec = coord.dec.deg
@@ -117,28 +183,114 @@ class ConeSearch(CatalogBase):
             if catalog:
                 params["catalog"] = catalog
 
+            if self.prefer_csv:
+                params["FORMAT"] = "csv"
+
+            if columns:
+                column_param = self._column_param()
+                if column_param is not None:
+                    params[column_param] = ",".join(columns)
+                else:
+                    self._logger.debug(
+                        "%s does not support column selection", self.url
+                    )
+
             params.update(kwargs)
 
-            response = self._session.get(
+            # Positions are quantized to ~4 mas so that re-selecting the same
+            # object hits the cache despite float noise in the coordinates.
+            key = (
+                "region",
                 self.url,
-                params=params,
-                timeout=self.timeout,
+                round(ra, 6),
+                round(dec, 6),
+                round(sr, 6),
+                catalog,
+                params.get("FORMAT"),
+                tuple(columns) if columns else None,
+                tuple(sorted(kwargs.items())),
+            )
+            return self._cached_query(
+                key, lambda: self._fetch_with_disk_cache(key, params)
             )
-            response.raise_for_status()
-
-            table = self._parse_votable(response.content)
-            self._last_result = table
-            return table
 
         except requests.RequestException as e:
             print(f"Cone search request error: {e}")
-            self._last_result = None
             return None
         except Exception as e:
             print(f"Cone search error: {e}")
-            self._last_result = None
             return None
 
+    def _column_param(self) -> Optional[str]:
+        """Return the column-selection parameter of the current service."""
+        for name, url in self.KNOWN_SERVICES.items():
+            if url == self.url:
+                return _COLUMN_PARAMS.get(name)
+        return None
+
+    def _fetch_with_disk_cache(self, key: tuple, params: dict) -> Optional[Table]:
+        """
+        Return the result for ``key`` from disk, or fetch and store it.
+
+        Shares the expiry and storage of the other catalogs' disk caches.
+        Problems with the cache directory only cost the cache, never the
+        query.
+        """
+        if self._cache_dir is None:
+            return self._fetch(params)
+
+        path = self._cache_dir / f"{_cache.cache_key(query=key)}.fits"
+        return _cache.fetch_cached(path, lambda: self._fetch(params))
+
+    @property
+    def disk_cache_dir(self) -> Path:
+        """Return the directory holding cached cone search results."""
+        return self._cache_dir if self._cache_dir is not None else DEFAULT_CACHE_DIR
+
+    def _fetch(self, params: dict) -> Optional[Table]:
+        """
+        Send one cone search request and parse the table it returns.
+
+        When the server announces the body length, a VOTable is parsed
+        straight from the socket as it downloads, so the full body is
+        never held in memory alongside the parsed table. Chunked replies
+        without a length are buffered first. requests already asks for
+        gzip; ``decode_content`` has urllib3 inflate the raw stream.
+
+        CSV and TSV replies, chosen by their Content-Type, go to the
+        fast astropy ASCII reader instead. A request that asked for
+        CSV and was refused with HTTP 400 is sent again without
+        ``FORMAT``.
+        """
+        response = self._session.get(
+            self.url,
+            params=params,
+            timeout=self.timeout,
+            stream=True,
+        )
+        if response.status_code == 400 and "FORMAT" in params:
+            response.close()
+            params = {k: v for k, v in params.items() if k != "FORMAT"}
+            response = self._session.get(
+                self.url,
+                params=params,
+                timeout=self.timeout,
+                stream=True,
+            )
+        try:
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "").lower()
+            if "csv" in content_type:
+                return self._parse_delimited(response.content, "ascii.csv")
+            if "tab-separated" in content_type:
+                return self._parse_delimited(response.content, "ascii.tab")
+            if "Content-Length" in response.headers:
+                response.raw.decode_content = True
+                return self._parse_votable(response.raw)
+            return self._parse_votable(response.content)
+        finally:
+            response.close()
+
     def query_object(
         self,
         name: str,
@@ -163,21 +315,21 @@ class ConeSearch(CatalogBase):
             Result table or None if no results.
         """
         try:
-            coord = SkyCoord.from_name(name)
+            coord = resolve_name(name)
             return self.query_region(coord, radius=radius, **kwargs)
         except Exception as e:
             print(f"Object name resolution error: {e}")
             self._last_result = None
             return None
 
-    def _parse_votable(self, content: bytes) -> Optional[Table]:
+    def _parse_votable(self, content: Union[bytes, IO[bytes]]) -> Optional[Table]:
         """
         Parse VOTable from response content.
 
         Parameters
         ----------
-        content : bytes
-            Response content.
+        content : bytes or file-like
+            Response content, or a binary stream to read it from.
 
         Returns
         -------
@@ -186,13 +338,42 @@ class ConeSearch(CatalogBase):
         """
         from io import BytesIO
 
+        if isinstance(content, bytes):
+            content = BytesIO(content)
         try:
-            votable = parse_single_table(BytesIO(content))
-            return votable.to_table()
+            votable = parse_single_table(content)
+            return drop_empty_masks(votable.to_table())
         except Exception as e:
             print(f"VOTable parse error: {e}")
             return None
 
+    def _parse_delimited(self, content: bytes, fmt: str) -> Optional[Table]:
+        """
+        Parse a CSV or TSV reply with astropy's C reader.
+
+        Parameters
+        ----------
+        content : bytes
+            Response content.
+        fmt : str
+            ``"ascii.csv"`` or ``"ascii.tab"``.
+
+        Returns
+        -------
+        Table or None
+            Parsed table or None.
+        """
+        try:
+            table = Table.read(
+                content.decode("utf-8", errors="replace"),
+                format=fmt,
+                fast_reader=True,
+            )
+            return drop_empty_masks(table)
+        except Exception as e:
+            print(f"{fmt[6:].upper()} parse error: {e}")
+            return None
+
     def search_multiple(
         self,
         coords: List[SkyCoord],
@@ -214,17 +395,28 @@ class ConeSearch(CatalogBase):
         Returns
         -------
         list of Table or None
-            Results for each coordinate.
+            Results for each coordinate, in order.
         """
-        results: List[Optional[Table]] = []
-        for coord in coords:
-            result = self.query_region(coord, radius=radius, **kwargs)
-            results.append(result)
+        coords = list(coords)
+        if not coords:
+            return []
+
+        # The searches are network-bound and independent, so they run
+        # concurrently over the session's connection pool. Workers leave
+        # _last_result alone; it is set once, to the final position's
+        # result, after all have finished.
+        results = fanout(
+            lambda coord: self._search(coord, radius, **kwargs),
+            coords,
+            _MAX_PARALLEL_QUERIES,
+        )
+        self._last_result = results[-1]
         return results
 
     def set_url(self, url: str) -> None:
         """Set the cone search service URL."""
         self.url = url
+        self._validate_cache.pop(url, None)
 
     def set_service(self, service_name: str) -> bool:
         """
@@ -242,6 +434,7 @@ class ConeSearch(CatalogBase):
         """
         if service_name.lower() in self.KNOWN_SERVICES:
             self.url = self.KNOWN_SERVICES[service_name.lower()]
+            self._validate_cache.pop(self.url, None)
             return True
         print(f"Unknown service: {service_name}")
         print(f"Known services: {list(self.KNOWN_SERVICES.keys())}")
@@ -260,13 +453,22 @@ class ConeSearch(CatalogBase):
         """
         Validate that the service URL is accessible.
 
+        The answer is remembered per URL for ``VALIDATE_CACHE_TTL``
+        seconds, so repeated checks do not each send a HEAD request.
+
         Returns
         -------
         bool
             True if service responds.
         """
+        url = self.url
+        cached = self._validate_cache.get(url)
+        if cached is not None and time.monotonic() - cached[0] < self.VALIDATE_CACHE_TTL:
+            return cached[1]
         try:
-            response = self._session.head(self.url, timeout=10)
-            return response.status_code < 400
+            response = self._session.head(url, timeout=10)
+            valid = response.status_code < 400
         except Exception:
-            return False
+            valid = False
+        self._validate_cache[url] = (time.monotonic(), valid)
+        return valid
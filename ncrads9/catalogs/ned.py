@@ -21,14 +21,22 @@ NED (NASA/IPAC Extragalactic Database) query interface.
 Author: Yogesh Wadadekar
 """
 
+import functools
 from typing import Optional, Any
 
 from astropy.coordinates import SkyCoord
 from astropy.table import Table
 import astropy.units as u
-from astroquery.ipac.ned import Ned
 
-from .catalog_base import CatalogBase
+from .catalog_base import CatalogBase, drop_empty_masks
+
+
+@functools.lru_cache(maxsize=1)
+def _backend() -> Any:
+    """Return astroquery's NED client, imported on first use."""
+    from astroquery.ipac.ned import Ned
+
+    return Ned
 
 
 class NEDCatalog(CatalogBase):
@@ -68,11 +76,22 @@ class NEDCatalog(CatalogBase):
             Result table or None if no results.
         """
         try:
-            result = Ned.query_region(
-                coord,
-                radius=radius,
-                equinox=equinox,
-                **kwargs,
+            icrs = coord.icrs
+            key = (
+                "region",
+                round(float(icrs.ra.deg), 6),
+                round(float(icrs.dec.deg), 6),
+                round(float(radius.to_value(u.deg)), 6),
+                equinox,
+                tuple(sorted(kwargs.items())),
+            )
+            result = self._cached_query(
+                key,
+                lambda: self._unmasked(
+                    _backend().query_region(
+                        coord, radius=radius, equinox=equinox, **kwargs
+                    )
+                ),
             )
 
             self._last_result = result
@@ -104,7 +123,11 @@ class NEDCatalog(CatalogBase):
             Result table or None if no results.
         """
         try:
-            result = Ned.query_object(name, **kwargs)
+            # NED names are case- and whitespace-insensitive.
+            key = ("object", " ".join(name.split()).lower(), tuple(sorted(kwargs.items())))
+            result = self._cached_query(
+                key, lambda: self._unmasked(_backend().query_object(name, **kwargs))
+            )
             self._last_result = result
             return result
 
@@ -134,7 +157,10 @@ class NEDCatalog(CatalogBase):
             Result table or None if no results.
         """
         try:
-            result = Ned.query_refcode(refcode, **kwargs)
+            key = ("refcode", refcode.strip(), tuple(sorted(kwargs.items())))
+            result = self._cached_query(
+                key, lambda: self._unmasked(_backend().query_refcode(refcode, **kwargs))
+            )
             self._last_result = result
             return result
 
@@ -164,7 +190,7 @@ class NEDCatalog(CatalogBase):
             Table of image metadata or None.
         """
         try:
-            return Ned.get_images(name, **kwargs)
+            return _backend().get_images(name, **kwargs)
         except Exception as e:
             print(f"NED get_images error: {e}")
             return None
@@ -190,7 +216,7 @@ class NEDCatalog(CatalogBase):
             Table of spectra metadata or None.
         """
         try:
-            return Ned.get_spectra(name, **kwargs)
+            return _backend().get_spectra(name, **kwargs)
         except Exception as e:
             print(f"NED get_spectra error: {e}")
             return None
@@ -216,7 +242,7 @@ class NEDCatalog(CatalogBase):
             Table of photometry data or None.
         """
         try:
-            return Ned.get_table(name, table="photometry", **kwargs)
+            return self._object_table(name, "photometry", **kwargs)
         except Exception as e:
             print(f"NED get_photometry error: {e}")
             return None
@@ -242,7 +268,20 @@ class NEDCatalog(CatalogBase):
             Table of redshift data or None.
         """
         try:
-            return Ned.get_table(name, table="redshifts", **kwargs)
+            return self._object_table(name, "redshifts", **kwargs)
         except Exception as e:
             print(f"NED get_redshifts error: {e}")
             return None
+
+    def _object_table(self, name: str, table: str, **kwargs: Any) -> Optional[Table]:
+        """Return one of NED's per-object tables, through the query cache."""
+        key = (table, " ".join(name.split()).lower(), tuple(sorted(kwargs.items())))
+        return self._cached_query(
+            key,
+            lambda: self._unmasked(_backend().get_table(name, table=table, **kwargs)),
+        )
+
+    @staticmethod
+    def _unmasked(table: Optional[Table]) -> Optional[Table]:
+        """Return ``table`` with masks dropped from fully valid columns."""
+        return drop_empty_masks(table) if table is not None else None
@@ -21,14 +21,58 @@ SDSS (Sloan Digital Sky Survey) catalog query interface.
 Author: Yogesh Wadadekar
 """
 
-from typing import Optional, List, Any
+import functools
+from typing import Optional, List, Any, Callable, Dict, Tuple
 
-from astropy.coordinates import SkyCoord
-from astropy.table import Table
+import numpy as np
+from numpy.typing import NDArray
+from astropy.coordinates import SkyCoord, UnitSphericalRepresentation
+from astropy.table import Table, unique, vstack
 import astropy.units as u
-from astroquery.sdss import SDSS
+import requests
 
-from .catalog_base import CatalogBase
+from ._cache import cached_region_query
+from ._names import resolve_name
+from ._parallel import fanout
+from .catalog_base import CatalogBase, http_session
+
+
+@functools.lru_cache(maxsize=1)
+def _backend() -> Any:
+    """Return astroquery's SDSS client class, imported on first use."""
+    from astroquery.sdss import SDSSClass
+
+    return SDSSClass
+
+
+def _sky_cells(
+    coords: SkyCoord, size: u.Quantity
+) -> Dict[Tuple[int, int], NDArray[np.intp]]:
+    """
+    Group positions into sky cells roughly ``size`` on a side.
+
+    The sky is cut into declination bands of height ``size``, and each
+    band into RA bins widened by ``1 / cos(dec)`` so that cells keep
+    about the same angular size towards the poles.
+
+    Returns
+    -------
+    dict
+        Maps (band, bin) to the indices of the positions in that cell.
+    """
+    step = size.to_value(u.deg)
+    icrs = coords.icrs
+    band = np.floor((icrs.dec.deg + 90.0) / step).astype(int)
+    band_center = np.radians((band + 0.5) * step - 90.0)
+    width = step / np.clip(np.cos(band_center), 1e-6, None)
+    ra_bin = np.floor(icrs.ra.deg / width).astype(int)
+
+    keys = np.stack([band, ra_bin], axis=1)
+    cells, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    order = np.argsort(inverse, kind="stable")
+    groups = np.split(order, np.cumsum(np.bincount(inverse))[:-1])
+    return {(int(b), int(r)): group for (b, r), group in zip(cells, groups)}
 
 
 class SDSSCatalog(CatalogBase):
@@ -65,6 +109,17 @@ class SDSSCatalog(CatalogBase):
         "zwarning",
     ]
 
+    # Largest number of positions uploaded in one cross-match request.
+    CHUNK_SIZE: int = 1000
+
+    # Largest cone-search radius SDSS accepts.
+    MAX_REGION_RADIUS: u.Quantity = 3 * u.arcmin
+
+    # Largest side of the sky cells used by grouped cross-matches. Cells
+    # are made smaller when needed so that each cell's cone, its extent
+    # plus the match radius, stays within MAX_REGION_RADIUS.
+    CELL_SIZE: u.Quantity = 2 * u.arcmin
+
     def __init__(
         self,
         data_release: int = 18,
@@ -94,7 +149,13 @@ class SDSSCatalog(CatalogBase):
         self.specobj_fields: List[str] = (
             specobj_fields or self.DEFAULT_SPEC_FIELDS
         )
+        # A private astroquery client on a pooled session, so successive
+        # queries reuse open connections.
+        self._session: requests.Session = http_session()
+        self._sdss: Any = _backend()()
+        self._sdss._session = self._session
 
+    @cached_region_query
     def query_region(
         self,
         coord: SkyCoord,
@@ -108,7 +169,9 @@ class SDSSCatalog(CatalogBase):
         Parameters
         ----------
         coord : SkyCoord
-            Center coordinate for the query.
+            Center coordinate for the query. An array of coordinates is
+            sent ``CHUNK_SIZE`` positions at a time and the results are
+            stacked.
         radius : Quantity
             Search radius with angular units.
         spectro : bool, optional
@@ -124,7 +187,8 @@ class SDSSCatalog(CatalogBase):
         try:
             fields = self.specobj_fields if spectro else self.photoobj_fields
 
-            result = SDSS.query_region(
+            result = self._query_in_chunks(
+                self._sdss.query_region,
                 coord,
                 radius=radius,
                 spectro=spectro,
@@ -142,6 +206,14 @@ class SDSSCatalog(CatalogBase):
             self._last_result = None
             return None
 
+    def _disk_cache_fields(self, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the data release and field lists, which shape results."""
+        return {
+            "data_release": self.data_release,
+            "photoobj_fields": self.photoobj_fields,
+            "specobj_fields": self.specobj_fields,
+        }
+
     def query_object(
         self,
         name: str,
@@ -153,7 +225,7 @@ class SDSSCatalog(CatalogBase):
         Parameters
         ----------
         name : str
-            Object name to query (resolved via Sesame).
+            Object name to query (resolved via Sesame, with caching).
         **kwargs : Any
             Additional query parameters.
 
@@ -163,7 +235,7 @@ class SDSSCatalog(CatalogBase):
             Result table or None if no results.
         """
         try:
-            coord = SkyCoord.from_name(name)
+            coord = resolve_name(name)
             radius = kwargs.pop("radius", 1 * u.arcmin)
             return self.query_region(coord, radius=radius, **kwargs)
 
@@ -193,7 +265,7 @@ class SDSSCatalog(CatalogBase):
             Result table or None if query fails.
         """
         try:
-            result = SDSS.query_sql(
+            result = self._sdss.query_sql(
                 sql,
                 data_release=self.data_release,
                 **kwargs,
@@ -211,6 +283,7 @@ class SDSSCatalog(CatalogBase):
         coords: SkyCoord,
         radius: u.Quantity = 2 * u.arcsec,
         spectro: bool = False,
+        grouped: bool = False,
         **kwargs: Any,
     ) -> Optional[Table]:
         """
@@ -219,11 +292,18 @@ class SDSSCatalog(CatalogBase):
         Parameters
         ----------
         coords : SkyCoord
-            Coordinates to cross-match.
+            Coordinates to cross-match. Large arrays are uploaded
+            ``CHUNK_SIZE`` positions at a time and the results stacked.
         radius : Quantity, optional
             Match radius. Default is 2 arcsec.
         spectro : bool, optional
             If True, query spectroscopic catalog.
+        grouped : bool, optional
+            If True, group the positions into sky cells of ``CELL_SIZE``,
+            run one cone search per occupied cell and match locally,
+            instead of uploading every position. This sends far less for
+            inputs clustered in a small area; for scattered inputs it
+            costs one request per position. Default is False.
         **kwargs : Any
             Additional query parameters.
 
@@ -233,7 +313,18 @@ class SDSSCatalog(CatalogBase):
             Result table or None if no matches.
         """
         try:
-            result = SDSS.query_crossid(
+            if grouped and isinstance(coords, SkyCoord) and not coords.isscalar:
+                result = self._crossid_by_cell(coords, radius, spectro, **kwargs)
+                self._last_result = result
+                return result
+
+            if isinstance(coords, SkyCoord) and not coords.isscalar:
+                # Number the inputs across the whole array, not per chunk.
+                kwargs.setdefault(
+                    "obj_names", [f"obj_{i:d}" for i in range(len(coords))]
+                )
+            result = self._query_in_chunks(
+                self._sdss.query_crossid,
                 coords,
                 radius=radius,
                 spectro=spectro,
@@ -250,6 +341,128 @@ class SDSSCatalog(CatalogBase):
             self._last_result = None
             return None
 
+    def _crossid_by_cell(
+        self,
+        coords: SkyCoord,
+        radius: u.Quantity,
+        spectro: bool,
+        obj_names: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> Optional[Table]:
+        """
+        Cross-match ``coords`` with one cone search per occupied sky cell.
+
+        Each cell is searched around the mean of its positions, out to its
+        farthest position plus ``radius``; cells whose cone would exceed
+        ``MAX_REGION_RADIUS`` are split. The results are merged,
+        duplicate objects dropped, and every position is matched to its
+        nearest object within ``radius``. Unlike the server cross-match,
+        the nearest object need not be a primary detection.
+        """
+        if radius >= self.MAX_REGION_RADIUS:
+            raise ValueError(
+                f"grouped cross-match radius must be below {self.MAX_REGION_RADIUS}"
+            )
+        if obj_names is None:
+            obj_names = [f"obj_{i:d}" for i in range(len(coords))]
+        icrs = coords.icrs
+
+        reach = self.MAX_REGION_RADIUS - radius
+        size = min(self.CELL_SIZE, reach * np.sqrt(2))
+        searches = self._cell_searches(icrs, size, reach)
+
+        def _search(search: Tuple[SkyCoord, u.Quantity]) -> Optional[Table]:
+            center, extent = search
+            with self._rate_limit:
+                return self.query_region(
+                    center, (extent + radius).to(u.arcsec), spectro=spectro, **kwargs
+                )
+
+        tables = [
+            table
+            for table in fanout(_search, searches, self.MAX_CONCURRENT_QUERIES)
+            if table is not None and len(table) > 0
+        ]
+        if not tables:
+            return None
+        found = vstack(tables, metadata_conflicts="silent")
+        if "objid" in found.colnames:
+            found = unique(found, keys="objid")
+
+        catalog = SkyCoord(
+            np.asarray(found["ra"], dtype=float),
+            np.asarray(found["dec"], dtype=float),
+            unit="deg",
+            frame="icrs",
+        )
+        index, separation, _ = icrs.match_to_catalog_sky(catalog)
+        matched = np.flatnonzero(separation <= radius)
+        if matched.size == 0:
+            return None
+
+        result = found[index[matched]]
+        result.add_column(np.asarray(obj_names)[matched], name="obj_id", index=0)
+        return result
+
+    def _cell_searches(
+        self, coords: SkyCoord, size: u.Quantity, reach: u.Quantity
+    ) -> List[Tuple[SkyCoord, u.Quantity]]:
+        """
+        Return the (center, extent) of each sky cell of ``coords``.
+
+        A cell whose members lie farther than ``reach`` from its center is
+        split into cells of half the size.
+        """
+        searches = []
+        for indices in _sky_cells(coords, size).values():
+            members = coords[indices]
+            mean = members.cartesian.mean().represent_as(UnitSphericalRepresentation)
+            center = SkyCoord(mean.lon, mean.lat, frame="icrs")
+            extent = members.separation(center).max()
+            if extent > reach and len(members) > 1:
+                searches.extend(self._cell_searches(members, size / 2, reach))
+            else:
+                searches.append((center, extent))
+        return searches
+
+    def _query_in_chunks(
+        self,
+        query: Callable[..., Optional[Table]],
+        coords: SkyCoord,
+        **kwargs: Any,
+    ) -> Optional[Table]:
+        """
+        Run ``query`` over at most ``CHUNK_SIZE`` coordinates at a time.
+
+        Very large uploads are rejected or time out on the SDSS side, so
+        coordinate arrays longer than ``CHUNK_SIZE`` are split, an
+        ``obj_names`` list is split alongside them, and the non-empty
+        results are stacked. Scalar coordinates and short arrays make a
+        single call.
+        """
+        if (
+            not isinstance(coords, SkyCoord)
+            or coords.isscalar
+            or len(coords) <= self.CHUNK_SIZE
+        ):
+            return query(coords, **kwargs)
+
+        names = kwargs.pop("obj_names", None)
+        tables = []
+        for start in range(0, len(coords), self.CHUNK_SIZE):
+            stop = start + self.CHUNK_SIZE
+            if names is not None:
+                kwargs["obj_names"] = names[start:stop]
+            table = query(coords[start:stop], **kwargs)
+            if table is not None and len(table) > 0:
+                tables.append(table)
+
+        if not tables:
+            return None
+        if len(tables) == 1:
+            return tables[0]
+        return vstack(tables, metadata_conflicts="silent")
+
     def get_spectra(
         self,
         matches: Table,
@@ -271,7 +484,7 @@ class SDSSCatalog(CatalogBase):
             List of spectra HDU objects or None.
         """
         try:
-            return SDSS.get_spectra(
+            return self._sdss.get_spectra(
                 matches,
                 data_release=self.data_release,
                 **kwargs,
@@ -304,7 +517,7 @@ class SDSSCatalog(CatalogBase):
             List of image HDU objects or None.
         """
         try:
-            return SDSS.get_images(
+            return self._sdss.get_images(
                 matches,
                 band=band,
                 data_release=self.data_release,
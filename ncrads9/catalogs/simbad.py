@@ -21,14 +21,24 @@ SIMBAD catalog query interface.
 Author: Yogesh Wadadekar
 """
 
-from typing import Optional, List, Any
+import functools
+from typing import Optional, List, Any, Dict
 
 from astropy.coordinates import SkyCoord
 from astropy.table import Table
 import astropy.units as u
-from astroquery.simbad import Simbad
+import requests
 
-from .catalog_base import CatalogBase
+from ._cache import cached_region_query
+from .catalog_base import CatalogBase, http_session
+
+
+@functools.lru_cache(maxsize=1)
+def _backend() -> Any:
+    """Return astroquery's SIMBAD client class, imported on first use."""
+    from astroquery.simbad import Simbad
+
+    return Simbad
 
 
 class SimbadCatalog(CatalogBase):
@@ -55,11 +65,13 @@ class SimbadCatalog(CatalogBase):
         )
         self.votable_fields: Optional[List[str]] = votable_fields
         self.row_limit: int = row_limit
-        self._simbad: Simbad = self._create_simbad()
+        self._session: requests.Session = http_session()
+        self._simbad: Any = self._create_simbad()
 
-    def _create_simbad(self) -> Simbad:
+    def _create_simbad(self) -> Any:
         """Create configured Simbad instance."""
-        s = Simbad()
+        s = _backend()()
+        s._session = self._session
         s.ROW_LIMIT = self.row_limit
 
         if self.votable_fields:
@@ -68,6 +80,7 @@ class SimbadCatalog(CatalogBase):
 
         return s
 
+    @cached_region_query
     def query_region(
         self,
         coord: SkyCoord,
@@ -106,6 +119,10 @@ class SimbadCatalog(CatalogBase):
             self._last_result = None
             return None
 
+    def _disk_cache_fields(self, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the VOTable fields and row limit, which shape results."""
+        return {"votable_fields": self.votable_fields, "row_limit": self.row_limit}
+
     def query_object(
         self,
         name: str,
@@ -21,16 +21,35 @@ SkyBot (Sky Body Tracker) query interface for solar system objects.
 Author: Yogesh Wadadekar
 """
 
-from typing import Optional, Any
+import functools
+from typing import Dict, FrozenSet, Optional, Any
 from datetime import datetime
 
+import numpy as np
+from numpy.typing import NDArray
 from astropy.coordinates import SkyCoord
 from astropy.table import Table
 from astropy.time import Time
 import astropy.units as u
-from astroquery.imcce import Skybot
+import requests
 
-from .catalog_base import CatalogBase
+from ._cache import cached_region_query
+from .catalog_base import CatalogBase, http_session
+
+# SkyBot "Type" values accepted by each object type filter.
+_TYPE_MAP = {
+    "asteroid": frozenset({"Asteroid", "NEA"}),
+    "comet": frozenset({"Comet"}),
+    "planet": frozenset({"Planet", "Satellite"}),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _backend() -> Any:
+    """Return astroquery's SkyBoT client class, imported on first use."""
+    from astroquery.imcce import SkybotClass
+
+    return SkybotClass
 
 
 class SkybotCatalog(CatalogBase):
@@ -58,7 +77,12 @@ class SkybotCatalog(CatalogBase):
         )
         self.location: str = location
         self.object_type: str = object_type
+        self._valid_types: FrozenSet[str] = _TYPE_MAP.get(object_type.lower(), frozenset())
+        self._session: requests.Session = http_session()
+        self._skybot: Any = _backend()()
+        self._skybot._session = self._session
 
+    @cached_region_query
     def query_region(
         self,
         coord: SkyCoord,
@@ -89,7 +113,7 @@ class SkybotCatalog(CatalogBase):
             if epoch is None:
                 epoch = Time(datetime.utcnow())
 
-            result = Skybot.cone_search(
+            result = self._skybot.cone_search(
                 coord,
                 radius,
                 epoch,
@@ -116,6 +140,17 @@ class SkybotCatalog(CatalogBase):
             self._last_result = None
             return None
 
+    def _disk_cache_fields(self, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the location and type filter, which shape results.
+
+        Solar system objects move, so only queries for an explicit epoch
+        are cached; the epoch itself is part of the query arguments.
+        """
+        if kwargs.get("epoch") is None:
+            return None
+        return {"location": self.location, "object_type": self.object_type}
+
     def query_object(
         self,
         name: str,
@@ -143,7 +178,7 @@ class SkybotCatalog(CatalogBase):
         print("Use query_region with an epoch instead.")
         return None
 
-    def _filter_by_type(self, table: Table) -> list:
+    def _filter_by_type(self, table: Table) -> NDArray[np.bool_]:
         """
         Filter results by object type.
 
@@ -154,23 +189,14 @@ class SkybotCatalog(CatalogBase):
 
         Returns
         -------
-        list
+        ndarray of bool
             Boolean mask for filtering.
         """
-        if "Type" not in table.colnames:
-            return [True] * len(table)
-
-        type_map = {
-            "asteroid": ["Asteroid", "NEA"],
-            "comet": ["Comet"],
-            "planet": ["Planet", "Satellite"],
-        }
-
-        valid_types = type_map.get(self.object_type.lower(), [])
-        if not valid_types:
-            return [True] * len(table)
+        if "Type" not in table.colnames or not self._valid_types:
+            return np.ones(len(table), dtype=bool)
 
-        return [t in valid_types for t in table["Type"]]
+        types = np.ma.filled(np.ma.asarray(table["Type"]), "")
+        return np.isin(types, list(self._valid_types))
 
     def set_location(self, location: str) -> None:
         """
@@ -194,6 +220,7 @@ class SkybotCatalog(CatalogBase):
         """
         if object_type.lower() in ("all", "asteroid", "comet", "planet"):
             self.object_type = object_type.lower()
+            self._valid_types = _TYPE_MAP.get(self.object_type, frozenset())
         else:
             print(f"Unknown object type: {object_type}")
             print("Valid types: all, asteroid, comet, planet")
@@ -21,14 +21,27 @@
 Author: Yogesh Wadadekar
 """
 
-from typing import Optional, List, Any
+import functools
+from typing import Dict, Optional, List, Any
 
+import numpy as np
+from numpy.typing import NDArray
 from astropy.coordinates import SkyCoord
 from astropy.table import Table
 import astropy.units as u
-from astroquery.vizier import Vizier
+import requests
 
-from .catalog_base import CatalogBase
+from ._cache import cached_region_query
+from ._names import resolve_name
+from .catalog_base import CatalogBase, http_session
+
+
+@functools.lru_cache(maxsize=1)
+def _backend() -> Any:
+    """Return astroquery's VizieR client class, imported on first use."""
+    from astroquery.vizier import Vizier
+
+    return Vizier
 
 
 class TwoMASSCatalog(CatalogBase):
@@ -102,16 +115,20 @@ class TwoMASSCatalog(CatalogBase):
             self._default_columns = self.DEFAULT_PSC_COLUMNS
 
         self.columns: List[str] = columns or self._default_columns
-        self._vizier: Vizier = self._create_vizier()
+        self._session: requests.Session = http_session()
+        self._vizier: Any = self._create_vizier()
 
-    def _create_vizier(self) -> Vizier:
+    def _create_vizier(self) -> Any:
         """Create configured Vizier instance."""
-        return Vizier(
+        v = _backend()(
             columns=self.columns,
             row_limit=self.row_limit,
             catalog=self._catalog,
         )
+        v._session = self._session
+        return v
 
+    @cached_region_query
     def query_region(
         self,
         coord: SkyCoord,
@@ -154,6 +171,14 @@ class TwoMASSCatalog(CatalogBase):
             self._last_result = None
             return None
 
+    def _disk_cache_fields(self, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the catalog, columns and row limit, which shape results."""
+        return {
+            "catalog": self._catalog,
+            "columns": self.columns,
+            "row_limit": self.row_limit,
+        }
+
     def query_object(
         self,
         name: str,
@@ -178,7 +203,7 @@ class TwoMASSCatalog(CatalogBase):
             Result table or None if no results.
         """
         try:
-            coord = SkyCoord.from_name(name)
+            coord = resolve_name(name)
             return self.query_region(coord, radius=radius, **kwargs)
 
         except Exception as e:
@@ -237,19 +262,21 @@ class TwoMASSCatalog(CatalogBase):
             self._default_columns = self.DEFAULT_PSC_COLUMNS
 
         self.columns = self._default_columns
-        self._vizier = self._create_vizier()
+        # Update the client in place so it keeps its pooled session.
+        self._vizier.catalog = self._catalog
+        self._vizier.columns = self.columns
 
     def set_columns(self, columns: List[str]) -> None:
         """Set the columns to retrieve."""
         self.columns = columns
-        self._vizier = self._create_vizier()
+        self._vizier.columns = columns
 
     def set_row_limit(self, limit: int) -> None:
         """Set the maximum number of rows to return."""
         self.row_limit = limit
-        self._vizier = self._create_vizier()
+        self._vizier.ROW_LIMIT = limit
 
-    def get_jh_color(self, table: Table) -> Optional[List[float]]:
+    def get_jh_color(self, table: Table) -> Optional[NDArray[np.float64]]:
         """
         Calculate J-H color from table.
 
@@ -260,19 +287,15 @@ class TwoMASSCatalog(CatalogBase):
 
         Returns
         -------
-        list of float or None
-            J-H color values or None.
+        ndarray or None
+            J-H color of each row where both magnitudes are present, or
+            None if a column is missing.
         """
         if "Jmag" not in table.colnames or "Hmag" not in table.colnames:
             return None
+        return _color(_magnitudes(table, "Jmag"), _magnitudes(table, "Hmag"))
 
-        return [
-            float(row["Jmag"] - row["Hmag"])
-            for row in table
-            if row["Jmag"] is not None and row["Hmag"] is not None
-        ]
-
-    def get_hk_color(self, table: Table) -> Optional[List[float]]:
+    def get_hk_color(self, table: Table) -> Optional[NDArray[np.float64]]:
         """
         Calculate H-K color from table.
 
@@ -283,14 +306,49 @@ class TwoMASSCatalog(CatalogBase):
 
         Returns
         -------
-        list of float or None
-            H-K color values or None.
+        ndarray or None
+            H-K color of each row where both magnitudes are present, or
+            None if a column is missing.
         """
         if "Hmag" not in table.colnames or "Kmag" not in table.colnames:
             return None
+        return _color(_magnitudes(table, "Hmag"), _magnitudes(table, "Kmag"))
+
+    def get_colors(self, table: Table) -> Dict[str, NDArray[np.float64]]:
+        """
+        Calculate the J-H, H-K and J-K colors from table.
+
+        Each magnitude column is read once for all three colors.
 
-        return [
-            float(row["Hmag"] - row["Kmag"])
-            for row in table
-            if row["Hmag"] is not None and row["Kmag"] is not None
-        ]
+        Parameters
+        ----------
+        table : Table
+            Result table with Jmag, Hmag and Kmag columns.
+
+        Returns
+        -------
+        dict
+            Color name ("J-H", "H-K", "J-K") to values for the rows where
+            both magnitudes are present. Colors whose columns are missing
+            are left out.
+        """
+        mags = {
+            band: _magnitudes(table, f"{band}mag")
+            for band in "JHK"
+            if f"{band}mag" in table.colnames
+        }
+        return {
+            f"{a}-{b}": _color(mags[a], mags[b])
+            for a, b in (("J", "H"), ("H", "K"), ("J", "K"))
+            if a in mags and b in mags
+        }
+
+
+def _magnitudes(table: Table, column: str) -> np.ma.MaskedArray:
+    """Return a magnitude column as a float masked array."""
+    return np.ma.asarray(table[column], dtype=np.float64)
+
+
+def _color(first: np.ma.MaskedArray, second: np.ma.MaskedArray) -> NDArray[np.float64]:
+    """Return ``first - second`` for rows where neither value is masked."""
+    return np.ma.compressed(first - second)
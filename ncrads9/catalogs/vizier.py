@@ -21,14 +21,24 @@ VizieR catalog query interface.
 Author: Yogesh Wadadekar
 """
 
-from typing import Optional, List, Any
+import functools
+from typing import Optional, List, Any, Dict
 
 from astropy.coordinates import SkyCoord
 from astropy.table import Table, vstack
 import astropy.units as u
-from astroquery.vizier import Vizier
+import requests
 
-from .catalog_base import CatalogBase
+from ._cache import cached_region_query
+from .catalog_base import CatalogBase, http_session
+
+
+@functools.lru_cache(maxsize=1)
+def _backend() -> Any:
+    """Return astroquery's VizieR client class, imported on first use."""
+    from astroquery.vizier import Vizier
+
+    return Vizier
 
 
 class VizierCatalog(CatalogBase):
@@ -56,18 +66,21 @@ class VizierCatalog(CatalogBase):
         self.catalog: Optional[str] = catalog
         self.columns: Optional[List[str]] = columns
         self.row_limit: int = row_limit
-        self._vizier: Vizier = self._create_vizier()
+        self._session: requests.Session = http_session()
+        self._vizier: Any = self._create_vizier()
 
-    def _create_vizier(self) -> Vizier:
+    def _create_vizier(self) -> Any:
         """Create configured Vizier instance."""
-        v = Vizier(
+        v = _backend()(
             columns=self.columns if self.columns else ["*"],
             row_limit=self.row_limit,
         )
+        v._session = self._session
         if self.catalog:
             v.catalog = self.catalog
         return v
 
+    @cached_region_query
     def query_region(
         self,
         coord: SkyCoord,
@@ -126,6 +139,14 @@ class VizierCatalog(CatalogBase):
             self._last_result = None
             return None
 
+    def _disk_cache_fields(self, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the catalog, columns and row limit, which shape results."""
+        return {
+            "catalog": self.catalog,
+            "columns": self.columns,
+            "row_limit": self.row_limit,
+        }
+
     def query_object(
         self,
         name: str,
@@ -191,7 +212,7 @@ class VizierCatalog(CatalogBase):
             Table of matching catalogs.
         """
         try:
-            result = Vizier.find_catalogs(keywords)
+            result = self._vizier.find_catalogs(keywords)
             if result:
                 return Table(
                     rows=[(k, v.description) for k, v in result.items()],
@@ -205,14 +226,15 @@ class VizierCatalog(CatalogBase):
     def set_catalog(self, catalog: str) -> None:
         """Set the default catalog identifier."""
         self.catalog = catalog
-        self._vizier = self._create_vizier()
+        # Update the client in place so it keeps its pooled session.
+        self._vizier.catalog = catalog
 
     def set_columns(self, columns: List[str]) -> None:
         """Set the columns to retrieve."""
         self.columns = columns
-        self._vizier = self._create_vizier()
+        self._vizier.columns = columns if columns else ["*"]
 
     def set_row_limit(self, limit: int) -> None:
         """Set the maximum number of rows to return."""
         self.row_limit = limit
-        self._vizier = self._create_vizier()
+        self._vizier.ROW_LIMIT = limit
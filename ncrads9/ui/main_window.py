@@ -111,6 +111,7 @@ from ..analysis.radial_profile import RadialProfile
 from ..utils.preferences import Preferences
 from ..image_servers.sia_client import SIAClient
 from ..catalogs.vizier import VizierCatalog
+from ..catalogs.async_query import query_region_async, resolve_name_async
 from ..communication.samp import SAMPClient
 from .dialogs.vo_query_dialog import VOQueryDialog
 from .view_transform import (
@@ -944,13 +945,44 @@ class MainWindow(QMainWindow):
                 from PyQt6.QtWidgets import QMessageBox
                 QMessageBox.critical(self, "Error Loading File", 
                                    f"Could not load FITS file:\n{filepath}\n\nError: {e}")
-    
-    def _load_fits_file(self, filepath: str) -> None:
+
+    def open_files(self, filepaths: List[str]) -> None:
+        """
+        Open several FITS files in order, redrawing only once at the end.
+
+        Each file is loaded into the current frame exactly as by
+        ``open_file``, but the display, zoom-to-fit and status updates are
+        done once for the last file that loaded rather than once per file.
+
+        Args:
+            filepaths: Paths of the files to open.
+        """
+        if len(filepaths) == 1:
+            self.open_file(filepath=filepaths[0])
+            return
+
+        loaded = None
+        for filepath in filepaths:
+            try:
+                self._load_fits_file(filepath, display=False)
+                loaded = filepath
+            except Exception as e:
+                self.statusBar().showMessage(f"Error loading file: {e}", 5000)
+                from PyQt6.QtWidgets import QMessageBox
+                QMessageBox.critical(self, "Error Loading File",
+                                   f"Could not load FITS file:\n{filepath}\n\nError: {e}")
+        if loaded is not None:
+            self._show_loaded_file(loaded)
+            self.statusBar().showMessage(f"Opened: {loaded}", 3000)
+
+    def _load_fits_file(self, filepath: str, display: bool = True) -> None:
         """
         Load a FITS file into current frame.
         
         Args:
             filepath: Path to the FITS file.
+            display: If False, only update the frame; the caller is
+                responsible for calling ``_show_loaded_file`` afterwards.
         """
         # Get current frame
         frame = self.frame_manager.current_frame
@@ -999,7 +1031,21 @@ class MainWindow(QMainWindow):
         self.z2 = None
         if hasattr(self.image_viewer, "reset_contrast_brightness"):
             self.image_viewer.reset_contrast_brightness()
-        
+
+        if display:
+            self._show_loaded_file(filepath)
+
+    def _show_loaded_file(self, filepath: str) -> None:
+        """
+        Display a file just loaded into the current frame.
+
+        Args:
+            filepath: Path of the loaded file, used for the window title.
+        """
+        frame = self.frame_manager.current_frame
+        image_data = frame.fits_handler.get_data()
+        wcs_handler = frame.wcs_handler
+
         # Update window title
         filename = Path(filepath).name
         frame_info = f"Frame {self.frame_manager.current_index + 1}/{self.frame_manager.num_frames}"
@@ -2003,12 +2049,18 @@ class MainWindow(QMainWindow):
         if not ok or not name.strip():
             return
         query = name.strip()
-        try:
-            coord = SkyCoord.from_name(query)
-        except Exception as exc:
-            self.statusBar().showMessage(f"Name resolution failed: {exc}", 3500)
-            return
+        self.statusBar().showMessage(f"Resolving {query}...")
+        # The lookup goes over the network, so it runs on a pool thread.
+        resolve_name_async(
+            query,
+            on_finished=lambda coord: self._on_object_name_resolved(query, coord),
+            on_failed=lambda exc: self.statusBar().showMessage(
+                f"Name resolution failed: {exc}", 3500
+            ),
+        )
 
+    def _on_object_name_resolved(self, query: str, coord: SkyCoord) -> None:
+        """Pan to a resolved object if WCS is available."""
         if self.wcs_handler and self.wcs_handler.is_valid:
             try:
                 x, y = self.wcs_handler.world_to_pixel(coord.ra.deg, coord.dec.deg)
@@ -2778,7 +2830,17 @@ class MainWindow(QMainWindow):
 
         catalog = VizierCatalog(catalog="II/246/out")
         coord = SkyCoord(ra=ra * u.deg, dec=dec * u.deg, frame="icrs")
-        table = catalog.query_region(coord, radius=radius * u.deg)
+        self.statusBar().showMessage("Querying VizieR...")
+        # The query runs on a pool thread; the overlay is drawn when it returns.
+        query_region_async(
+            catalog,
+            coord,
+            radius * u.deg,
+            lambda table: self._on_vizier_result(catalog, table),
+        )
+
+    def _on_vizier_result(self, catalog: VizierCatalog, table: Optional[Table]) -> None:
+        """Overlay the sources returned by a VizieR query."""
         if table is None or len(table) == 0:
             self.statusBar().showMessage("No VizieR sources found", 3000)
             return
@@ -2790,8 +2852,8 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage("Current frame has no WCS for overlay", 3000)
             return
 
-        for coord in coords:
-            pixel = self._world_to_overlay_pixel(coord.ra.deg, coord.dec.deg)
+        for ra_deg, dec_deg in zip(coords.ra.deg.tolist(), coords.dec.deg.tolist()):
+            pixel = self._world_to_overlay_pixel(ra_deg, dec_deg)
             if pixel is None:
                 continue
             x, y = pixel
@@ -94,12 +94,15 @@ class Config:
         Get an entire configuration section.
 
         Args:
-            section: Section name.
+            section: Section name, using dot notation for nested sections
+                (e.g., "communication.xpa").
 
         Returns:
-            Dictionary containing the section's configuration.
+            Dictionary containing the section's configuration, or an empty
+            dictionary if the section is missing or is not a table.
         """
-        return self._config.get(section, {})
+        value = self.get(section, {})
+        return value if isinstance(value, dict) else {}
 
     @property
     def config_path(self) -> Path | None:
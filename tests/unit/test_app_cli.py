@@ -3,9 +3,11 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+from PyQt6.QtCore import QThreadPool
 from PyQt6.QtWidgets import QApplication
 
 from ncrads9.app import (
+    _StartXPAServer,
     _cli_help_requested,
     apply_startup_cli,
     open_cli_help_in_browser,
@@ -171,3 +173,69 @@ def test_apply_startup_cli_colormap_alias(main_window: MainWindow, monkeypatch):
     monkeypatch.setattr(MainWindow, "open_file", _fake_open)
     apply_startup_cli(main_window, ["ncrads9", "image.fits", "-color", "heat"])
     assert main_window.current_colormap == "heat"
+
+
+class _FakeXPAServer:
+    address = "localhost:0"
+
+    def __init__(self, started):
+        self._started = started
+        self.calls = []
+
+    def start(self):
+        self.calls.append("start")
+        if isinstance(self._started, Exception):
+            raise self._started
+        return self._started
+
+    def stop(self):
+        self.calls.append("stop")
+
+
+@pytest.mark.parametrize("started", [True, False, OSError("address in use")])
+def test_xpa_startup_runnable_reports_result_and_stops_after_start(qapp, started):
+    server = _FakeXPAServer(started)
+    startup = _StartXPAServer(server)
+    results = []
+    startup.notifier.finished.connect(results.append)
+
+    QThreadPool.globalInstance().start(startup)
+    startup.stop_server()
+    QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+
+    assert server.calls == ["start", "stop"]
+    assert results == [started is True]
+
+
+def test_apply_startup_cli_opens_consecutive_files_together(main_window: MainWindow, monkeypatch):
+    batches = []
+    monkeypatch.setattr(MainWindow, "open_files", lambda self, paths: batches.append(list(paths)))
+
+    apply_startup_cli(main_window, ["ncrads9", "a.fits", "b.fits", "-log", "c.fits"])
+    assert batches == [["a.fits", "b.fits"], ["c.fits"]]
+    assert main_window.current_scale == ScaleAlgorithm.LOG
+
+
+def test_open_files_displays_last_file_once(main_window: MainWindow, monkeypatch):
+    loaded, shown = [], []
+
+    def _fake_load(self, filepath, display=True):
+        assert not display
+        loaded.append(filepath)
+
+    monkeypatch.setattr(MainWindow, "_load_fits_file", _fake_load)
+    monkeypatch.setattr(MainWindow, "_show_loaded_file", lambda self, path: shown.append(path))
+
+    main_window.open_files(["a.fits", "b.fits", "c.fits"])
+    assert loaded == ["a.fits", "b.fits", "c.fits"]
+    assert shown == ["c.fits"]
+
+
+def test_parse_cli_sequence_treats_arguments_after_double_dash_as_files():
+    items = parse_cli_sequence(["-log", "--", "-odd-name.fits", "b.fits"])
+    assert [(item.kind, item.name) for item in items] == [
+        ("option", "log"),
+        ("file", "-odd-name.fits"),
+        ("file", "b.fits"),
+    ]
@@ -0,0 +1,94 @@
+# NCRADS9 - NCRA DS9-like FITS Viewer
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Author: Yogesh Wadadekar
+
+"""Tests for catalogs.async_query module."""
+
+import os
+import threading
+
+import astropy.units as u
+import pytest
+from astropy.coordinates import SkyCoord
+from astropy.table import Table
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QApplication
+
+from ncrads9.catalogs import async_query
+from ncrads9.catalogs.async_query import query_region_async, run_async
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _deliver(qapp):
+    QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+
+
+def test_run_async_calls_back_on_gui_thread(qapp):
+    gui_thread = threading.get_ident()
+    worker_threads, results = [], []
+
+    def _work(x, y=0):
+        worker_threads.append(threading.get_ident())
+        return x + y
+
+    run_async(_work, 2, y=3, on_finished=lambda r: results.append((r, threading.get_ident())))
+    _deliver(qapp)
+
+    assert results == [(5, gui_thread)]
+    assert worker_threads != [gui_thread]
+    assert not async_query._PENDING
+
+
+def test_run_async_reports_exceptions(qapp):
+    errors = []
+
+    def _fail():
+        raise ValueError("no such object")
+
+    run_async(_fail, on_finished=pytest.fail, on_failed=errors.append)
+    _deliver(qapp)
+    assert [str(e) for e in errors] == ["no such object"]
+
+
+def test_query_region_async_passes_table_or_none(qapp):
+    class _Catalog:
+        def __init__(self, fail):
+            self.fail = fail
+
+        def query_region(self, coord, radius, **kwargs):
+            if self.fail:
+                raise RuntimeError("offline")
+            return Table({"ra": [coord.ra.deg], "sr": [radius.to_value(u.deg)]})
+
+    coord = SkyCoord(10, 20, unit="deg")
+    tables = []
+    query_region_async(_Catalog(False), coord, 0.5 * u.deg, tables.append)
+    query_region_async(_Catalog(True), coord, 0.5 * u.deg, tables.append)
+    _deliver(qapp)
+
+    assert len(tables) == 2 and None in tables
+    table = next(t for t in tables if t is not None)
+    assert float(table["sr"][0]) == 0.5
@@ -0,0 +1,379 @@
+# ncrads9 - NCRA DS9-like FITS Viewer
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for catalog coordinate extraction and overlay rendering."""
+
+import dataclasses
+import gc
+import os
+
+import astropy.units as u
+import numpy as np
+import pytest
+from astropy.coordinates import SkyCoord
+from astropy.table import MaskedColumn, Table
+
+from ncrads9.catalogs import catalog_base
+from ncrads9.catalogs.catalog_base import (
+    CatalogBase,
+    column_degrees,
+    coords_from_columns,
+    resolve_radec_columns,
+)
+from ncrads9.catalogs.catalog_display import CatalogDisplay, MarkerShape, MarkerStyle
+
+
+class _StubCatalog(CatalogBase):
+    def query_region(self, coord, radius, **kwargs):
+        return None
+
+    def query_object(self, name, **kwargs):
+        return None
+
+
+@pytest.fixture
+def table():
+    return Table(
+        {
+            "Name": ["a", "b", "c", "d"],
+            "RAJ2000": MaskedColumn([10.0, 20.5, np.nan, 30.25], mask=[0, 0, 0, 1]),
+            "DEJ2000": [-5.0, 45.0, 10.0, 12.0],
+        }
+    )
+
+
+def test_get_coordinates_returns_one_array_skycoord(table):
+    coords = _StubCatalog("stub").get_coordinates(table)
+
+    assert isinstance(coords, SkyCoord) and coords.shape == (2,)
+    np.testing.assert_allclose(coords.ra.deg, [10.0, 20.5])
+    np.testing.assert_allclose(coords.dec.deg, [-5.0, 45.0])
+
+
+def test_coords_from_columns_parses_strings_and_drops_invalid():
+    ra = ["10.5", "12:00:00", "bad", "40"]
+    dec = ["-20", "30", "0", "95"]
+
+    coords = coords_from_columns(Table({"ra": ra})["ra"], Table({"dec": dec})["dec"])
+    np.testing.assert_allclose(coords.ra.deg, [10.5, 12.0])
+    np.testing.assert_allclose(coords.dec.deg, [-20.0, 30.0])
+
+
+def test_coords_from_columns_without_valid_rows_is_none():
+    empty = Table({"ra": [np.nan], "dec": [0.0]})
+    assert coords_from_columns(empty["ra"], empty["dec"]) is None
+
+
+def test_add_overlay_accepts_coordinate_list(table):
+    display = CatalogDisplay()
+    coords = [SkyCoord(1 * u.deg, 2 * u.deg), SkyCoord(3 * u.deg, 4 * u.deg)]
+
+    assert display.add_overlay("list", table, coords=coords)
+    assert display.get_overlay("list").coords.shape == (2,)
+    assert display.add_overlay("scalar", table, coords=coords[0])
+    assert display.get_overlay("scalar").coords.shape == (1,)
+
+
+def test_render_circle_overlay(table):
+    display = CatalogDisplay()
+    display.add_overlay("cat", table, style=MarkerStyle(shape=MarkerShape.CIRCLE, size=5.0))
+
+    lines = display.render().split("\n")
+    assert lines[:3] == [
+        "# Region file format: DS9 version 4.1",
+        "global color=green dashlist=8 3 width=1",
+        "fk5",
+    ]
+    assert lines[3:] == [
+        'circle(10.0,-5.0,5.0") # color=green width=1',
+        'circle(20.5,45.0,5.0") # color=green width=1',
+    ]
+
+
+def test_resolve_radec_columns_tracks_column_changes(table):
+    assert resolve_radec_columns(table) == ("RAJ2000", "DEJ2000")
+    assert resolve_radec_columns(table) == ("RAJ2000", "DEJ2000")
+
+    table.rename_column("DEJ2000", "DEC_J2000")
+    assert resolve_radec_columns(table) == ("RAJ2000", "DEC_J2000")
+    table.remove_column("RAJ2000")
+    assert resolve_radec_columns(table) == (None, "DEC_J2000")
+
+
+def test_column_cache_entry_is_dropped_with_table():
+    table = Table({"ra": [1.0], "dec": [2.0]})
+    catalog_base.resolve_radec_columns(table)
+    key = id(table)
+    assert key in catalog_base._COLUMN_CACHE
+
+    del table
+    gc.collect()
+    assert key not in catalog_base._COLUMN_CACHE
+
+
+def _reference_region(ra, dec, style, label=None):
+    """Region line as produced by the original per-point formatter."""
+    shape, size = style.shape.value, style.size
+    region = {
+        "circle": f'circle({ra},{dec},{size}")',
+        "box": f'box({ra},{dec},{size}",{size}",0)',
+        "diamond": (
+            f"polygon({ra},{dec-size/3600},{ra+size/3600},{dec},"
+            f"{ra},{dec+size/3600},{ra-size/3600},{dec})"
+        ),
+        "cross": f'cross({ra},{dec},{size}")',
+        "x": f'x({ra},{dec},{size}")',
+        "ellipse": f'ellipse({ra},{dec},{size}",{size/2}",0)',
+        "point": f"point({ra},{dec})",
+    }[shape]
+    region += f" # color={style.color} width={style.width}"
+    if label is not None:
+        region += f' text="{label}"'
+    return region
+
+
+@pytest.mark.parametrize("shape", list(MarkerShape))
+@pytest.mark.parametrize("show_label", [False, True])
+def test_render_matches_reference_format(table, shape, show_label):
+    style = MarkerStyle(
+        shape=shape, color="red", size=7.5, width=2,
+        show_label=show_label, label_column="Name",
+    )
+    display = CatalogDisplay()
+    display.add_overlay("cat", table, style=style)
+    display.add_overlay("hidden", table)
+    display.hide_overlay("hidden")
+
+    coords = display.get_overlay("cat").coords
+    expected = [
+        _reference_region(
+            ra, dec, style, table["Name"][i] if show_label else None
+        )
+        for i, (ra, dec) in enumerate(zip(coords.ra.deg, coords.dec.deg))
+    ]
+    assert display.render().split("\n")[3:] == expected
+    assert display.render("cat").split("\n")[3:] == expected
+
+
+def test_render_reuses_overlay_text_until_inputs_change(table, monkeypatch):
+    display = CatalogDisplay()
+    display.add_overlay("cat", table)
+    calls = []
+    original = CatalogDisplay._render_overlay
+
+    def _counting(self, overlay):
+        calls.append(overlay.name)
+        return original(self, overlay)
+
+    monkeypatch.setattr(CatalogDisplay, "_render_overlay", _counting)
+
+    first = display.render()
+    assert display.render() == first
+    assert calls == ["cat"]
+
+    display.set_style("cat", MarkerStyle(shape=MarkerShape.BOX))
+    boxed = display.render()
+    assert boxed != first and "box(" in boxed
+    assert calls == ["cat", "cat"]
+
+    display.hide_overlay("cat")
+    assert display.render().count("\n") == 2
+    display.show_overlay("cat")
+    assert display.render() == boxed
+    assert calls == ["cat", "cat", "cat"]
+
+    table.add_row(table[0])
+    display.get_overlay("cat").coords = display._extract_coordinates(table)
+    assert display.render().count("box(") == boxed.count("box(") + 1
+
+
+def test_marker_style_is_hashable_and_frozen():
+    style = MarkerStyle(color="red")
+    assert hash(style) == hash(MarkerStyle(color="red"))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        style.color = "blue"
+    assert not hasattr(style, "__dict__")
+    assert dataclasses.replace(style, size=3.0).size == 3.0
+
+
+def test_render_keeps_insertion_order_across_visibility_changes(table):
+    display = CatalogDisplay()
+    for name, color in (("a", "red"), ("b", "blue"), ("c", "cyan")):
+        display.add_overlay(name, table, style=MarkerStyle(color=color))
+
+    def colors():
+        body = display.render().split("\n")[3:]
+        return [line.split("color=")[1].split()[0] for line in body[::2]]
+
+    assert colors() == ["red", "blue", "cyan"]
+    display.hide_overlay("a")
+    display.hide_overlay("b")
+    assert colors() == ["cyan"]
+    display.show_overlay("a")
+    assert colors() == ["red", "cyan"]
+    display.remove_overlay("c")
+    assert colors() == ["red"]
+    assert display.render("b").count("\n") == 2
+    display.clear_all()
+    assert display.render().count("\n") == 2
+
+
+def test_failures_are_logged_not_printed(table, caplog, capsys):
+    class _FailingDS9:
+        def set(self, *args):
+            raise RuntimeError("xpa down")
+
+    display = CatalogDisplay()
+    with caplog.at_level("WARNING", logger="ncrads9.catalogs.catalog_display"):
+        assert not display.add_overlay("empty", Table({"x": [1.0]}))
+        assert not display.send_to_ds9()
+        display.ds9 = _FailingDS9()
+        assert not display.send_to_ds9()
+        assert not display.clear_ds9_regions()
+
+    assert capsys.readouterr().out == ""
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == [
+        "Could not extract coordinates from table for empty",
+        "No DS9 connection available",
+        "Error sending regions to DS9",
+        "Error clearing DS9 regions",
+    ]
+    assert caplog.records[-1].exc_info is not None
+
+
+def test_render_without_visible_overlays_is_header_only(table):
+    display = CatalogDisplay()
+    header = display.render()
+    assert header.split("\n") == [
+        "# Region file format: DS9 version 4.1",
+        "global color=green dashlist=8 3 width=1",
+        "fk5",
+    ]
+    display.add_overlay("cat", table)
+    assert display.render().startswith(header + "\n")
+    display.hide_overlay("cat")
+    assert display.render() == header
+
+
+def test_setting_overlay_visible_directly_hides_it(table):
+    display = CatalogDisplay()
+    display.add_overlay("cat", table)
+    header = next(display.render_iter())
+
+    display.get_overlay("cat").visible = False
+    assert display.render() == header
+    assert display.render("cat") == header
+
+    display.get_overlay("cat").visible = True
+    assert "circle(" in display.render()
+
+
+def test_last_coords_are_extracted_once_per_result(table, monkeypatch):
+    calls = []
+    original = catalog_base.coords_from_columns
+
+    def _counting(ra, dec):
+        calls.append(len(ra))
+        return original(ra, dec)
+
+    monkeypatch.setattr(catalog_base, "coords_from_columns", _counting)
+    catalog = _StubCatalog("stub")
+    assert catalog.last_coords is None
+
+    catalog._last_result = table
+    coords = catalog.last_coords
+    assert catalog.get_coordinates(table) is coords
+    assert catalog.last_coords is coords
+    assert calls == [len(table)]
+
+    display = CatalogDisplay()
+    assert display.add_overlay("cat", table, source=catalog)
+    assert display.get_overlay("cat").coords is coords
+    assert calls == [len(table)]
+
+    catalog._last_result = table.copy()
+    assert catalog.last_coords is not coords
+    catalog.clear_cache()
+    assert catalog.last_coords is None
+
+
+class _RecordingDS9:
+    def __init__(self):
+        self.calls = []
+
+    def set(self, command, data=None):
+        if command.startswith("regions load "):
+            path = command[len("regions load "):]
+            with open(path, encoding="utf-8") as handle:
+                data = handle.read()
+        self.calls.append((command.split()[0:2], data))
+
+
+def test_send_to_ds9_streams_one_request_per_overlay(monkeypatch):
+    rng = np.random.default_rng(3)
+    big = Table({"ra": rng.uniform(0, 360, 50), "dec": rng.uniform(-90, 90, 50)})
+    display = CatalogDisplay(_RecordingDS9())
+    display.add_overlay("big", big)
+
+    assert display.send_to_ds9()
+    ((command, data),) = display.ds9.calls
+    assert command == ["regions"] and data == display.render()
+
+    display.add_overlay("small", big[:5])
+    display.ds9.calls.clear()
+    assert display.send_to_ds9()
+    assert [command for command, _ in display.ds9.calls] == [["regions"]] * 2
+    header, *blocks = display.render_iter()
+    assert [data for _, data in display.ds9.calls] == [
+        f"{header}\n{block}" for block in blocks
+    ]
+
+
+def test_send_to_ds9_loads_a_region_file_only_when_asked(monkeypatch):
+    rng = np.random.default_rng(3)
+    big = Table({"ra": rng.uniform(0, 360, 50), "dec": rng.uniform(-90, 90, 50)})
+    display = CatalogDisplay(_RecordingDS9())
+    display.add_overlay("big", big)
+
+    unlinked = []
+    monkeypatch.setattr(
+        "ncrads9.catalogs.catalog_display.os.unlink",
+        lambda path: (unlinked.append(path), os.remove(path)),
+    )
+    assert display.send_to_ds9(via_file=True)
+    command, data = display.ds9.calls[-1]
+    assert command == ["regions", "load"]
+    assert data == display.render() + "\n"
+    assert unlinked and not os.path.exists(unlinked[0])
+    assert "\n".join(display.render_iter()) == display.render()
+
+
+@pytest.mark.parametrize("color", ["50%grey", "{red}"])
+def test_render_escapes_format_characters_in_style(table, color):
+    display = CatalogDisplay()
+    display.add_overlay("cat", table, style=MarkerStyle(color=color))
+    body = display.render().split("\n")[3:]
+    assert body[0] == f'circle(10.0,-5.0,10.0") # color={color} width=1'
+
+
+def test_column_degrees_handles_mixed_text_columns():
+    column = MaskedColumn(
+        ["10.5", "12:00:00", "bad", "-3", "1e1"], mask=[0, 0, 0, 0, 1]
+    )
+    degrees = column_degrees(column)
+    np.testing.assert_allclose(degrees[[0, 1, 3]], [10.5, 12.0, -3.0])
+    assert np.isnan(degrees[[2, 4]]).all()
@@ -0,0 +1,251 @@
+# NCRADS9 - NCRA DS9-like FITS Viewer
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Author: Yogesh Wadadekar
+
+"""Tests for catalogs.catalog_table module."""
+
+import os
+
+import numpy as np
+import pytest
+from astropy.table import MaskedColumn, Table
+from PyQt6.QtCore import QPoint, Qt
+from PyQt6.QtWidgets import QApplication, QHeaderView, QMenu, QStyleOptionViewItem
+
+from ncrads9.catalogs.catalog_table import (
+    CatalogItemDelegate,
+    CatalogTable,
+    CatalogTableModel,
+    ColumnConfig,
+)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def table():
+    return Table(
+        {
+            "Name": ["M31", "NGC 1", "m33", "IC 10"],
+            "RAJ2000": [10.6847, 1.8, 23.4621, 5.07],
+            "DEJ2000": [41.2690, 27.7, 30.6602, 59.3],
+            "Vmag": MaskedColumn([3.44, 12.5, 5.72, 11.8], mask=[0, 0, 0, 1]),
+            "N": np.array([3, 1, 4, 1], dtype=np.int32),
+        }
+    )
+
+
+def _column_text(model, col):
+    return [model.index(row, col).data() for row in range(model.rowCount())]
+
+
+def test_model_formats_cells_like_the_original_widget(qapp, table):
+    model = CatalogTableModel(table)
+    assert (model.rowCount(), model.columnCount()) == (4, 5)
+    assert model.headerData(3, Qt.Orientation.Horizontal) == "Vmag"
+    assert _column_text(model, 1) == ["10.6847", "1.8", "23.4621", "5.07"]
+    assert _column_text(model, 3) == ["3.44", "12.5", "5.72", "--"]
+    assert _column_text(model, 4) == ["3", "1", "4", "1"]
+    assert not model.flags(model.index(0, 0)) & Qt.ItemFlag.ItemIsEditable
+
+    model.set_column_config("N", ColumnConfig("N", format_func=lambda v: f"<{v}>"))
+    assert model.index(0, 4).data() == "<3>"
+
+
+def test_model_sorts_and_filters_through_row_indices(qapp, table):
+    model = CatalogTableModel(table)
+    model.sort(1, Qt.SortOrder.AscendingOrder)
+    assert _column_text(model, 0) == ["NGC 1", "IC 10", "M31", "m33"]
+    model.sort(1, Qt.SortOrder.DescendingOrder)
+    assert _column_text(model, 0) == ["m33", "M31", "IC 10", "NGC 1"]
+
+    model.set_filter("Name", "m3")
+    assert _column_text(model, 0) == ["m33", "M31"]
+    assert [model.source_row(r) for r in range(model.rowCount())] == [2, 0]
+    assert model.headerData(0, Qt.Orientation.Vertical) == "3"
+
+    model.set_filter(None, "")
+    assert model.rowCount() == model.total_rows == 4
+
+
+def test_widget_reports_table_rows_after_sorting(qapp, table):
+    widget = CatalogTable(table=table)
+    selected, coords = [], []
+    widget.row_selected.connect(selected.append)
+    widget.coord_selected.connect(coords.append)
+
+    widget._table_view.sortByColumn(2, Qt.SortOrder.DescendingOrder)
+    widget._table_view.selectRow(0)
+    assert selected == [3]
+    assert widget.get_selected_data()["Name"] == "IC 10"
+    assert coords and abs(coords[0].dec.deg - 59.3) < 1e-9
+
+    widget._filter_column.setCurrentText("Name")
+    widget._filter_input.setText("ngc")
+    assert widget._row_count_label.text() == "4 rows"
+    assert widget._filter_timer.isActive()
+    widget._filter_timer.timeout.emit()
+    assert widget._row_count_label.text() == "1/4 rows"
+    widget._clear_filter()
+    assert widget._row_count_label.text() == "4 rows"
+
+    widget.clear()
+    assert widget._model.rowCount() == 0 and widget.get_table() is None
+
+
+def test_column_text_matches_per_cell_formatting(qapp):
+    table = Table(
+        {
+            "f8": [1.0 / 3, 1e12, np.nan, -2.5],
+            "f4": np.array([0.1, 2.5, 3.0, 7.25], dtype=np.float32),
+            "i8": MaskedColumn([1, -2, 3, 4], mask=[0, 1, 0, 0]),
+            "s": MaskedColumn(["a", "bb", "c", "d"], mask=[0, 0, 1, 0]),
+            "b": [True, False, True, False],
+            "o": np.array([None, 1, "x", 2.5], dtype=object),
+        }
+    )
+    model = CatalogTableModel(table)
+    for column in table.colnames:
+        expected = [model.format_value(column, value) for value in table[column]]
+        assert model.column_text(column).tolist() == expected, column
+    assert model.column_text("s")[2] == "--"
+
+    first = model.column_text("f8")
+    assert model.column_text("f8") is first
+    model.set_column_config("f8", ColumnConfig("f8", format_func=lambda v: "x"))
+    assert model.column_text("f8").tolist() == ["x"] * 4
+    assert model.column_text("i8") is model.column_text("i8")
+
+
+def test_filter_is_case_insensitive_substring_match(qapp, table):
+    model = CatalogTableModel(table)
+    model.set_filter("Name", "M3")
+    assert _column_text(model, 0) == ["M31", "m33"]
+    model.set_filter("Vmag", "--")
+    assert _column_text(model, 0) == ["IC 10"]
+    model.set_filter("Name", "zzz")
+    assert model.rowCount() == 0
+
+
+def test_row_coordinate_uses_columns_resolved_at_set_table(qapp, table):
+    widget = CatalogTable(table=table)
+    assert (widget._ra_col, widget._dec_col) == ("RAJ2000", "DEJ2000")
+    coord = widget._get_row_coordinate(2)
+    assert abs(coord.ra.deg - 23.4621) < 1e-9 and abs(coord.dec.deg - 30.6602) < 1e-9
+
+    assert widget._get_row_coordinate(99) is None
+
+    widget.set_table(Table({"RA": ["10.5", "bad"], "DEC": [41.27, 10.0]}))
+    assert widget._get_row_coordinate(0).ra.deg == pytest.approx(10.5)
+    assert widget._get_row_coordinate(1) is None
+
+    widget.set_table(Table({"Name": ["x"]}))
+    assert widget._get_row_coordinate(0) is None
+    widget.clear()
+    assert widget._get_row_coordinate(0) is None
+
+
+def test_delegate_fills_cells_from_one_model_call(qapp, table):
+    roles = []
+
+    class _CountingModel(CatalogTableModel):
+        def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+            roles.append(role)
+            return super().data(index, role)
+
+    model = _CountingModel(table)
+    delegate = CatalogItemDelegate()
+    for col in range(model.columnCount()):
+        option = QStyleOptionViewItem()
+        index = model.index(1, col)
+        delegate.initStyleOption(option, index)
+        assert option.text == model.data(index)
+        assert option.displayAlignment == model.data(index, Qt.ItemDataRole.TextAlignmentRole)
+
+    assert roles.count(Qt.ItemDataRole.DisplayRole) == model.columnCount()
+    assert len(roles) == 3 * model.columnCount()
+    alignment = Qt.ItemDataRole.TextAlignmentRole
+    assert model.data(model.index(0, 0), alignment) & Qt.AlignmentFlag.AlignLeft
+    assert model.data(model.index(0, 1), alignment) & Qt.AlignmentFlag.AlignRight
+
+
+def test_column_widths_follow_longest_formatted_value(qapp):
+    widget = CatalogTable(
+        table=Table({"id": [1, 2], "description": ["short", "a much longer description"]})
+    )
+    header = widget._table_view.horizontalHeader()
+    assert header.sectionResizeMode(0) == QHeaderView.ResizeMode.Interactive
+    assert widget._table_view.columnWidth(1) > widget._table_view.columnWidth(0) > 0
+
+
+def test_column_widths_do_not_format_whole_columns(qapp):
+    widget = CatalogTable(table=Table({"x": np.arange(1000) * 1.5, "name": ["n"] * 1000}))
+    assert widget._model._formatted == {}
+    assert widget._table_view.columnWidth(0) > 0
+
+
+def test_context_menu_is_built_once(qapp, table, monkeypatch):
+    widget = CatalogTable(table=table)
+    shown = []
+    monkeypatch.setattr(QMenu, "exec", lambda self, *args: shown.append(self))
+    widget._show_context_menu(QPoint(1, 1))
+    widget._show_context_menu(QPoint(2, 2))
+
+    assert shown == [widget._context_menu, widget._context_menu]
+    texts = [action.text() for action in widget._context_menu.actions()]
+    assert texts == ["Copy Cell", "Copy Row", "", "Go to Position"]
+
+
+def test_clear_resets_model_and_pending_filter(qapp, table):
+    widget = CatalogTable(table=table)
+    resets = []
+    widget._model.modelReset.connect(lambda: resets.append(True))
+    widget._filter_input.setText("ngc")
+    assert widget._filter_timer.isActive()
+
+    widget.clear()
+    assert resets == [True]
+    assert not widget._filter_timer.isActive() and widget._filter_input.text() == ""
+    assert widget._model.rowCount() == widget._model.columnCount() == 0
+
+
+def test_filter_columns_are_replaced_with_one_index_change(qapp, table):
+    widget = CatalogTable(table=table)
+    changes = []
+    texts = []
+    widget._filter_column.currentIndexChanged.connect(changes.append)
+    widget._filter_column.currentTextChanged.connect(texts.append)
+
+    widget.set_table(Table({"a": [1], "b": [2]}))
+    assert changes == [0]
+    assert texts == ["a"]
+    assert [widget._filter_column.itemText(i) for i in range(2)] == ["a", "b"]
+
+
+def test_copy_row_uses_formatted_column_text(qapp, table):
+    widget = CatalogTable(table=table)
+    widget._table_view.selectRow(3)
+    widget._copy_row()
+    assert QApplication.clipboard().text() == "IC 10\t5.07\t59.3\t--\t1"
+    assert widget.get_selected_data()["N"] == 1
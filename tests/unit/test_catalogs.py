@@ -0,0 +1,298 @@
+# NCRADS9 - NCRA DS9-like FITS Viewer
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Author: Yogesh Wadadekar
+
+"""Tests for the astroquery-backed catalog classes (no network access)."""
+
+import subprocess
+import sys
+import threading
+import time
+
+import astropy.units as u
+import numpy as np
+import pytest
+from astropy.coordinates import SkyCoord
+from astropy.table import MaskedColumn, Table
+from astropy.time import Time
+
+from ncrads9.catalogs import (
+    SDSSCatalog,
+    SimbadCatalog,
+    SkybotCatalog,
+    TwoMASSCatalog,
+    VizierCatalog,
+    _cache,
+)
+from ncrads9.catalogs.catalog_base import CatalogBase
+
+
+@pytest.fixture(autouse=True)
+def cache_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(_cache, "CACHE_ROOT", tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "factory, client",
+    [
+        (SDSSCatalog, "_sdss"),
+        (SimbadCatalog, "_simbad"),
+        (SkybotCatalog, "_skybot"),
+        (TwoMASSCatalog, "_vizier"),
+        (VizierCatalog, "_vizier"),
+    ],
+)
+def test_catalogs_share_one_pooled_session_with_their_client(factory, client):
+    catalog = factory()
+    session = catalog._session
+    assert getattr(catalog, client)._session is session
+
+    adapter = session.get_adapter("https://example.org/")
+    assert adapter.max_retries.total == 3
+    assert adapter._pool_maxsize == 16
+
+    closed = []
+    session.close = lambda: closed.append(True)
+    catalog.close()
+    assert closed == [True]
+
+
+def test_sdss_crossid_uploads_large_arrays_in_chunks(monkeypatch):
+    catalog = SDSSCatalog()
+    monkeypatch.setattr(SDSSCatalog, "CHUNK_SIZE", 4)
+    uploads = []
+
+    def _fake_crossid(coords, obj_names=None, **kwargs):
+        uploads.append(list(obj_names))
+        if obj_names[0] == "obj_4":
+            return None
+        return Table({"obj_id": obj_names, "ra": coords.ra.deg})
+
+    monkeypatch.setattr(catalog._sdss, "query_crossid", _fake_crossid)
+    coords = SkyCoord(np.arange(10.0), np.zeros(10), unit="deg")
+    result = catalog.query_crossid(coords, radius=2 * u.arcsec)
+
+    assert [len(names) for names in uploads] == [4, 4, 2]
+    assert uploads[2] == ["obj_8", "obj_9"]
+    assert list(result["obj_id"]) == ["obj_0", "obj_1", "obj_2", "obj_3", "obj_8", "obj_9"]
+    assert catalog.last_result is result
+
+    catalog.query_crossid(coords[:3])
+    assert len(uploads) == 4
+
+
+def test_query_region_batch_runs_positions_concurrently_within_the_limit(monkeypatch):
+    class _Catalog(CatalogBase):
+        MAX_CONCURRENT_QUERIES = 2
+
+        def __init__(self):
+            super().__init__("fake")
+            self.active = self.peak = 0
+            self.lock = threading.Lock()
+
+        def query_region(self, coord, radius, **kwargs):
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.02)
+            with self.lock:
+                self.active -= 1
+            if coord.ra.deg == 2.0:
+                return None
+            return Table({"ra": [coord.ra.deg]})
+
+        def query_object(self, name, **kwargs):
+            return None
+
+    catalog = _Catalog()
+    coords = SkyCoord(np.arange(6.0), np.zeros(6), unit="deg")
+    result = catalog.query_region_batch(coords, 1 * u.arcmin, max_workers=6)
+
+    assert list(result["ra"]) == [0.0, 1.0, 3.0, 4.0, 5.0]
+    assert catalog.peak == 2 and catalog.last_result is result
+    assert catalog.query_region_batch(coords[2], 1 * u.arcmin) is None
+
+
+def test_skybot_type_filter_is_a_boolean_array():
+    table = Table(
+        {"Type": MaskedColumn(["NEA", "Comet", "Asteroid", "Planet", "x"], mask=[0, 0, 0, 0, 1])}
+    )
+    catalog = SkybotCatalog()
+    assert catalog._filter_by_type(table).all()
+
+    catalog.set_object_type("Asteroid")
+    mask = catalog._filter_by_type(table)
+    assert mask.dtype == np.bool_ and mask.tolist() == [True, False, True, False, False]
+    assert list(table[mask]["Type"]) == ["NEA", "Asteroid"]
+
+    catalog.set_object_type("planet")
+    assert catalog._filter_by_type(table).tolist() == [False, False, False, True, False]
+    assert catalog._filter_by_type(Table({"Name": ["a", "b"]})).tolist() == [True, True]
+
+
+def test_twomass_colors_are_computed_column_wise():
+    table = Table(
+        {
+            "Jmag": MaskedColumn([10.0, 11.0, 12.0], mask=[0, 1, 0]),
+            "Hmag": [9.5, 10.5, 11.0],
+            "Kmag": MaskedColumn([9.0, 10.0, 10.5], mask=[0, 0, 1]),
+        }
+    )
+    catalog = TwoMASSCatalog()
+    assert catalog.get_jh_color(table).tolist() == [0.5, 1.0]
+    assert catalog.get_hk_color(table).tolist() == [0.5, 0.5]
+    assert catalog.get_jh_color(Table({"Jmag": [1.0]})) is None
+
+    colors = catalog.get_colors(table)
+    assert sorted(colors) == ["H-K", "J-H", "J-K"]
+    assert colors["J-K"].tolist() == [1.0]
+    assert list(catalog.get_colors(Table({"Hmag": [1.0], "Kmag": [0.5]}))) == ["H-K"]
+
+
+def test_region_results_are_cached_on_disk_by_query_inputs(cache_root, monkeypatch):
+    calls = []
+
+    def _fake_region(coord, radius=None, **kwargs):
+        calls.append(kwargs.get("data_release"))
+        return Table({"ra": [coord.ra.deg], "objid": [1]})
+
+    coord = SkyCoord(10, 20, unit="deg")
+    first = SDSSCatalog()
+    monkeypatch.setattr(first._sdss, "query_region", _fake_region)
+    first.query_region(coord, 2 * u.arcsec)
+
+    second = SDSSCatalog()
+    monkeypatch.setattr(second._sdss, "query_region", _fake_region)
+    table = second.query_region(SkyCoord(10 + 1e-9, 20, unit="deg"), 2 * u.arcsec)
+    assert calls == [18] and float(table["ra"][0]) == 10.0
+    assert second.last_result is table
+    assert len(list((cache_root / "sdss").glob("*.fits"))) == 1
+
+    second.set_data_release(17)
+    second.query_region(coord, 2 * u.arcsec)
+    assert calls == [18, 17]
+
+    monkeypatch.setenv("NCRADS9_CACHE_TTL", "0")
+    second.query_region(coord, 2 * u.arcsec)
+    assert calls == [18, 17, 17]
+
+    second.clear_cache()
+    assert len(list((cache_root / "sdss").glob("*.fits"))) == 2
+    second.clear_disk_cache()
+    assert list((cache_root / "sdss").glob("*.fits")) == []
+
+    skybot = SkybotCatalog()
+    monkeypatch.delenv("NCRADS9_CACHE_TTL")
+    monkeypatch.setattr(skybot._skybot, "cone_search", lambda *a, **k: Table({"Type": ["NEA"]}))
+    skybot.query_region(coord, 1 * u.deg)
+    assert not (cache_root / "skybot").exists()
+    skybot.query_region(coord, 1 * u.deg, epoch=Time("2026-01-01"))
+    assert len(list((cache_root / "skybot").glob("*.fits"))) == 1
+
+
+def test_vizier_setters_update_the_existing_client():
+    for catalog in (TwoMASSCatalog(), VizierCatalog()):
+        client = catalog._vizier
+        catalog.set_columns(["RAJ2000", "DEJ2000"])
+        catalog.set_row_limit(25)
+        assert catalog._vizier is client
+        assert client._session is catalog._session
+        assert client.columns == ["RAJ2000", "DEJ2000"]
+        assert client.ROW_LIMIT == 25
+
+    twomass = TwoMASSCatalog()
+    client = twomass._vizier
+    twomass.set_catalog_type("xsc")
+    assert twomass._vizier is client
+    assert client.catalog == TwoMASSCatalog.CATALOG_XSC
+    assert client.columns == TwoMASSCatalog.DEFAULT_XSC_COLUMNS
+
+
+def test_importing_catalogs_does_not_import_astroquery():
+    code = (
+        "import sys, ncrads9.catalogs; "
+        "print(any(m.startswith('astroquery') for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_sdss_grouped_crossid_searches_each_sky_cell_once(monkeypatch):
+    sources = SkyCoord([150.0, 150.01, 210.0], [2.01, 2.01, -1.0], unit="deg")
+    searches = []
+
+    def _fake_region(coord, radius=None, **kwargs):
+        searches.append((coord, radius))
+        near = sources.separation(coord) <= radius
+        return Table(
+            {
+                "ra": sources.ra.deg[near],
+                "dec": sources.dec.deg[near],
+                "objid": np.flatnonzero(near) + 100,
+            }
+        )
+
+    catalog = SDSSCatalog()
+    catalog.disk_cache = False
+    monkeypatch.setattr(catalog._sdss, "query_region", _fake_region)
+
+    offset = 0.5 / 3600
+    coords = SkyCoord(
+        [150.0 + offset, 150.01, 150.0, 210.0, 30.0],
+        [2.01, 2.01 + offset, 2.01 - offset, -1.0, 5.0],
+        unit="deg",
+    )
+    result = catalog.query_crossid(coords, grouped=True)
+
+    assert len(searches) == 3
+    assert all(radius <= 3 * u.arcmin for _, radius in searches)
+    assert list(result["obj_id"]) == ["obj_0", "obj_1", "obj_2", "obj_3"]
+    assert list(result["objid"]) == [100, 101, 100, 102]
+    assert catalog.last_result is result
+
+
+def test_sdss_grouped_crossid_keeps_cones_within_the_sdss_limit(monkeypatch):
+    rng = np.random.default_rng(4)
+    coords = SkyCoord(
+        180.0 + rng.uniform(0, 0.1, 40), 10.0 + rng.uniform(0, 0.1, 40), unit="deg"
+    )
+    searches = []
+
+    def _fake_region(coord, radius=None, **kwargs):
+        searches.append((coord, radius))
+        near = coords.separation(coord) <= radius
+        return Table(
+            {
+                "ra": coords.ra.deg[near],
+                "dec": coords.dec.deg[near],
+                "objid": np.flatnonzero(near),
+            }
+        )
+
+    catalog = SDSSCatalog()
+    catalog.disk_cache = False
+    monkeypatch.setattr(catalog._sdss, "query_region", _fake_region)
+
+    result = catalog.query_crossid(coords, radius=60 * u.arcsec, grouped=True)
+    assert searches
+    assert all(radius <= SDSSCatalog.MAX_REGION_RADIUS for _, radius in searches)
+    assert list(result["objid"]) == list(range(40))
+
+    assert catalog.query_crossid(coords, radius=3 * u.arcmin, grouped=True) is None
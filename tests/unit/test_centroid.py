@@ -0,0 +1,114 @@
+# NCRADS9 - NCRA DS9-like FITS Viewer
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Author: Yogesh Wadadekar
+
+"""Tests for analysis.centroid module."""
+
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from ncrads9.analysis.centroid import (
+    _maximum_filter,
+    calculate_centroid,
+    calculate_centroid_iterative,
+    calculate_gaussian_centroid,
+    peak_local_max,
+)
+
+
+def _gaussian_image(shape=(64, 80), x0=30.5, y0=20.25, sigma=3.0):
+    y, x = np.indices(shape)
+    return np.exp(-((x - x0) ** 2 + (y - y0) ** 2) / (2 * sigma**2))
+
+
+def _reference_centroid(data):
+    y, x = np.indices(data.shape)
+    total = data.sum()
+    return (x * data).sum() / total, (y * data).sum() / total
+
+
+def test_calculate_centroid_matches_moment_definition():
+    data = _gaussian_image()
+    x_ref, y_ref = _reference_centroid(data)
+    x_cen, y_cen = calculate_centroid(data)
+    assert x_cen == pytest.approx(x_ref)
+    assert y_cen == pytest.approx(y_ref)
+
+
+def test_calculate_centroid_does_not_modify_input():
+    data = _gaussian_image()
+    data[0, 0] = np.nan
+    original = data.copy()
+    calculate_centroid(data, threshold=0.1)
+    np.testing.assert_array_equal(data, original)
+
+
+def test_calculate_centroid_region_mask_and_threshold():
+    data = _gaussian_image()
+    mask = np.ones(data.shape, dtype=bool)
+    mask[:, 40:] = False
+    region = (slice(5, 40), slice(10, 60))
+
+    x_cen, y_cen = calculate_centroid(data, region=region, mask=mask, threshold=0.05)
+
+    sub = data[region].copy()
+    sub[~mask[region]] = 0.0
+    sub[sub < 0.05] = 0.0
+    x_ref, y_ref = _reference_centroid(sub)
+    assert x_cen == pytest.approx(x_ref + 10)
+    assert y_cen == pytest.approx(y_ref + 5)
+
+
+def test_calculate_centroid_empty_returns_center():
+    data = np.zeros((10, 20))
+    assert calculate_centroid(data) == (10.0, 5.0)
+
+
+def test_peak_local_max_returns_brightest_peaks_first():
+    data = np.zeros((50, 60))
+    data[10, 12] = 5.0
+    data[30, 40] = 9.0
+    data[40, 5] = 7.0
+    peaks = peak_local_max(data, threshold=1.0, min_distance=3, num_peaks=2)
+    np.testing.assert_array_equal(peaks, [[30, 40], [40, 5]])
+
+
+def test_gaussian_centroid_recovers_position_and_width():
+    data = _gaussian_image(x0=40.0, y0=25.0, sigma=1.5)
+    x_cen, y_cen, sigma_x, sigma_y = calculate_gaussian_centroid(
+        data, initial_guess=(40.0, 25.0), box_size=15
+    )
+    assert x_cen == pytest.approx(40.0, abs=1e-3)
+    assert y_cen == pytest.approx(25.0, abs=1e-3)
+    assert sigma_x == pytest.approx(sigma_y)
+    assert 1.0 < sigma_x < 2.0
+
+
+@pytest.mark.parametrize("size", [2, 5, 8])
+@pytest.mark.parametrize("n_strips", [1, 3, 16])
+def test_strip_maximum_filter_matches_ndimage(size, n_strips):
+    data = np.random.default_rng(4).random((61, 45))
+    expected = ndimage.maximum_filter(data, size=size)
+    np.testing.assert_array_equal(_maximum_filter(data, size, n_strips), expected)
+
+
+def test_iterative_centroid_converges_on_source():
+    data = _gaussian_image(x0=33.0, y0=18.0, sigma=2.0)
+    x_cen, y_cen = calculate_centroid_iterative(data, initial_guess=(30.0, 21.0))
+    assert x_cen == pytest.approx(33.0, abs=0.05)
+    assert y_cen == pytest.approx(18.0, abs=0.05)
@@ -0,0 +1,301 @@
+# NCRADS9 - NCRA DS9-like FITS Viewer
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Author: Yogesh Wadadekar
+
+"""Tests for catalogs.cone_search module (no network access)."""
+
+import threading
+from io import BytesIO
+
+import astropy.units as u
+import pytest
+import requests
+from astropy.coordinates import SkyCoord
+from astropy.io.votable import from_table, writeto
+from astropy.table import MaskedColumn, Table
+
+from ncrads9.catalogs import ned
+from ncrads9.catalogs.cone_search import ConeSearch
+
+
+def _votable_bytes(ra, dec):
+    buffer = BytesIO()
+    writeto(from_table(Table({"ra": [ra], "dec": [dec], "id": [1]})), buffer)
+    return buffer.getvalue()
+
+
+class _FakeResponse:
+    def __init__(self, content, chunked=False, content_type=None, status_code=200):
+        self.content = content
+        self.raw = BytesIO(content)
+        self.headers = {} if chunked else {"Content-Length": str(len(content))}
+        if content_type is not None:
+            self.headers["Content-Type"] = content_type
+        self.status_code = status_code
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeSession:
+    """Answers each cone search with a one-row table at the requested centre."""
+
+    def __init__(self):
+        self.calls = []
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        with self._lock:
+            self.calls.append(dict(params))
+            self.threads.add(threading.get_ident())
+        return _FakeResponse(_votable_bytes(params["RA"], params["DEC"]))
+
+
+@pytest.fixture
+def search(tmp_path):
+    cone = ConeSearch(service_name="vizier", cache_dir=tmp_path)
+    cone._session = _FakeSession()
+    return cone
+
+
+def test_query_region_parses_votable_and_sets_last_result(search):
+    table = search.query_region(SkyCoord(10, 20, unit="deg"), 1 * u.arcmin, catalog="I/239")
+    assert list(table["ra"]) == [10.0] and search.last_result is table
+    assert search._session.calls[0]["catalog"] == "I/239"
+    assert search._session.calls[0]["SR"] == pytest.approx(1 / 60)
+
+
+def test_search_multiple_keeps_input_order(search):
+    coords = [SkyCoord(ra, -ra / 10, unit="deg") for ra in range(0, 40, 5)]
+    results = search.search_multiple(coords, 2 * u.arcsec)
+
+    assert [float(t["ra"][0]) for t in results] == [float(c.ra.deg) for c in coords]
+    assert search.last_result is results[-1]
+    assert len(search._session.calls) == len(coords)
+    assert search.search_multiple([], 2 * u.arcsec) == []
+
+
+def test_session_mounts_pooled_retrying_adapter():
+    adapter = ConeSearch(cache_dir=None)._session.get_adapter("https://vizier.cds.unistra.fr/")
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_repeated_query_region_is_served_from_cache(search):
+    coord = SkyCoord(10, 20, unit="deg")
+    first = search.query_region(coord, 1 * u.arcmin)
+    first["ra"][0] = -1.0
+    second = search.query_region(SkyCoord(10 + 1e-9, 20, unit="deg"), 1 * u.arcmin)
+
+    assert len(search._session.calls) == 1
+    assert second is not first and float(second["ra"][0]) == 10.0
+
+    search.query_region(coord, 2 * u.arcmin)
+    assert len(search._session.calls) == 2
+    search.clear_cache()
+    search.query_region(coord, 1 * u.arcmin)
+    assert len(search._session.calls) == 2
+    search.clear_cache()
+    search.clear_disk_cache()
+    search.query_region(coord, 1 * u.arcmin)
+    assert len(search._session.calls) == 3
+
+
+def test_query_cache_evicts_least_recently_used(search, monkeypatch):
+    monkeypatch.setattr(ConeSearch, "QUERY_CACHE_SIZE", 2)
+    search._cache_dir = None
+    a, b, c = (SkyCoord(ra, 0, unit="deg") for ra in (1, 2, 3))
+    for coord in (a, b, a, c):
+        search.query_region(coord, 1 * u.arcsec)
+    assert len(search._session.calls) == 3
+
+    search.query_region(a, 1 * u.arcsec)
+    assert len(search._session.calls) == 3
+    search.query_region(b, 1 * u.arcsec)
+    assert len(search._session.calls) == 4
+
+
+def test_ned_query_object_caches_by_normalized_name(monkeypatch):
+    calls = []
+
+    def _fake_query_object(name, **kwargs):
+        calls.append(name)
+        return Table({"Object Name": [name]})
+
+    monkeypatch.setattr(ned._backend(), "query_object", _fake_query_object)
+    catalog = ned.NEDCatalog()
+    assert catalog.query_object("M 31")["Object Name"][0] == "M 31"
+    assert catalog.query_object("  m  31 ") is not None
+    assert calls == ["M 31"]
+    assert catalog.last_result is not None
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_fetch_streams_sized_bodies_and_buffers_chunked_ones(chunked):
+    response = _FakeResponse(_votable_bytes(1.5, 2.5), chunked=chunked)
+
+    class _Session:
+        def get(self, url, params=None, timeout=None, stream=False):
+            assert stream
+            return response
+
+    cone = ConeSearch(cache_dir=None)
+    cone._session = _Session()
+    table = cone._fetch({"RA": 1.5, "DEC": 2.5, "SR": 0.1})
+
+    assert float(table["dec"][0]) == 2.5 and response.closed
+    # The streamed path reads the raw body; the buffered one leaves it.
+    assert (response.raw.tell() == 0) == chunked
+    if not chunked:
+        assert response.raw.decode_content
+
+
+def test_parsed_tables_only_keep_masks_that_mask_something():
+    source = Table(
+        {
+            "ra": [1.0, 2.0],
+            "flux": MaskedColumn([3.0, 4.0], mask=[False, True]),
+            "name": ["a", "b"],
+        }
+    )
+    source["ra"].unit = "deg"
+    buffer = BytesIO()
+    writeto(from_table(source), buffer)
+
+    table = ConeSearch(cache_dir=None)._parse_votable(buffer.getvalue())
+    assert not isinstance(table["ra"], MaskedColumn) and table["ra"].unit == "deg"
+    assert not isinstance(table["name"], MaskedColumn)
+    assert isinstance(table["flux"], MaskedColumn) and list(table["flux"].mask) == [False, True]
+
+
+def test_results_persist_on_disk_across_instances(tmp_path, monkeypatch):
+    coord = SkyCoord(10, 20, unit="deg")
+    first = ConeSearch(cache_dir=tmp_path)
+    first._session = _FakeSession()
+    first.query_region(coord, 1 * u.arcmin)
+    assert len(list(tmp_path.glob("*.fits"))) == 1
+
+    second = ConeSearch(cache_dir=tmp_path)
+    second._session = _FakeSession()
+    table = second.query_region(coord, 1 * u.arcmin)
+    assert second._session.calls == [] and float(table["ra"][0]) == 10.0
+
+    monkeypatch.setenv("NCRADS9_CACHE_TTL", "0")
+    third = ConeSearch(cache_dir=tmp_path)
+    third._session = _FakeSession()
+    third.query_region(coord, 1 * u.arcmin)
+    assert len(third._session.calls) == 1
+
+    third.clear_cache()
+    assert len(list(tmp_path.glob("*.fits"))) == 1
+    third.clear_disk_cache()
+    assert list(tmp_path.glob("*.fits")) == []
+
+
+def test_validate_service_reuses_recent_answers(monkeypatch):
+    heads = []
+
+    class _Session:
+        def head(self, url, timeout=None):
+            heads.append(url)
+            return type("Response", (), {"status_code": 200})()
+
+    cone = ConeSearch(service_name="vizier", cache_dir=None)
+    cone._session = _Session()
+    assert cone.validate_service() and cone.validate_service()
+    assert len(heads) == 1
+
+    cone.set_service("mast")
+    cone.validate_service()
+    assert len(heads) == 2
+
+    monkeypatch.setattr(ConeSearch, "VALIDATE_CACHE_TTL", 0.0)
+    cone.validate_service()
+    assert len(heads) == 3
+
+
+def test_csv_replies_use_ascii_reader_and_400_drops_format():
+    class _Session:
+        def __init__(self, accepts_format):
+            self.accepts_format = accepts_format
+            self.calls = []
+
+        def get(self, url, params=None, timeout=None, stream=False):
+            self.calls.append(dict(params))
+            if "FORMAT" not in params:
+                return _FakeResponse(_votable_bytes(params["RA"], params["DEC"]))
+            if not self.accepts_format:
+                return _FakeResponse(b"bad FORMAT", status_code=400)
+            body = f"ra,dec,id\n{params['RA']},{params['DEC']},1\n".encode()
+            return _FakeResponse(body, content_type="text/csv; charset=utf-8")
+
+    coord = SkyCoord(10, 20, unit="deg")
+    for accepts_format in (True, False):
+        cone = ConeSearch(cache_dir=None, prefer_csv=True)
+        cone._session = _Session(accepts_format)
+        table = cone.query_region(coord, 1 * u.arcmin)
+        assert float(table["ra"][0]) == 10.0 and float(table["dec"][0]) == 20.0
+        assert cone._session.calls[0]["FORMAT"] == "csv"
+        assert len(cone._session.calls) == (1 if accepts_format else 2)
+
+
+@pytest.mark.parametrize(
+    "service, param", [("vizier", "-out"), ("heasarc", "fields"), ("mast", None)]
+)
+def test_columns_are_requested_through_the_service_parameter(service, param):
+    cone = ConeSearch(service_name=service, cache_dir=None)
+    cone._session = _FakeSession()
+    coord = SkyCoord(10, 20, unit="deg")
+    cone.query_region(coord, 1 * u.arcmin, columns=["RAJ2000", "DEJ2000", "Jmag"])
+    cone.query_region(coord, 1 * u.arcmin)
+
+    with_columns, without = cone._session.calls
+    if param is None:
+        assert with_columns == without
+    else:
+        assert with_columns[param] == "RAJ2000,DEJ2000,Jmag" and param not in without
+
+
+def test_ned_region_and_object_tables_are_cached(monkeypatch):
+    calls = []
+
+    def _fake_query_region(coord, radius=None, equinox=None, **kwargs):
+        calls.append("region")
+        return Table({"RA": MaskedColumn([coord.ra.deg], mask=[False])})
+
+    def _fake_get_table(name, table=None, **kwargs):
+        calls.append(table)
+        return Table({"Frequency": [1.0e9]})
+
+    monkeypatch.setattr(ned._backend(), "query_region", _fake_query_region)
+    monkeypatch.setattr(ned._backend(), "get_table", _fake_get_table)
+    catalog = ned.NEDCatalog()
+    coord = SkyCoord(10, 20, unit="deg")
+
+    first = catalog.query_region(coord, 1 * u.arcmin)
+    catalog.query_region(SkyCoord(10 + 1e-9, 20, unit="deg"), 1 * u.arcmin)
+    assert not isinstance(first["RA"], MaskedColumn)
+    catalog.get_photometry("M 31")
+    catalog.get_photometry("  m 31 ")
+    catalog.get_redshifts("M 31")
+    assert calls == ["region", "photometry", "redshifts"]
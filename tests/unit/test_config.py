@@ -0,0 +1,46 @@
+# NCRADS9 - NCRA DS9-like FITS Viewer
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Author: Yogesh Wadadekar
+
+"""Tests for utils.config module."""
+
+from ncrads9.utils.config import Config
+
+
+def _write_config(tmp_path):
+    path = tmp_path / "ncrads9.toml"
+    path.write_text(
+        '[display]\ncolormap = "heat"\n\n'
+        '[communication.xpa]\nenabled = false\nname = "ds9"\nport = 14285\n',
+        encoding="utf-8",
+    )
+    return Config(path)
+
+
+def test_get_section_resolves_nested_sections(tmp_path):
+    config = _write_config(tmp_path)
+    xpa = config.get_section("communication.xpa")
+    assert xpa == {"enabled": False, "name": "ds9", "port": 14285}
+    assert xpa.get("host", "localhost") == "localhost"
+    assert config.get_section("display") == {"colormap": "heat"}
+
+
+def test_get_section_missing_or_scalar_is_empty(tmp_path):
+    config = _write_config(tmp_path)
+    assert config.get_section("communication.samp") == {}
+    assert config.get_section("display.colormap") == {}
+    assert Config().get_section("communication.xpa") == {}
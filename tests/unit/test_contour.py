@@ -0,0 +1,86 @@
+# NCRADS9 - NCRA DS9-like FITS Viewer
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Author: Yogesh Wadadekar
+
+"""Tests for analysis.contour module."""
+
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from ncrads9.analysis.contour import ContourGenerator
+
+
+@pytest.fixture
+def noisy_image():
+    rng = np.random.default_rng(7)
+    data = rng.normal(loc=10.0, scale=2.0, size=(64, 64))
+    data[3, 4] = np.nan
+    return data
+
+
+def test_generate_sigma_levels_ignores_nan(noisy_image):
+    gen = ContourGenerator(noisy_image)
+    valid = noisy_image[~np.isnan(noisy_image)]
+    levels = gen.generate_sigma_levels([3, 5])
+    median = np.median(valid)
+    std = np.std(valid)
+    assert levels == pytest.approx([median + 3 * std, median + 5 * std])
+
+
+def test_sigma_level_statistics_follow_data_replacement(noisy_image):
+    gen = ContourGenerator(noisy_image)
+    first = gen.generate_sigma_levels([1])
+    gen.data = noisy_image * 2.0
+    second = gen.generate_sigma_levels([1])
+    assert second[0] == pytest.approx(2.0 * first[0])
+
+
+def test_caller_edits_to_input_do_not_reach_cached_statistics(noisy_image):
+    gen = ContourGenerator(noisy_image)
+    first = gen.generate_sigma_levels([1])
+    noisy_image *= 2.0
+    assert gen.generate_sigma_levels([1]) == pytest.approx(first)
+
+
+def test_contour_perimeter_matches_binary_dilation_edge(noisy_image):
+    gen = ContourGenerator(noisy_image)
+    for level in (8.0, 10.0, 13.0):
+        binary = gen.data >= level
+        expected = np.sum(ndimage.binary_dilation(binary) ^ binary)
+        assert gen.contour_perimeter(level) == float(expected)
+        assert gen.contour_area(level) == float(np.sum(binary))
+
+
+def test_find_contours_scipy_matches_per_level_dilation(noisy_image):
+    gen = ContourGenerator(noisy_image)
+    levels = [12.0, 8.0, 10.0, 10.0]
+    contours = gen.find_contours_scipy(levels)
+
+    assert len(contours) == len(levels)
+    for level, [(x_coords, y_coords)] in zip(levels, contours):
+        binary = noisy_image >= level
+        exp_y, exp_x = np.where(ndimage.binary_dilation(binary) ^ binary)
+        np.testing.assert_array_equal(x_coords, exp_x)
+        np.testing.assert_array_equal(y_coords, exp_y)
+
+
+def test_generate_levels_spans_finite_range(noisy_image):
+    gen = ContourGenerator(noisy_image)
+    levels = gen.generate_levels(5)
+    assert levels[0] == pytest.approx(np.nanmin(noisy_image))
+    assert levels[-1] == pytest.approx(np.nanmax(noisy_image))
@@ -0,0 +1,85 @@
+# NCRADS9 - NCRA DS9-like FITS Viewer
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Author: Yogesh Wadadekar
+
+"""Tests for analysis.histogram module."""
+
+import numpy as np
+import pytest
+
+from ncrads9.analysis.histogram import Histogram
+
+
+@pytest.fixture
+def image_with_nans():
+    rng = np.random.default_rng(3)
+    data = rng.normal(size=(128, 96)).astype(np.float32)
+    data[::7, ::5] = np.nan
+    return data
+
+
+def test_histogram_ignores_nan_like_compacted_input(image_with_nans):
+    valid = image_with_nans[~np.isnan(image_with_nans)]
+    counts, edges = np.histogram(valid, bins=64)
+    hist = Histogram(image_with_nans, bins=64)
+    np.testing.assert_array_equal(hist.counts, counts)
+    np.testing.assert_allclose(hist.bin_edges, edges)
+
+
+def test_histogram_applies_mask(image_with_nans):
+    mask = np.zeros(image_with_nans.shape, dtype=bool)
+    mask[10:50, 20:70] = True
+    selected = image_with_nans[mask]
+    counts, _ = np.histogram(selected[~np.isnan(selected)], bins=32, range=(-2, 2))
+    hist = Histogram(image_with_nans, bins=32, range=(-2, 2), mask=mask)
+    np.testing.assert_array_equal(hist.counts, counts)
+
+
+def test_histogram_all_nan_is_empty():
+    hist = Histogram(np.full((8, 8), np.nan), bins=10)
+    assert hist.counts.sum() == 0
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.int16, np.uint16, np.int32])
+@pytest.mark.parametrize("bins, hist_range", [(50, None), (17, (10.0, 90.5))])
+def test_integer_histogram_matches_numpy(dtype, bins, hist_range):
+    rng = np.random.default_rng(11)
+    data = rng.integers(0, 120, size=(64, 64)).astype(dtype)
+    counts, edges = np.histogram(data.ravel(), bins=bins, range=hist_range)
+    hist = Histogram(data, bins=bins, range=hist_range)
+    np.testing.assert_array_equal(hist.counts, counts)
+    np.testing.assert_array_equal(hist.bin_edges, edges)
+
+
+def test_rebin_matches_fresh_histogram(image_with_nans):
+    mask = image_with_nans > -1.0
+    hist = Histogram(image_with_nans, bins=64, mask=mask)
+    rebinned = hist.rebin(16, range=(-1.0, 2.0))
+    fresh = Histogram(image_with_nans, bins=16, range=(-1.0, 2.0), mask=mask)
+    np.testing.assert_array_equal(rebinned.counts, fresh.counts)
+    np.testing.assert_array_equal(rebinned.bin_edges, fresh.bin_edges)
+    assert len(hist.counts) == 64
+
+
+def test_get_percentile_uses_bin_centers():
+    data = np.arange(100, dtype=float)
+    hist = Histogram(data, bins=10)
+    assert hist.get_percentile(0) == pytest.approx(hist.bin_centers[0])
+    assert hist.get_percentile(50) == pytest.approx(hist.bin_centers[4])
+    assert hist.get_percentile(95) == pytest.approx(hist.bin_centers[9])
+    rebinned = hist.rebin(5)
+    assert rebinned.get_percentile(50) == pytest.approx(rebinned.bin_centers[2])
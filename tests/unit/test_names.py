@@ -0,0 +1,102 @@
+# NCRADS9 - NCRA DS9-like FITS Viewer
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Author: Yogesh Wadadekar
+
+"""Tests for catalogs._names module (no network access)."""
+
+import pytest
+from astropy.coordinates import SkyCoord
+from astropy.table import MaskedColumn, Table
+
+from ncrads9.catalogs import _cache, _names
+
+
+@pytest.fixture
+def lookups(tmp_path, monkeypatch):
+    calls = []
+
+    def _fake_from_name(name, *args, **kwargs):
+        calls.append(name)
+        if name == "nowhere":
+            raise ValueError("unknown object")
+        return SkyCoord(10.6847, 41.269, unit="deg")
+
+    monkeypatch.setattr(_cache, "CACHE_ROOT", tmp_path)
+    monkeypatch.setattr(_names, "_positions", None)
+    monkeypatch.setattr(SkyCoord, "from_name", staticmethod(_fake_from_name))
+    return calls
+
+
+def test_resolved_names_are_reused_across_sessions(lookups, monkeypatch, tmp_path):
+    coord = _names.resolve_name("M 31")
+    assert (tmp_path / "names.json").exists()
+    assert coord.ra.deg == pytest.approx(10.6847)
+    assert _names.resolve_name("  m  31").dec.deg == pytest.approx(41.269)
+    assert lookups == ["M 31"]
+
+    # A new session reads the positions back from disk.
+    monkeypatch.setattr(_names, "_positions", None)
+    assert _names.resolve_name("m 31").ra.deg == pytest.approx(10.6847)
+    assert lookups == ["M 31"]
+
+    _names.clear_name_cache()
+    _names.resolve_name("M 31")
+    assert lookups == ["M 31", "M 31"]
+
+
+def test_failed_lookups_are_not_cached(lookups):
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            _names.resolve_name("nowhere")
+    assert lookups == ["nowhere", "nowhere"]
+    assert not _names.cache_path().exists()
+
+
+def test_bulk_resolution_sends_one_simbad_query(lookups, monkeypatch):
+    batches = []
+
+    def _fake_simbad(names):
+        batches.append(list(names))
+        return {"M 101": [210.8, 54.35], "NGC 253": [11.89, -25.29]}
+
+    _names.resolve_name("M31")
+    monkeypatch.setattr(_names, "_query_simbad", _fake_simbad)
+    coords = _names.resolve_names(["NGC 253", "m31", "M 101", "M33", "ngc  253"])
+
+    assert batches == [["NGC 253", "M 101", "M33"]]
+    assert lookups == ["M31", "M33"]
+    assert len(coords) == 5
+    assert coords[0].ra.deg == pytest.approx(11.89)
+    assert coords[4].dec.deg == pytest.approx(-25.29)
+    assert coords[1].ra.deg == pytest.approx(10.6847)
+
+    # Everything is now cached, so no further requests are made.
+    _names.resolve_names(["M 101", "M33"])
+    assert len(batches) == 1 and lookups == ["M31", "M33"]
+
+
+def test_simbad_rows_for_unknown_names_are_skipped(monkeypatch):
+    class _FakeSimbad:
+        def query_objects(self, names):
+            table = Table()
+            table["user_specified_id"] = names
+            table["ra"] = MaskedColumn([1.0, 0.0], mask=[False, True])
+            table["dec"] = MaskedColumn([2.0, 0.0], mask=[False, True])
+            return table
+
+    monkeypatch.setattr(_names, "_simbad", lambda: _FakeSimbad())
+    assert _names._query_simbad(["Vega", "nowhere"]) == {"Vega": [1.0, 2.0]}
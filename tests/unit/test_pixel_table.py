@@ -0,0 +1,144 @@
+# ncrads9 - NCRA DS9 Analysis Package
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the pixel table."""
+
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from ncrads9.analysis.pixel_table import PixelTable
+
+
+@pytest.fixture
+def table():
+    data = np.arange(20 * 30, dtype=np.float32).reshape(20, 30)
+    return PixelTable(data)
+
+
+@pytest.mark.parametrize("center", [(10, 8), (1, 1), (29, 19)])
+def test_to_records_matches_region(table, center):
+    x_center, y_center = center
+    records = table.to_records(x_center, y_center, size=5)
+    region = table.get_region(x_center, y_center, size=5)
+
+    assert records.size == region.size
+    for rec in records:
+        assert rec["value"] == table.data[rec["y"], rec["x"]]
+    assert records["value"].reshape(region.shape).tolist() == region.tolist()
+
+
+def test_to_dict_returns_plain_python_values(table):
+    result = table.to_dict(10, 8, size=3)
+
+    assert result[0] == {"x": 9, "y": 7, "value": float(table.data[7, 9])}
+    assert len(result) == 9
+    assert all(type(item["x"]) is int and type(item["value"]) is float for item in result)
+
+
+@pytest.mark.parametrize("with_nan", [False, True])
+def test_find_extrema_matches_nanarg(with_nan):
+    data = np.random.default_rng(3).normal(size=(15, 15))
+    if with_nan:
+        data[7, 7] = np.nan
+        data[0, 0] = np.nan
+    table = PixelTable(data)
+
+    result = table.find_extrema(7, 7, size=11)
+    region = data[2:13, 2:13]
+    min_y, min_x = np.unravel_index(np.nanargmin(region), region.shape)
+    max_y, max_x = np.unravel_index(np.nanargmax(region), region.shape)
+
+    assert (result["min_x"], result["min_y"]) == (min_x + 2, min_y + 2)
+    assert (result["max_x"], result["max_y"]) == (max_x + 2, max_y + 2)
+    assert result["min_value"] == np.nanmin(region)
+    assert result["max_value"] == np.nanmax(region)
+
+
+def test_find_extrema_integer_data():
+    data = np.arange(25, dtype=np.int16).reshape(5, 5)
+    result = PixelTable(data).find_extrema(2, 2, size=3)
+    assert (result["min_value"], result["min_x"], result["min_y"]) == (6.0, 1, 1)
+    assert (result["max_value"], result["max_x"], result["max_y"]) == (18.0, 3, 3)
+
+
+def test_slicers_return_copies_unless_view_requested(table):
+    assert not np.shares_memory(table.get_region(5, 5), table.data)
+    assert not np.shares_memory(table.get_row(3), table.data)
+    assert not np.shares_memory(table.get_column(4), table.data)
+
+    assert np.shares_memory(table.get_region(5, 5, copy=False), table.data)
+    assert np.shares_memory(table.get_row(3, copy=False), table.data)
+    assert np.shares_memory(table.get_column(4, copy=False), table.data)
+    np.testing.assert_array_equal(table.get_column(4, 2, 6), table.data[2:6, 4])
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize(
+    "line", [(0, 0, 29, 19), (-3, 4, 35, 10), (5, 19, 5, 0), (2, 2, 2, 2)]
+)
+def test_sample_line_matches_map_coordinates(dtype, line):
+    data = np.random.default_rng(2).random((20, 30)).astype(dtype)
+    data[10, 12] = np.nan
+    x1, y1, x2, y2 = line
+
+    distances, values = PixelTable(data).sample_line(x1, y1, x2, y2, num_points=57)
+
+    x_coords = np.linspace(x1, x2, 57)
+    y_coords = np.linspace(y1, y2, 57)
+    expected = ndimage.map_coordinates(
+        data, [y_coords, x_coords], order=1, mode="constant", cval=np.nan
+    )
+    assert values.dtype == expected.dtype
+    np.testing.assert_allclose(values, expected, rtol=1e-6, equal_nan=True)
+    np.testing.assert_allclose(distances, np.hypot(x_coords - x1, y_coords - y1))
+
+
+def test_sample_line_higher_order_uses_splines(table):
+    _, values = table.sample_line(0, 0, 10, 0, num_points=11, order=3)
+    np.testing.assert_allclose(values, table.data[0, :11], rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("precision", [2, 4])
+def test_format_table_layout(precision):
+    data = np.random.default_rng(11).normal(size=(8, 8)).astype(np.float32)
+    data[1, 1] = np.nan
+    text = PixelTable(data).format_table(1, 1, size=5, precision=precision)
+    width = precision + 6
+
+    lines = text.split("\n")
+    assert lines[0] == "     " + " ".join(f"{x:>{width}}" for x in range(0, 4))
+    assert lines[1] == "-" * len(lines[0])
+    for y, line in enumerate(lines[2:]):
+        values = " ".join(f"{v:>{width}.{precision}g}" for v in data[y, :4])
+        assert line == f"{y:4d} {values}"
+    assert len(lines) == 6
+
+
+@pytest.mark.parametrize(
+    "line,num_points",
+    [((0, 3, 29, 3), 30), ((4, 19, 4, 0), 20), ((2, 2, 12, 12), 6), ((-4, 5, 40, 5), 12), ((3, 3, 9, 9), 1)],
+)
+def test_sample_line_on_pixel_grid_returns_pixel_values(line, num_points):
+    data = np.random.default_rng(12).random((20, 30))
+    x1, y1, x2, y2 = line
+    _, values = PixelTable(data).sample_line(x1, y1, x2, y2, num_points=num_points)
+
+    xs = np.linspace(x1, x2, num_points).astype(int)
+    ys = np.linspace(y1, y2, num_points).astype(int)
+    inside = (xs >= 0) & (xs < 30) & (ys >= 0) & (ys < 20)
+    np.testing.assert_array_equal(values[inside], data[ys[inside], xs[inside]])
+    assert np.isnan(values[~inside]).all()
@@ -0,0 +1,145 @@
+# NCRADS9 - NCRA DS9-like FITS Viewer
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Author: Yogesh Wadadekar
+
+"""Tests for analysis.radial_profile module."""
+
+import numpy as np
+import pytest
+
+from ncrads9.analysis import radial_profile
+from ncrads9.analysis.radial_profile import RadialProfile, _pixel_grid
+
+CENTER = (30.3, 20.8)
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(0)
+    data = rng.normal(100.0, 3.0, size=(57, 64))
+    data[::9, ::4] = np.nan
+    return data
+
+
+def _per_bin_reference(data, mask, bin_width, method):
+    """Straightforward per-bin loop used as the expected result."""
+    y, x = np.indices(data.shape)
+    dist = np.hypot(x - CENTER[0], y - CENTER[1]).ravel()
+    values = data.ravel()
+    keep = ~np.isnan(values)
+    if mask is not None:
+        keep &= mask.ravel()
+    dist, values = dist[keep], values[keep]
+
+    n_bins = int(np.ceil(min(data.shape) / 2 / bin_width))
+    reduce = {"mean": np.mean, "median": np.median, "sum": np.sum}[method]
+    profile, std, npix = np.zeros(n_bins), np.zeros(n_bins), np.zeros(n_bins, int)
+    for i in range(n_bins):
+        in_bin = (dist >= i * bin_width) & (dist < (i + 1) * bin_width)
+        if in_bin.any():
+            profile[i] = reduce(values[in_bin])
+            std[i] = np.std(values[in_bin])
+            npix[i] = in_bin.sum()
+    return profile, std, npix
+
+
+@pytest.mark.parametrize("method", ["mean", "median", "sum"])
+@pytest.mark.parametrize("bin_width", [1.0, 2.5])
+@pytest.mark.parametrize("use_mask", [False, True])
+def test_extract_matches_per_bin_reduction(image, method, bin_width, use_mask):
+    mask = np.random.default_rng(1).random(image.shape) > 0.2 if use_mask else None
+    rp = RadialProfile(image, center=CENTER, mask=mask)
+    _, profile = rp.extract(bin_width=bin_width, method=method)
+
+    expected, std, npix = _per_bin_reference(image, mask, bin_width, method)
+    np.testing.assert_allclose(profile, expected)
+    np.testing.assert_allclose(rp.profile_std, std, atol=1e-12)
+    np.testing.assert_array_equal(rp.npixels, npix)
+
+
+def test_extract_rejects_unknown_method(image):
+    with pytest.raises(ValueError):
+        RadialProfile(image).extract(method="mode")
+
+
+@pytest.mark.parametrize("n_sectors", [4, 8, 12])
+def test_extract_azimuthal_matches_per_sector_mean(image, n_sectors):
+    mask = np.random.default_rng(2).random(image.shape) > 0.1
+    rp = RadialProfile(image, center=CENTER, mask=mask)
+    centers, profile = rp.extract_azimuthal(10.0, width=3.0, n_sectors=n_sectors)
+
+    y, x = np.indices(image.shape)
+    dist = np.hypot(x - CENTER[0], y - CENTER[1])
+    angles = np.degrees(np.arctan2(y - CENTER[1], x - CENTER[0]))
+    edges = np.linspace(-180, 180, n_sectors + 1)
+    keep = (dist >= 8.5) & (dist < 11.5) & mask & ~np.isnan(image)
+    expected = [
+        np.mean(image[keep & (angles >= lo) & (angles < hi)])
+        for lo, hi in zip(edges[:-1], edges[1:])
+    ]
+    np.testing.assert_allclose(centers, (edges[:-1] + edges[1:]) / 2)
+    np.testing.assert_allclose(profile, expected)
+
+
+def test_distance_map_property_matches_euclidean_distance():
+    data = np.zeros((12, 9))
+    profile = RadialProfile(data, center=(3.5, 4.25))
+    y, x = np.mgrid[:12, :9]
+    np.testing.assert_allclose(profile.distance_map, np.hypot(x - 3.5, y - 4.25))
+
+    profile.center = (0.0, 0.0)
+    np.testing.assert_allclose(profile.distance_map, np.hypot(x, y))
+
+
+def test_extract_beyond_image_leaves_outer_bins_empty(image):
+    rp = RadialProfile(image, center=CENTER)
+    _, profile = rp.extract(max_radius=100.0, bin_width=4.0)
+
+    assert rp.npixels.sum() == np.count_nonzero(~np.isnan(image))
+    outer = rp.radii > np.hypot(64, 57)
+    assert outer.any()
+    assert not rp.npixels[outer].any() and not profile[outer].any()
+
+
+def test_bin_labels_are_cached_until_center_changes(image):
+    rp = RadialProfile(image, center=CENTER)
+    rp.extract(bin_width=2.0)
+    labels = rp._bin_labels(len(rp.radii), 2.0)
+    rp.extract(bin_width=2.0, method="median")
+    assert rp._bin_labels(len(rp.radii), 2.0) is labels
+
+    rp.center = (10.0, 40.0)
+    assert rp._bin_labels(len(rp.radii), 2.0) is not labels
+
+    fresh = RadialProfile(image, center=(10.0, 40.0))
+    np.testing.assert_array_equal(rp.extract(bin_width=2.0)[1], fresh.extract(bin_width=2.0)[1])
+
+
+def test_parallel_median_matches_serial(image, monkeypatch):
+    serial = RadialProfile(image, center=CENTER).extract(method="median")[1]
+    monkeypatch.setattr(radial_profile, "_PARALLEL_MEDIAN_PIXELS", 0)
+    monkeypatch.setattr(radial_profile.os, "cpu_count", lambda: 3)
+    parallel = RadialProfile(image, center=CENTER).extract(method="median")[1]
+
+    np.testing.assert_array_equal(parallel, serial)
+
+
+def test_pixel_grid_is_shared_and_read_only():
+    y, x = _pixel_grid(5, 7)
+    assert _pixel_grid(5, 7)[0] is y
+    assert y.shape == (5, 1) and x.shape == (1, 7)
+    assert not y.flags.writeable and not x.flags.writeable
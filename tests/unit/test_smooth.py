@@ -0,0 +1,142 @@
+# NCRADS9 - NCRA DS9-like FITS Viewer
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Author: Yogesh Wadadekar
+
+"""Tests for analysis.smooth module."""
+
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from ncrads9.analysis import smooth
+from ncrads9.analysis.smooth import (
+    _create_tophat_kernel,
+    _gaussian_kernel_1d,
+    adaptive_smooth,
+    boxcar_smooth,
+    gaussian_smooth,
+    smooth_with_nan,
+    tophat_smooth,
+)
+
+
+@pytest.mark.parametrize("mode", ["constant", "reflect", "nearest", "wrap"])
+@pytest.mark.parametrize("sigma", [12.0, (10.0, 14.0)])
+def test_large_sigma_gaussian_matches_ndimage(mode, sigma):
+    rng = np.random.default_rng(5)
+    data = rng.random((90, 70))
+    expected = ndimage.gaussian_filter(data, sigma=sigma, mode=mode, cval=0.5)
+    result = gaussian_smooth(data, sigma, mode=mode, cval=0.5)
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+def test_large_sigma_gaussian_keeps_nan_local():
+    data = np.ones((80, 80))
+    data[5, 5] = np.nan
+    result = gaussian_smooth(data, 10.0)
+    assert np.isnan(result[5, 5])
+    assert np.isfinite(result[70, 70])
+
+
+@pytest.mark.parametrize("mode", ["constant", "reflect", "nearest"])
+@pytest.mark.parametrize("radius", [3.0, 7.5, 10.0])
+def test_tophat_smooth_matches_direct_convolution(mode, radius):
+    data = np.random.default_rng(6).random((80, 64))
+    kernel = _create_tophat_kernel(radius)
+    expected = ndimage.convolve(data, kernel, mode=mode, cval=0.25)
+    result = tophat_smooth(data, radius, mode=mode, cval=0.25)
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int16])
+@pytest.mark.parametrize("sigma", [0.0, 1.5, (2.0, 0.7), (0.0, 3.0)])
+def test_gaussian_smooth_matches_ndimage(dtype, sigma):
+    data = (np.random.default_rng(8).random((40, 50)) * 100).astype(dtype)
+    expected = ndimage.gaussian_filter(data, sigma=sigma, mode="nearest")
+    result = gaussian_smooth(data, sigma, mode="nearest")
+
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(result, expected)
+    assert not np.shares_memory(result, data)
+
+
+def test_cached_kernels_are_read_only():
+    tophat = _create_tophat_kernel(4.0)
+    assert tophat is _create_tophat_kernel(4.0)
+    assert not tophat.flags.writeable
+    assert not _gaussian_kernel_1d(2.0, 4.0).flags.writeable
+
+
+@pytest.mark.parametrize("name", ["gaussian_smooth", "boxcar_smooth", "tophat_smooth"])
+def test_smoothing_dtype_casts_before_filtering(name):
+    data = np.random.default_rng(9).random((30, 30))
+    func = getattr(smooth, name)
+    result = func(data, 3, dtype=np.float32)
+
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, func(data, 3), rtol=1e-5, atol=1e-6)
+
+
+def _reference_smooth_with_nan(data, smooth):
+    nan_mask = np.isnan(data)
+    weights = np.where(nan_mask, 0, 1).astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = smooth(np.where(nan_mask, 0, data)) / smooth(weights)
+    result[nan_mask] = np.nan
+    return result
+
+
+@pytest.mark.parametrize("with_nan", [False, True])
+@pytest.mark.parametrize(
+    "method,sigma",
+    [("gaussian", 2.0), ("gaussian", 10.0), ("gaussian", (2, 3)), ("gaussian", (0, 12)),
+     ("boxcar", 5)],
+)
+def test_smooth_with_nan_matches_weighted_reference(method, sigma, with_nan):
+    data = np.random.default_rng(10).random((60, 45))
+    if with_nan:
+        data[10:14, 20:30] = np.nan
+    if method == "gaussian":
+        reference = _reference_smooth_with_nan(data, lambda a: gaussian_smooth(a, sigma))
+    else:
+        reference = _reference_smooth_with_nan(data, lambda a: boxcar_smooth(a, sigma))
+
+    result = smooth_with_nan(data, sigma, method=method)
+    np.testing.assert_allclose(result, reference, rtol=1e-10, equal_nan=True)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("threshold", [None, 0.5, 10.0])
+def test_adaptive_smooth_matches_weighted_blend(dtype, threshold):
+    data = np.random.default_rng(13).random((40, 40)).astype(dtype)
+    data[5, 5] = np.nan
+    level = float(np.nanmedian(data)) if threshold is None else threshold
+    strength = np.abs(data - level)
+    weight = np.clip(strength / np.nanmax(strength), 0, 1)
+    expected = weight * gaussian_smooth(data, 1.0) + (1 - weight) * gaussian_smooth(data, 5.0)
+
+    result = adaptive_smooth(data, threshold=threshold)
+    assert result.dtype == expected.dtype
+    np.testing.assert_allclose(result, expected, rtol=1e-6, equal_nan=True)
+
+
+@pytest.mark.parametrize("sigma", [(0.0, 10.0), (10.0, 0.0)])
+def test_large_sigma_gaussian_leaves_zero_sigma_axis_unsmoothed(sigma):
+    rng = np.random.default_rng(2)
+    data = rng.random((60, 50))
+    expected = ndimage.gaussian_filter(data, sigma=sigma, mode="constant")
+    np.testing.assert_allclose(gaussian_smooth(data, sigma), expected, atol=1e-12)
@@ -0,0 +1,100 @@
+# ncrads9 - NCRA DS9 Analysis Package
+# Copyright (C) 2026 Yogesh Wadadekar
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for image statistics."""
+
+import numpy as np
+import pytest
+
+from ncrads9.analysis import statistics
+from ncrads9.analysis.statistics import image_max, image_min, image_stats
+
+
+@pytest.fixture
+def image():
+    data = np.random.default_rng(4).normal(100.0, 5.0, size=(40, 60))
+    data[3, 7] = np.nan
+    data[20, 30] = np.nan
+    return data
+
+
+def test_image_stats_float32_matches_float64(image):
+    region = (slice(2, 30), slice(5, 50))
+    mask = np.random.default_rng(5).random(image.shape) > 0.3
+
+    full = image_stats(image, region=region, mask=mask)
+    fast = image_stats(image, region=region, mask=mask, dtype=np.float32)
+
+    assert fast["npixels"] == full["npixels"]
+    for key in ("mean", "median", "std", "min", "max"):
+        assert fast[key] == pytest.approx(full[key], rel=1e-5)
+    assert image.dtype == np.float64
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 400])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int32])
+def test_image_stats_matches_numpy(size, dtype):
+    data = (np.random.default_rng(size).normal(50, 10, size=(1, size))).astype(dtype)
+    stats = image_stats(data)
+
+    assert stats["npixels"] == size
+    assert stats["mean"] == pytest.approx(np.mean(data), rel=1e-6)
+    assert stats["median"] == pytest.approx(np.median(data), rel=1e-6)
+    assert stats["std"] == pytest.approx(np.std(data, dtype=np.float64), rel=1e-5, abs=1e-9)
+    assert stats["min"] == np.min(data)
+    assert stats["max"] == np.max(data)
+
+
+def test_image_stats_does_not_reorder_input(image):
+    before = image.copy()
+    image_stats(image, ignore_nan=True)
+    image_stats(image, ignore_nan=False)
+    np.testing.assert_array_equal(image, before)
+
+
+def test_image_stats_nan_propagates_when_not_ignored(image):
+    stats = image_stats(image, ignore_nan=False)
+    assert stats["npixels"] == image.size
+    assert all(np.isnan(stats[key]) for key in ("mean", "median", "std", "min", "max"))
+
+
+def test_image_stats_rejects_empty_selection(image):
+    with pytest.raises(ValueError):
+        image_stats(image, mask=np.zeros(image.shape, dtype=bool))
+
+
+@pytest.mark.parametrize("use_region", [False, True])
+@pytest.mark.parametrize("use_mask", [False, True])
+def test_single_statistics_match_nan_functions(image, use_region, use_mask):
+    region = (slice(1, 35), slice(4, 58)) if use_region else None
+    mask = np.random.default_rng(6).random(image.shape) > 0.4 if use_mask else None
+    pixels = image[region] if use_region else image
+    if use_mask:
+        pixels = pixels[mask[region] if use_region else mask]
+
+    for name, reference in [
+        ("image_mean", np.nanmean), ("image_median", np.nanmedian),
+        ("image_std", np.nanstd), ("image_min", np.nanmin), ("image_max", np.nanmax),
+    ]:
+        func = getattr(statistics, name)
+        assert func(image, region=region, mask=mask) == pytest.approx(reference(pixels))
+        unfiltered = func(image, region=region, mask=mask, ignore_nan=False)
+        assert np.isnan(unfiltered) == np.isnan(pixels).any()
+
+
+def test_extrema_of_all_nan_selection_are_nan():
+    data = np.full((4, 4), np.nan)
+    assert np.isnan(image_min(data)) and np.isnan(image_max(data))